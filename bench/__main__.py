@@ -0,0 +1,96 @@
+'''Runs benchmarks of geometry functions.
+
+    python3 -m bench --output bench/results.json
+    python3 -m bench --baseline bench/baseline.json --threshold 0.25
+
+Records time (ns) and allocated memory (bytes) per item for each function and batch size.
+With baseline exits with non-zero code if any case got slower than threshold allows.
+'''
+import typing
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+from .cases import Case, all_cases
+
+DEFAULT_SIZES = '1,1000,100000'
+
+def measure(case: Case, size: int) -> typing.Dict[str, float]:
+    args = case.make_args(size)
+    timer = timeit.Timer('func(*args)', globals={'func': case.func, 'args': args})
+    (number, total) = timer.autorange()
+    best = min([total] + timer.repeat(repeat=2, number=number)) / number
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    case.func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'ns_per_op': best * 1e9 / size,
+        'alloc_bytes_per_op': (peak - before) / size,
+    }
+
+def run(sizes: typing.List[int], name_filter: str) -> typing.Dict[str, typing.Dict[str, float]]:
+    results = {}
+    for case in all_cases():
+        if name_filter not in case.name:
+            continue
+        for size in (sizes if case.batch else [1]):
+            key = f'{case.name}[{size}]'
+            results[key] = measure(case, size)
+            print(
+                f'{key:<60} {results[key]["ns_per_op"]:>12.2f} ns/op'
+                f' {results[key]["alloc_bytes_per_op"]:>10.1f} B/op',
+                flush=True,
+            )
+    return results
+
+def compare(
+    results: typing.Dict[str, typing.Dict[str, float]],
+    baseline: typing.Dict[str, typing.Dict[str, float]],
+    threshold: float,
+) -> typing.List[str]:
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        ratio = result['ns_per_op'] / baseline[key]['ns_per_op']
+        if ratio > 1 + threshold:
+            regressions.append(f'{key}: {ratio:.2f}x slower than baseline')
+    return regressions
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python3 -m bench')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help='comma separated batch sizes')
+    parser.add_argument('--filter', default='', help='run only cases containing substring')
+    parser.add_argument('--output', help='file to save results to')
+    parser.add_argument('--baseline', help='file with results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed slowdown ratio')
+    options = parser.parse_args()
+
+    results = run([int(size) for size in options.sizes.split(',')], options.filter)
+    if options.output:
+        with open(options.output, 'w', encoding='utf8') as file:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'results': results,
+            }, file, indent=2)
+    if options.baseline:
+        if not os.path.exists(options.baseline):
+            print(f'no baseline at {options.baseline}, run "make bench-baseline" first')
+            return 2
+        with open(options.baseline, encoding='utf8') as file:
+            baseline = json.load(file)['results']
+        regressions = compare(results, baseline, options.threshold)
+        for line in regressions:
+            print(line)
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
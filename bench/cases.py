@@ -0,0 +1,156 @@
+import typing
+import random
+import numpy as np
+from geometry import (
+    vec3, line3, plane3, segment3, ray3, triangle3, aabb3, relations3,
+    vec3array, aabb3array, relations3array,
+)
+from geometry.vec3 import Vec3
+from geometry.line3 import Line3
+from geometry.plane3 import Plane3
+from geometry.segment3 import Segment3
+from geometry.ray3 import Ray3
+from geometry.triangle3 import Triangle3
+from geometry.aabb3 import AABB3, points_aabb3
+from geometry.vec3array import Vec3Array
+from geometry.line3array import Line3Array
+from geometry.plane3array import Plane3Array
+from geometry.triangle3array import Triangle3Array
+from geometry.aabb3array import AABB3Array
+
+class Case(typing.NamedTuple):
+    name: str
+    func: typing.Callable[..., typing.Any]
+    # Builds arguments for given batch size, scalar cases are built for size 1 only.
+    make_args: typing.Callable[[int], typing.Tuple[typing.Any, ...]]
+    batch: bool
+
+# Modules whose public functions must be covered.
+MODULES = (vec3, line3, plane3, segment3, ray3, triangle3, aabb3, relations3)
+
+def _vec(rng: random.Random) -> Vec3:
+    return Vec3(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(-10, 10))
+
+def _line(rng: random.Random) -> Line3:
+    return Line3(anchor=_vec(rng), direction=_vec(rng))
+
+def _plane(rng: random.Random) -> Plane3:
+    return Plane3(normal=_vec(rng), distance=rng.uniform(-10, 10))
+
+def _segment(rng: random.Random) -> Segment3:
+    return Segment3(start=_vec(rng), end=_vec(rng))
+
+def _ray(rng: random.Random) -> Ray3:
+    return Ray3(origin=_vec(rng), direction=_vec(rng))
+
+def _triangle(rng: random.Random) -> Triangle3:
+    return Triangle3(a=_vec(rng), b=_vec(rng), c=_vec(rng))
+
+def _points(rng: random.Random) -> typing.List[Vec3]:
+    return [_vec(rng) for _ in range(8)]
+
+def _box(rng: random.Random) -> AABB3:
+    return points_aabb3(_points(rng))
+
+def _frustum(rng: random.Random) -> typing.List[Plane3]:
+    return [_plane(rng) for _ in range(6)]
+
+def _vec_array(size: int) -> Vec3Array:
+    return Vec3Array(np.random.default_rng(size).uniform(-10, 10, (size, 3)))
+
+def _line_array(size: int) -> Line3Array:
+    return Line3Array(np.random.default_rng(size).uniform(-10, 10, (size, 6)))
+
+def _plane_array(size: int) -> Plane3Array:
+    return Plane3Array(np.random.default_rng(size).uniform(-10, 10, (size, 4)))
+
+def _triangle_array(size: int) -> Triangle3Array:
+    return Triangle3Array(np.random.default_rng(size).uniform(-10, 10, (size, 9)))
+
+def _box_array(size: int) -> AABB3Array:
+    corners = np.random.default_rng(size).uniform(-10, 10, (size, 2, 3))
+    return AABB3Array(np.concatenate((corners.min(axis=1), corners.max(axis=1)), axis=1))
+
+def _frustum_array(_: int) -> Plane3Array:
+    return _plane_array(6)
+
+_SCALAR_KINDS = {
+    'v': _vec, 'l': _line, 'p': _plane, 's': _segment, 'r': _ray, 'g': _triangle,
+    'V': _points, 'b': _box, 'P': _frustum,
+}
+# Batches of rays are kept in `Line3Array`, frustum has the same six planes for any size.
+_BATCH_KINDS = {
+    'v': _vec_array, 'l': _line_array, 'p': _plane_array, 'r': _line_array, 'g': _triangle_array,
+    'V': _vec_array, 'b': _box_array, 'P': _frustum_array,
+}
+
+# Argument signature of each function: v - vector, l - line, p - plane, s - segment, r - ray,
+# g - triangle, V - point set, b - box, P - frustum, f - float, t - tolerance.
+SIGNATURES = {
+    'eq3': 'vv', 'key3': 'vt', 'dot3': 'vv', 'len3': 'v', 'is_zero3': 'v', 'is_unit3': 'v',
+    'mul3': 'vf', 'neg3': 'v', 'pos3': 'v', 'norm3': 'v', 'add3': 'vv', 'sub3': 'vv',
+    'cross3': 'vv', 'angle3': 'vv', 'orthogonal3': 'vv', 'collinear3': 'vv', 'rotate3': 'vvf',
+    'project3': 'vv',
+    'eq_line3': 'll', 'key_line3': 'lt',
+    'eq_plane3': 'pp', 'key_plane3': 'pt', 'prepare_plane3': 'p',
+    'eq_segment3': 'ss', 'segment_line3': 's',
+    'eq_ray3': 'rr', 'ray_line3': 'r',
+    'eq_triangle3': 'gg', 'triangle_normal3': 'g', 'triangle_plane3': 'g',
+    'eq_aabb3': 'bb', 'points_aabb3': 'V', 'is_empty_aabb3': 'b', 'center_aabb3': 'b',
+    'size_aabb3': 'b', 'union_aabb3': 'bb', 'expand_aabb3': 'bf', 'intersection_aabb3': 'bb',
+    'aabb_plane_classification': 'bp', 'aabb_frustum_classification': 'bP',
+    'point_line_projection': 'vl', 'point_line_distance': 'vl',
+    'point_plane_projection': 'vp', 'point_plane_distance': 'vp',
+    'point_plane_signed_distance': 'vp',
+    'line_plane_intersection': 'lp', 'line_plane_projection': 'lp',
+    'line_line_distance': 'll', 'line_line_intersection': 'll',
+    'plane_plane_intersection': 'pp',
+    'point_segment_projection': 'vs', 'point_segment_distance': 'vs',
+    'ray_plane_intersection': 'rp', 'segment_plane_intersection': 'sp',
+    'ray_triangle_intersection': 'rg', 'segment_triangle_intersection': 'sg',
+}
+
+# Batched counterparts of scalar modules.
+BATCH_MODULES = {vec3: vec3array, aabb3: aabb3array, relations3: relations3array}
+
+def public_functions(module: typing.Any) -> typing.List[str]:
+    return sorted(
+        name for (name, value) in vars(module).items()
+        if callable(value) and not name.startswith('_') and not isinstance(value, type)
+        and getattr(value, '__module__', None) == module.__name__
+    )
+
+def _scalar_args(signature: str) -> typing.Callable[[int], typing.Tuple[typing.Any, ...]]:
+    def make_args(_: int) -> typing.Tuple[typing.Any, ...]:
+        rng = random.Random(1)
+        return tuple(
+            0.5 if kind == 'f' else 0.01 if kind == 't' else _SCALAR_KINDS[kind](rng)
+            for kind in signature
+        )
+    return make_args
+
+def _batch_args(signature: str) -> typing.Callable[[int], typing.Tuple[typing.Any, ...]]:
+    def make_args(size: int) -> typing.Tuple[typing.Any, ...]:
+        return tuple(
+            0.5 if kind == 'f' else 0.01 if kind == 't' else _BATCH_KINDS[kind](size)
+            for kind in signature
+        )
+    return make_args
+
+def all_cases() -> typing.List[Case]:
+    cases = []
+    for module in MODULES:
+        batch_module = BATCH_MODULES.get(module)
+        for name in public_functions(module):
+            signature = SIGNATURES[name]
+            cases.append(Case(
+                f'{module.__name__}.{name}', getattr(module, name), _scalar_args(signature), False,
+            ))
+            if batch_module is not None and hasattr(batch_module, f'{name}_array'):
+                cases.append(Case(
+                    f'{batch_module.__name__}.{name}_array',
+                    getattr(batch_module, f'{name}_array'),
+                    _batch_args(signature),
+                    True,
+                ))
+    return cases
@@ -0,0 +1,107 @@
+'''Measures import time of geometry modules, each import in a fresh interpreter.
+
+    python3 -m bench.imports --output bench/imports.json
+    python3 -m bench.imports --baseline bench/imports_baseline.json --threshold 0.5
+
+Records the best time (ms) of several runs and heavy dependencies each import loaded.
+Exits with non-zero code if scalar imports load NumPy or numba, or with baseline
+if any import got slower than threshold allows.
+'''
+import typing
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+
+# Statements to measure and whether they may load heavy dependencies.
+IMPORTS = {
+    'import geometry': False,
+    'import geometry.relations3': False,
+    'from geometry import Vec3, Line3, Plane3, point_line_distance, line_plane_intersection': False,
+    'from geometry import Vec3Array, line_line_distance_array': True,
+}
+
+HEAVY = ('numpy', 'numba')
+
+_SCRIPT = '''
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, *(name for name in {heavy!r} if name in sys.modules))
+'''
+
+def measure(statement: str, repeat: int = 5) -> typing.Dict[str, typing.Any]:
+    script = _SCRIPT.format(statement=statement, heavy=HEAVY)
+    best = float('inf')
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', script], check=True, capture_output=True, text=True,
+        ).stdout.split()
+        best = min(best, float(output[0]))
+    return {'ms': best * 1e3, 'loads': output[1:]}
+
+def run(repeat: int) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+    results = {}
+    for statement in IMPORTS:
+        results[statement] = measure(statement, repeat)
+        print(
+            f'{statement:<90} {results[statement]["ms"]:>8.1f} ms'
+            f' {" ".join(results[statement]["loads"])}',
+            flush=True,
+        )
+    return results
+
+def check(results: typing.Dict[str, typing.Dict[str, typing.Any]]) -> typing.List[str]:
+    return [
+        f'{statement}: loads {", ".join(result["loads"])}'
+        for (statement, result) in results.items()
+        if result['loads'] and not IMPORTS.get(statement, True)
+    ]
+
+def compare(
+    results: typing.Dict[str, typing.Dict[str, typing.Any]],
+    baseline: typing.Dict[str, typing.Dict[str, typing.Any]],
+    threshold: float,
+) -> typing.List[str]:
+    regressions = []
+    for statement, result in results.items():
+        if statement not in baseline:
+            continue
+        ratio = result['ms'] / baseline[statement]['ms']
+        if ratio > 1 + threshold:
+            regressions.append(f'{statement}: {ratio:.2f}x slower than baseline')
+    return regressions
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python3 -m bench.imports')
+    parser.add_argument('--repeat', type=int, default=5, help='runs of each import')
+    parser.add_argument('--output', help='file to save results to')
+    parser.add_argument('--baseline', help='file with results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.5, help='allowed slowdown ratio')
+    options = parser.parse_args()
+
+    results = run(options.repeat)
+    if options.output:
+        with open(options.output, 'w', encoding='utf8') as file:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'results': results,
+            }, file, indent=2)
+    failures = check(results)
+    if options.baseline:
+        if not os.path.exists(options.baseline):
+            print(f'no baseline at {options.baseline}, run "make bench-imports-baseline" first')
+            return 2
+        with open(options.baseline, encoding='utf8') as file:
+            baseline = json.load(file)['results']
+        failures += compare(results, baseline, options.threshold)
+    for line in failures:
+        print(line)
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+'''Geometry operations on vectors, points, lines, planes.
+
+Public names of all modules (their `__all__`) are available from the package, such as
+`geometry.Vec3` or `geometry.Vec3Array`. Module of a name is imported on first access,
+so scalar code does not import NumPy (and numba) until it uses batched (`*array`) functions.
+'''
+import typing
+import importlib
+
+# Module of each public name, the same as `__all__` of modules (`tests/test_init.py` checks
+# it). Names are listed here, so modules are imported only on first access of their names.
+# Functions named as their modules (`convex3`, `group3`) are left out: the package gives
+# modules by those names.
+_EXPORTS: typing.Dict[str, str] = {
+    'Vec3': 'vec3', 'ZERO3': 'vec3', 'UNIT3': 'vec3', 'XUNIT3': 'vec3', 'YUNIT3': 'vec3',
+    'ZUNIT3': 'vec3', 'eq3': 'vec3', 'key3': 'vec3', 'dot3': 'vec3', 'len3': 'vec3',
+    'is_zero3': 'vec3', 'is_unit3': 'vec3', 'mul3': 'vec3', 'neg3': 'vec3', 'pos3': 'vec3',
+    'norm3': 'vec3', 'add3': 'vec3', 'sub3': 'vec3', 'cross3': 'vec3', 'angle3': 'vec3',
+    'orthogonal3': 'vec3', 'collinear3': 'vec3', 'rotate3': 'vec3', 'project3': 'vec3',
+    'Line3': 'line3', 'OX3': 'line3', 'OY3': 'line3', 'OZ3': 'line3', 'eq_line3': 'line3',
+    'key_line3': 'line3',
+    'Plane3': 'plane3', 'PreparedPlane3': 'plane3', 'XOY3': 'plane3', 'YOZ3': 'plane3',
+    'ZOX3': 'plane3', 'eq_plane3': 'plane3', 'key_plane3': 'plane3', 'prepare_plane3': 'plane3',
+    'Segment3': 'segment3', 'eq_segment3': 'segment3', 'segment_line3': 'segment3',
+    'Ray3': 'ray3', 'eq_ray3': 'ray3', 'ray_line3': 'ray3',
+    'Triangle3': 'triangle3', 'eq_triangle3': 'triangle3', 'triangle_normal3': 'triangle3',
+    'triangle_plane3': 'triangle3',
+    'AABB3': 'aabb3', 'EMPTY_AABB3': 'aabb3', 'OUTSIDE': 'aabb3', 'INTERSECTING': 'aabb3',
+    'INSIDE': 'aabb3', 'eq_aabb3': 'aabb3', 'points_aabb3': 'aabb3', 'is_empty_aabb3': 'aabb3',
+    'center_aabb3': 'aabb3', 'size_aabb3': 'aabb3', 'union_aabb3': 'aabb3', 'expand_aabb3': 'aabb3',
+    'intersection_aabb3': 'aabb3', 'aabb_plane_classification': 'aabb3',
+    'aabb_frustum_classification': 'aabb3',
+    'IDENTITY_MAT3': 'transform3', 'Transform3': 'transform3', 'IDENTITY_TRANSFORM3': 'transform3',
+    'mul_mat3_vec3': 'transform3', 'transpose_mat3': 'transform3', 'mul_mat3': 'transform3',
+    'inverse_mat3': 'transform3', 'make_transform3': 'transform3', 'translation3': 'transform3',
+    'rotation3': 'transform3', 'scaling3': 'transform3', 'compose3': 'transform3',
+    'inverse3': 'transform3', 'transform_point3': 'transform3', 'transform_vec3': 'transform3',
+    'transform_line3': 'transform3', 'transform_plane3': 'transform3',
+    'Quat3': 'quat3', 'IDENTITY_QUAT3': 'quat3', 'eq_quat3': 'quat3', 'norm_quat3': 'quat3',
+    'axis_angle_quat3': 'quat3', 'between_quat3': 'quat3', 'compose_quat3': 'quat3',
+    'inverse_quat3': 'quat3', 'slerp_quat3': 'quat3', 'quat_mat3': 'quat3',
+    'quat_transform3': 'quat3', 'quat_axis_angle3': 'quat3', 'rotate_point3': 'quat3',
+    'rotate_line3': 'quat3',
+    'Convex3': 'convex3', 'aabb_convex3': 'convex3', 'point_in_convex3': 'convex3',
+    'clip_segment3': 'convex3', 'clip_polygon3': 'convex3', 'convex_vertices3': 'convex3',
+    'ERROR_BUDGETS': 'relations3', 'point_line_projection': 'relations3',
+    'point_line_distance': 'relations3', 'point_plane_projection': 'relations3',
+    'point_plane_distance': 'relations3', 'point_plane_signed_distance': 'relations3',
+    'line_plane_intersection': 'relations3', 'line_plane_projection': 'relations3',
+    'line_line_distance': 'relations3', 'line_line_intersection': 'relations3',
+    'plane_plane_intersection': 'relations3', 'point_segment_projection': 'relations3',
+    'point_segment_distance': 'relations3', 'ray_plane_intersection': 'relations3',
+    'segment_plane_intersection': 'relations3', 'ray_triangle_intersection': 'relations3',
+    'segment_triangle_intersection': 'relations3',
+    'GridPair3': 'grid3', 'item_distance3': 'grid3', 'LooseGrid3': 'grid3',
+    'BACKEND_ENV': 'backend3', 'AUTO': 'backend3', 'PURE': 'backend3', 'NUMBA': 'backend3',
+    'select_backend': 'backend3', 'BACKEND': 'backend3',
+    'CacheStats3': 'cache3', 'RelationCache3': 'cache3',
+    'unique3': 'group3', 'group_line3': 'group3', 'unique_line3': 'group3',
+    'group_plane3': 'group3', 'unique_plane3': 'group3',
+    'IndexHit3': 'index3', 'BVH3': 'index3',
+    'OUTCOMES': 'profile3', 'FunctionStats3': 'profile3', 'Profiler3': 'profile3',
+    'REL_TOL': 'vec3array', 'ABS_TOL': 'vec3array', 'REL_TOLS': 'vec3array',
+    'ZERO_REL_TOLS': 'vec3array', 'ABS_TOLS': 'vec3array', 'Vec3Array': 'vec3array',
+    'eq3_array': 'vec3array',
+    'key3_array': 'vec3array', 'dot3_array': 'vec3array', 'len3_array': 'vec3array',
+    'is_zero3_array': 'vec3array', 'is_unit3_array': 'vec3array', 'mul3_array': 'vec3array',
+    'neg3_array': 'vec3array', 'pos3_array': 'vec3array', 'norm3_array': 'vec3array',
+    'add3_array': 'vec3array', 'sub3_array': 'vec3array', 'cross3_array': 'vec3array',
+    'angle3_array': 'vec3array', 'orthogonal3_array': 'vec3array', 'collinear3_array': 'vec3array',
+    'rotate3_array': 'vec3array', 'project3_array': 'vec3array',
+    'Line3View': 'line3array', 'Line3Array': 'line3array', 'save_line3_array': 'line3array',
+    'load_line3_array': 'line3array',
+    'Plane3View': 'plane3array', 'Plane3Array': 'plane3array', 'save_plane3_array': 'plane3array',
+    'load_plane3_array': 'plane3array',
+    'Triangle3Array': 'triangle3array', 'save_triangle3_array': 'triangle3array',
+    'load_triangle3_array': 'triangle3array',
+    'AABB3Array': 'aabb3array', 'points_aabb3_array': 'aabb3array',
+    'is_empty_aabb3_array': 'aabb3array', 'center_aabb3_array': 'aabb3array',
+    'size_aabb3_array': 'aabb3array', 'union_aabb3_array': 'aabb3array',
+    'expand_aabb3_array': 'aabb3array', 'intersection_aabb3_array': 'aabb3array',
+    'aabb_plane_classification_array': 'aabb3array',
+    'aabb_frustum_classification_array': 'aabb3array',
+    'Quat3Array': 'quat3array', 'axis_angle_quat3_array': 'quat3array',
+    'between_quat3_array': 'quat3array', 'compose_quat3_array': 'quat3array',
+    'inverse_quat3_array': 'quat3array', 'norm_quat3_array': 'quat3array',
+    'slerp_quat3_array': 'quat3array', 'quat_mat3_array': 'quat3array',
+    'rotate_point3_array': 'quat3array', 'rotate_line3_array': 'quat3array',
+    'point_in_convex3_array': 'convex3array', 'clip_segment3_array': 'convex3array',
+    'NO_INTERSECTION': 'relations3array', 'POINT_INTERSECTION': 'relations3array',
+    'LINE_INTERSECTION': 'relations3array', 'point_line_projection_array': 'relations3array',
+    'point_line_distance_array': 'relations3array',
+    'point_plane_projection_array': 'relations3array',
+    'point_plane_distance_array': 'relations3array',
+    'point_plane_signed_distance_array': 'relations3array',
+    'line_plane_intersection_array': 'relations3array',
+    'line_plane_projection_array': 'relations3array', 'line_line_distance_array': 'relations3array',
+    'line_line_intersection_array': 'relations3array',
+    'plane_plane_intersection_array': 'relations3array',
+    'ray_triangle_intersection_array': 'relations3array',
+    'transform_point3_array': 'transform3array', 'transform_vec3_array': 'transform3array',
+    'transform_line3_array': 'transform3array', 'transform_plane3_array': 'transform3array',
+    'Residuals3': 'fit3', 'PlaneFit3': 'fit3', 'LineFit3': 'fit3', 'Covariance3': 'fit3',
+    'covariance3': 'fit3', 'fit_plane3_array': 'fit3', 'fit_line3_array': 'fit3',
+    'ransac_plane3_array': 'fit3', 'ransac_line3_array': 'fit3',
+    'line_line_distance_matrix': 'pairs3', 'line_line_closest_points_matrix': 'pairs3',
+    'point_line_distance_matrix': 'pairs3', 'point_plane_distance_matrix': 'pairs3',
+    'line_line_nearest_pairs': 'pairs3', 'point_line_nearest_pairs': 'pairs3',
+    'point_plane_nearest_pairs': 'pairs3', 'line_line_closest_pair': 'pairs3',
+    'ParallelExecutor3': 'parallel3', 'gather': 'parallel3',
+    'QueryStats3': 'service3', 'QueryService3': 'service3',
+    'point_plane_distance_batch': 'service3', 'line_plane_intersection_batch': 'service3',
+    'plane_plane_intersection_batch': 'service3',
+    'save_data': 'storage3', 'load_data': 'storage3',
+    'read_points_binary': 'stream3', 'read_points_csv': 'stream3', 'write_points_binary': 'stream3',
+    'write_points_csv': 'stream3', 'pipeline': 'stream3', 'transform_stage': 'stream3',
+    'project_stage': 'stream3', 'distance_filter_stage': 'stream3', 'clip_stage': 'stream3',
+}
+
+_MODULES = frozenset(_EXPORTS.values())
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name: str) -> typing.Any:
+    if name in _MODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+    if name not in _EXPORTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'{__name__}.{_EXPORTS[name]}'), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(_EXPORTS) | _MODULES)
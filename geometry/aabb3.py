@@ -0,0 +1,127 @@
+import typing
+import math
+from .vec3 import Vec3, eq3, add3, sub3, mul3, dot3
+from .plane3 import AnyPlane3
+
+__all__ = [
+    'AABB3', 'EMPTY_AABB3', 'OUTSIDE', 'INTERSECTING', 'INSIDE', 'eq_aabb3', 'points_aabb3',
+    'is_empty_aabb3', 'center_aabb3', 'size_aabb3', 'union_aabb3', 'expand_aabb3',
+    'intersection_aabb3', 'aabb_plane_classification', 'aabb_frustum_classification',
+]
+
+class AABB3(typing.NamedTuple):
+    '''Axis-aligned box of points `lower <= x <= upper` (componentwise).
+
+    Box with any lower component greater than upper one is empty.
+    '''
+    lower: Vec3
+    upper: Vec3
+
+    def __eq__(self, other: object) -> bool:
+        try:
+            return eq_aabb3(self, typing.cast(AABB3, other))
+        except: # pylint: disable=bare-except
+            return False
+
+EMPTY_AABB3 = AABB3(
+    lower=Vec3(math.inf, math.inf, math.inf),
+    upper=Vec3(-math.inf, -math.inf, -math.inf),
+)
+
+# Outcome of box classification against plane (or frustum).
+# Values are ordered so that classification against several planes is the least of them.
+OUTSIDE = 0
+INTERSECTING = 1
+INSIDE = 2
+
+def eq_aabb3(a: AABB3, b: AABB3, tolerance: typing.Optional[float] = None) -> bool:
+    return eq3(a.lower, b.lower, tolerance) and eq3(a.upper, b.upper, tolerance)
+
+def points_aabb3(points: typing.Iterable[Vec3]) -> AABB3:
+    '''Gives the least box that contains points, empty box if there are no points.'''
+    (lx, ly, lz) = EMPTY_AABB3.lower
+    (ux, uy, uz) = EMPTY_AABB3.upper
+    for (x, y, z) in points:
+        (lx, ly, lz) = (min(lx, x), min(ly, y), min(lz, z))
+        (ux, uy, uz) = (max(ux, x), max(uy, y), max(uz, z))
+    return AABB3(lower=Vec3(lx, ly, lz), upper=Vec3(ux, uy, uz))
+
+def is_empty_aabb3(box: AABB3) -> bool:
+    (lx, ly, lz) = box.lower
+    (ux, uy, uz) = box.upper
+    return lx > ux or ly > uy or lz > uz
+
+def center_aabb3(box: AABB3) -> Vec3:
+    return mul3(add3(box.lower, box.upper), 0.5)
+
+def size_aabb3(box: AABB3) -> Vec3:
+    return sub3(box.upper, box.lower)
+
+def union_aabb3(a: AABB3, b: AABB3) -> AABB3:
+    '''Gives the least box that contains both boxes.'''
+    ((alx, aly, alz), (aux, auy, auz)) = a
+    ((blx, bly, blz), (bux, buy, buz)) = b
+    return AABB3(
+        lower=Vec3(min(alx, blx), min(aly, bly), min(alz, blz)),
+        upper=Vec3(max(aux, bux), max(auy, buy), max(auz, buz)),
+    )
+
+def expand_aabb3(box: AABB3, margin: float) -> AABB3:
+    '''Moves each box face outwards by margin (inwards if margin is negative).'''
+    if is_empty_aabb3(box):
+        return box
+    (lx, ly, lz) = box.lower
+    (ux, uy, uz) = box.upper
+    return AABB3(
+        lower=Vec3(lx - margin, ly - margin, lz - margin),
+        upper=Vec3(ux + margin, uy + margin, uz + margin),
+    )
+
+def intersection_aabb3(a: AABB3, b: AABB3) -> typing.Optional[AABB3]:
+    '''Finds intersection of boxes.
+
+    Boxes that touch intersect by degenerate (flat) box.
+    If boxes are disjoint then no intersection.
+    '''
+    ((alx, aly, alz), (aux, auy, auz)) = a
+    ((blx, bly, blz), (bux, buy, buz)) = b
+    box = AABB3(
+        lower=Vec3(max(alx, blx), max(aly, bly), max(alz, blz)),
+        upper=Vec3(min(aux, bux), min(auy, buy), min(auz, buz)),
+    )
+    return None if is_empty_aabb3(box) else box
+
+def aabb_plane_classification(box: AABB3, plane: AnyPlane3) -> int:
+    '''Classifies box against plane.
+
+    Box vertices have signed distances `(n, center) - distance +- r` where n is unit normal,
+    `r = |nx| * hx + |ny| * hy + |nz| * hz` and h is half of box size.
+    So box is `INSIDE` if the least of them is not negative (box is on the side plane normal
+    points to, see `point_plane_signed_distance`), `OUTSIDE` if the greatest is negative and
+    `INTERSECTING` otherwise. Empty box is `OUTSIDE`.
+    '''
+    if is_empty_aabb3(box):
+        return OUTSIDE
+    unit_normal = plane.unit_normal
+    (nx, ny, nz) = unit_normal
+    (hx, hy, hz) = mul3(size_aabb3(box), 0.5)
+    r = abs(nx) * hx + abs(ny) * hy + abs(nz) * hz
+    s = dot3(center_aabb3(box), unit_normal) - plane.distance
+    if s - r >= 0:
+        return INSIDE
+    if s + r < 0:
+        return OUTSIDE
+    return INTERSECTING
+
+def aabb_frustum_classification(box: AABB3, planes: typing.Iterable[AnyPlane3]) -> int:
+    '''Classifies box against frustum (or any convex region) of planes with normals inwards.
+
+    Box is `OUTSIDE` as soon as it is outside of any plane and `INSIDE` if inside of all planes.
+    Test is conservative: box near frustum corner may be `INTERSECTING` while being outside.
+    '''
+    result = INSIDE
+    for plane in planes:
+        result = min(result, aabb_plane_classification(box, plane))
+        if result == OUTSIDE:
+            break
+    return result
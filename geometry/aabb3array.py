@@ -0,0 +1,179 @@
+import typing
+import numpy as np
+import numpy.typing as npt
+from .vec3 import Vec3
+from .vec3array import (
+    Vec3Array, Vec3Like, Scalars, as_data3, float_data, isclose_data, dot_data, norm_data,
+)
+from .plane3 import AnyPlane3
+from .plane3array import Plane3Array, Plane3Like, as_plane_data3
+from .aabb3 import AABB3, EMPTY_AABB3, OUTSIDE, INTERSECTING, INSIDE
+
+__all__ = [
+    'AABB3Array', 'points_aabb3_array', 'is_empty_aabb3_array', 'center_aabb3_array',
+    'size_aabb3_array', 'union_aabb3_array', 'expand_aabb3_array', 'intersection_aabb3_array',
+    'aabb_plane_classification_array', 'aabb_frustum_classification_array',
+]
+
+def _to_aabb3(row: typing.Sequence[float]) -> AABB3:
+    (lx, ly, lz, ux, uy, uz) = row
+    return AABB3(lower=Vec3(lx, ly, lz), upper=Vec3(ux, uy, uz))
+
+class AABB3Array:
+    '''Array of boxes stored as (N, 6) float64 or float32 buffer.
+
+    Each row keeps box lower corner followed by box upper corner.
+    Empty boxes are kept as `EMPTY_AABB3` (lower is +inf and upper is -inf).
+    '''
+    __slots__ = ('data',)
+
+    def __init__(
+        self, items: typing.Any = (), dtype: typing.Optional[npt.DTypeLike] = None,
+    ) -> None:
+        data = float_data(items, dtype)
+        if data.ndim == 3 or data.size == 0:
+            data = data.reshape(-1, 6)
+        if data.ndim != 2 or data.shape[1] != 6:
+            raise ValueError(f'expected (N, 6) shape, got {data.shape}')
+        self.data: np.ndarray = data
+
+    @staticmethod
+    def from_parts(lower: Vec3Like, upper: Vec3Like) -> 'AABB3Array':
+        (lower_data, upper_data) = np.broadcast_arrays(as_data3(lower), as_data3(upper))
+        return AABB3Array(np.concatenate((lower_data, upper_data), axis=1))
+
+    @property
+    def lower(self) -> Vec3Array:
+        return Vec3Array(self.data[:, 0:3])
+
+    @property
+    def upper(self) -> Vec3Array:
+        return Vec3Array(self.data[:, 3:6])
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: typing.Any) -> typing.Any:
+        if isinstance(index, (int, np.integer)):
+            return _to_aabb3(self.data[index].tolist())
+        return AABB3Array(self.data[index])
+
+    def __iter__(self) -> typing.Iterator[AABB3]:
+        for row in self.data.tolist():
+            yield _to_aabb3(row)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AABB3Array) or len(self) != len(other):
+            return False
+        return bool(np.all(isclose_data(self.data, other.data)))
+
+    __hash__ = None # type: ignore
+
+    def __repr__(self) -> str:
+        return f'AABB3Array({self.to_list()!r})'
+
+    def to_list(self) -> typing.List[AABB3]:
+        return list(self)
+
+    def astype(self, dtype: npt.DTypeLike) -> 'AABB3Array':
+        return AABB3Array(self.data, dtype)
+
+AABB3Like = typing.Union[AABB3Array, AABB3]
+Frustum3Like = typing.Union[Plane3Array, typing.Sequence[AnyPlane3]]
+
+def as_aabb_data3(box: AABB3Like) -> np.ndarray:
+    '''Gives (N, 6) buffer of array or (1, 6) buffer of single box.'''
+    if isinstance(box, AABB3Array):
+        return box.data
+    return np.asarray(box, dtype=np.float64).reshape(1, 6)
+
+def aabb_plane_classification_data(
+    lower: np.ndarray, upper: np.ndarray, normal: np.ndarray, distance: np.ndarray,
+) -> np.ndarray:
+    '''Classifies boxes against planes, see `aabb3.aabb_plane_classification`.'''
+    unit_normal = norm_data(normal)
+    # Empty boxes have infinite corners, their NaN center is masked out.
+    with np.errstate(invalid='ignore'):
+        r = dot_data(np.abs(unit_normal), (upper - lower) * 0.5)
+        s = dot_data((lower + upper) * 0.5, unit_normal) - distance
+    empty = np.any(lower > upper, axis=-1)
+    return np.where(
+        empty | (s + r < 0), OUTSIDE, np.where(s - r >= 0, INSIDE, INTERSECTING),
+    ).astype(np.int8)
+
+def points_aabb3_array(points: Vec3Array) -> AABB3:
+    '''Gives the least box that contains points in one pass over buffer.'''
+    if len(points) == 0:
+        return EMPTY_AABB3
+    return _to_aabb3(np.concatenate((
+        points.data.min(axis=0), points.data.max(axis=0),
+    )).tolist())
+
+def is_empty_aabb3_array(box: AABB3Like) -> np.ndarray:
+    boxes = as_aabb_data3(box)
+    return np.any(boxes[:, 0:3] > boxes[:, 3:6], axis=1)
+
+def center_aabb3_array(box: AABB3Like) -> Vec3Array:
+    boxes = as_aabb_data3(box)
+    return Vec3Array((boxes[:, 0:3] + boxes[:, 3:6]) * 0.5)
+
+def size_aabb3_array(box: AABB3Like) -> Vec3Array:
+    boxes = as_aabb_data3(box)
+    return Vec3Array(boxes[:, 3:6] - boxes[:, 0:3])
+
+def union_aabb3_array(a: AABB3Like, b: AABB3Like) -> AABB3Array:
+    (a_boxes, b_boxes) = np.broadcast_arrays(as_aabb_data3(a), as_aabb_data3(b))
+    return AABB3Array(np.concatenate((
+        np.minimum(a_boxes[:, 0:3], b_boxes[:, 0:3]),
+        np.maximum(a_boxes[:, 3:6], b_boxes[:, 3:6]),
+    ), axis=1))
+
+def expand_aabb3_array(box: AABB3Like, margin: Scalars) -> AABB3Array:
+    '''Moves faces of non-empty boxes outwards by margin.'''
+    boxes = as_aabb_data3(box)
+    margin_data = float_data(margin).reshape(-1, 1)
+    margin_data = np.where(is_empty_aabb3_array(box)[:, np.newaxis], 0, margin_data)
+    return AABB3Array(np.concatenate((
+        boxes[:, 0:3] - margin_data, boxes[:, 3:6] + margin_data,
+    ), axis=1))
+
+def intersection_aabb3_array(a: AABB3Like, b: AABB3Like) -> AABB3Array:
+    '''Finds intersections of boxes.
+
+    Rows of disjoint boxes are `EMPTY_AABB3` (see `is_empty_aabb3_array`)
+    where scalar function gives `None`.
+    '''
+    (a_boxes, b_boxes) = np.broadcast_arrays(as_aabb_data3(a), as_aabb_data3(b))
+    boxes = np.concatenate((
+        np.maximum(a_boxes[:, 0:3], b_boxes[:, 0:3]),
+        np.minimum(a_boxes[:, 3:6], b_boxes[:, 3:6]),
+    ), axis=1)
+    boxes[is_empty_aabb3_array(AABB3Array(boxes))] = EMPTY_AABB3.lower + EMPTY_AABB3.upper
+    return AABB3Array(boxes)
+
+def aabb_plane_classification_array(box: AABB3Like, plane: Plane3Like) -> np.ndarray:
+    boxes = as_aabb_data3(box)
+    planes = as_plane_data3(plane)
+    return aabb_plane_classification_data(
+        boxes[:, 0:3], boxes[:, 3:6], planes[:, 0:3], planes[:, 3],
+    )
+
+def aabb_frustum_classification_array(box: AABB3Like, planes: Frustum3Like) -> np.ndarray:
+    '''Classifies each box against all frustum planes in one call.
+
+    Boxes are broadcast against planes into (planes, boxes) classifications,
+    least of them over planes is the classification against frustum.
+    Unlike scalar function there is no early exit, but also no Python work per box.
+    '''
+    boxes = as_aabb_data3(box)
+    if isinstance(planes, Plane3Array):
+        plane_data = planes.data
+    else:
+        plane_data = np.concatenate(
+            [np.empty((0, 4))] + [as_plane_data3(plane) for plane in planes])
+    if len(plane_data) == 0:
+        return np.full(len(boxes), INSIDE, dtype=np.int8)
+    return aabb_plane_classification_data(
+        boxes[:, 0:3], boxes[:, 3:6],
+        plane_data[:, np.newaxis, 0:3], plane_data[:, np.newaxis, 3],
+    ).min(axis=0)
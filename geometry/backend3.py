@@ -0,0 +1,41 @@
+import typing
+import os
+import importlib.util
+
+__all__ = ['BACKEND_ENV', 'AUTO', 'PURE', 'NUMBA', 'select_backend', 'BACKEND']
+
+# Environment variable that selects implementation of hot scalar functions at import time.
+BACKEND_ENV = 'GEOMETRY_BACKEND'
+
+AUTO = 'auto'
+PURE = 'pure'
+NUMBA = 'numba'
+
+def select_backend(value: typing.Optional[str] = None) -> str:
+    '''Chooses backend by name (by `GEOMETRY_BACKEND` variable if name is not given).
+
+    `pure` (default) - pure Python.
+    `auto` - compiled kernels if numba is installed, pure Python otherwise.
+    `numba` - compiled kernels, first call fails if numba is not installed.
+    Compiled kernels are opt-in: first call of any of them compiles all of them (seconds,
+    cached on disk for next runs), which pays off only for millions of calls.
+    '''
+    if value is None:
+        value = os.environ.get(BACKEND_ENV, PURE)
+    if value == AUTO:
+        return NUMBA if importlib.util.find_spec('numba') is not None else PURE
+    if value not in (PURE, NUMBA):
+        raise ValueError(f'{BACKEND_ENV}: unknown backend {value!r}')
+    return value
+
+BACKEND = select_backend()
+
+# Names of `relations3` functions that have compiled counterparts in `relations3numba`.
+# They are listed here, so `relations3` knows them without importing numba.
+COMPILED = (
+    'point_line_projection', 'point_line_distance',
+    'point_plane_projection', 'point_plane_distance',
+    'line_plane_intersection', 'line_plane_projection',
+    'line_line_distance', 'line_line_intersection', 'plane_plane_intersection',
+    'ray_triangle_intersection', 'segment_triangle_intersection',
+)
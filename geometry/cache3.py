@@ -0,0 +1,119 @@
+import typing
+import collections
+from . import relations3
+from .vec3 import Vec3
+from .line3 import Line3, key_line3
+from .plane3 import AnyPlane3, key_plane3
+
+__all__ = ['CacheStats3', 'RelationCache3']
+
+Key = typing.Tuple[typing.Any, ...]
+
+class CacheStats3(typing.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+class RelationCache3:
+    '''Bounded LRU cache of `plane_plane_intersection` and `line_line_intersection` results.
+
+    Without tolerance arguments are keyed by exact components. With tolerance they are keyed
+    by `key_plane3`/`key_line3`, so arguments that fall into the same tolerance cell share
+    result of the first of them (results may differ from direct call within that tolerance).
+    Entries that refer to a primitive can be dropped with `invalidate`, all with `clear`.
+    Not thread safe.
+    '''
+
+    def __init__(self, max_size: int = 1024, tolerance: typing.Optional[float] = None) -> None:
+        if max_size <= 0:
+            raise ValueError('max_size must be positive')
+        self.max_size = max_size
+        self.tolerance = tolerance
+        self._entries: typing.OrderedDict[Key, typing.Any] = collections.OrderedDict()
+        # Entries by keys of primitives they refer to.
+        self._by_primitive: typing.Dict[Key, typing.Set[Key]] = {}
+        (self._hits, self._misses, self._evictions) = (0, 0, 0)
+
+    def _plane_key(self, plane: AnyPlane3) -> Key:
+        if self.tolerance is None:
+            return ('plane', *plane.normal, plane.distance)
+        return ('plane', *key_plane3(plane, self.tolerance))
+
+    def _line_key(self, line: Line3) -> Key:
+        if self.tolerance is None:
+            return ('line', *line.anchor, *line.direction)
+        return ('line', *key_line3(line, self.tolerance))
+
+    def _get(
+        self, a_key: Key, b_key: Key, compute: typing.Callable[[], typing.Any],
+    ) -> typing.Any:
+        key = (a_key, b_key)
+        if key in self._entries:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        self._misses += 1
+        result = compute()
+        self._entries[key] = result
+        for primitive in key:
+            self._by_primitive.setdefault(primitive, set()).add(key)
+        if len(self._entries) > self.max_size:
+            self._evictions += 1
+            self._remove(next(iter(self._entries)))
+        return result
+
+    def _remove(self, key: Key) -> None:
+        del self._entries[key]
+        for primitive in key:
+            keys = self._by_primitive.get(primitive)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_primitive[primitive]
+
+    def plane_plane_intersection(
+        self, a_plane: AnyPlane3, b_plane: AnyPlane3,
+    ) -> typing.Union[Line3, None]:
+        return typing.cast(typing.Union[Line3, None], self._get(
+            self._plane_key(a_plane), self._plane_key(b_plane),
+            lambda: relations3.plane_plane_intersection(a_plane, b_plane),
+        ))
+
+    def line_line_intersection(
+        self, a_line: Line3, b_line: Line3,
+    ) -> typing.Union[typing.Tuple[Vec3, Vec3], None]:
+        return typing.cast(typing.Union[typing.Tuple[Vec3, Vec3], None], self._get(
+            self._line_key(a_line), self._line_key(b_line),
+            lambda: relations3.line_line_intersection(a_line, b_line),
+        ))
+
+    def invalidate(self, primitive: typing.Union[AnyPlane3, Line3]) -> int:
+        '''Drops entries that refer to plane or line (such as one that was moved).
+
+        Gives number of dropped entries.
+        '''
+        key = self._line_key(primitive) if isinstance(primitive, Line3) \
+            else self._plane_key(primitive)
+        keys = list(self._by_primitive.get(key, ()))
+        for entry_key in keys:
+            self._remove(entry_key)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_primitive.clear()
+
+    def stats(self) -> CacheStats3:
+        return CacheStats3(
+            hits=self._hits, misses=self._misses, evictions=self._evictions,
+            size=len(self._entries),
+        )
+
+    def reset_stats(self) -> None:
+        (self._hits, self._misses, self._evictions) = (0, 0, 0)
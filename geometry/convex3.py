@@ -0,0 +1,116 @@
+import typing
+from .vec3 import Vec3, XUNIT3, YUNIT3, ZUNIT3, neg3, add3, sub3, mul3, dot3, eq3
+from .plane3 import Plane3, PreparedPlane3, AnyPlane3, prepare_plane3
+from .segment3 import Segment3
+from .aabb3 import AABB3
+from . import relations3
+
+__all__ = [
+    'Convex3', 'convex3', 'aabb_convex3', 'point_in_convex3', 'clip_segment3', 'clip_polygon3',
+    'convex_vertices3',
+]
+
+class Convex3(typing.NamedTuple):
+    '''Convex region, intersection of half-spaces `(unit_normal, x) >= distance` of planes.
+
+    So plane normals point inside, as ones of frustum planes (see `aabb_frustum_classification`).
+    Region may be unbounded (such as a single half-space) or empty.
+    '''
+    planes: typing.Tuple[PreparedPlane3, ...]
+
+def convex3(planes: typing.Iterable[AnyPlane3]) -> Convex3:
+    return Convex3(planes=tuple(prepare_plane3(plane) for plane in planes))
+
+def aabb_convex3(box: AABB3) -> Convex3:
+    '''Gives region of box, bounded by six planes.'''
+    return convex3(
+        plane
+        for (axis, lower, upper) in zip((XUNIT3, YUNIT3, ZUNIT3), box.lower, box.upper)
+        for plane in (
+            Plane3(normal=axis, distance=lower), Plane3(normal=neg3(axis), distance=-upper),
+        )
+    )
+
+def _signed_distance(point: Vec3, plane: PreparedPlane3) -> float:
+    return dot3(point, plane.unit_normal) - plane.distance
+
+def point_in_convex3(point: Vec3, region: Convex3, tolerance: float = 0.0) -> bool:
+    '''Checks that point is inside region or not farther than tolerance outside any plane.'''
+    return all(_signed_distance(point, plane) >= -tolerance for plane in region.planes)
+
+def _lerp(start: Vec3, end: Vec3, t: float) -> Vec3:
+    return add3(start, mul3(sub3(end, start), t))
+
+def clip_segment3(segment: Segment3, region: Convex3) -> typing.Optional[Segment3]:
+    '''Clips segment by region (Liang-Barsky), gives `None` if segment is outside.
+
+    Segment points are `start + (end - start) * t` for t in [0, 1]. Signed distances of
+    ends to plane `d0`, `d1` give plane crossing at `t = d0 / (d0 - d1)`: segment enters
+    half-space there if `d0 < 0` and leaves it if `d1 < 0`. Interval of t is narrowed
+    by each plane in one pass over planes.
+    '''
+    (enter, leave) = (0.0, 1.0)
+    for plane in region.planes:
+        start_distance = _signed_distance(segment.start, plane)
+        end_distance = _signed_distance(segment.end, plane)
+        if start_distance < 0 and end_distance < 0:
+            return None
+        if start_distance < 0:
+            enter = max(enter, start_distance / (start_distance - end_distance))
+        elif end_distance < 0:
+            leave = min(leave, start_distance / (start_distance - end_distance))
+        if enter > leave:
+            return None
+    return Segment3(
+        start=_lerp(segment.start, segment.end, enter),
+        end=_lerp(segment.start, segment.end, leave),
+    )
+
+def clip_polygon3(polygon: typing.Sequence[Vec3], region: Convex3) -> typing.List[Vec3]:
+    '''Clips convex or concave planar polygon by region (Sutherland-Hodgman).
+
+    Polygon is clipped by each plane in turn: inside vertices (including ones on plane)
+    are kept and edges with ends strictly on opposite sides of plane are cut
+    at `t = d0 / (d0 - d1)` of signed distances of their ends.
+    Gives empty list if polygon is outside.
+    '''
+    vertices = list(polygon)
+    for plane in region.planes:
+        if not vertices:
+            break
+        distances = [_signed_distance(vertex, plane) for vertex in vertices]
+        clipped = []
+        for i, (vertex, distance) in enumerate(zip(vertices, distances)):
+            (prev_vertex, prev_distance) = (vertices[i - 1], distances[i - 1])
+            if distance * prev_distance < 0:
+                clipped.append(_lerp(
+                    prev_vertex, vertex, prev_distance / (prev_distance - distance),
+                ))
+            if distance >= 0:
+                clipped.append(vertex)
+        vertices = clipped
+    return vertices
+
+def convex_vertices3(region: Convex3, tolerance: float = 1e-9) -> typing.List[Vec3]:
+    '''Finds vertices of region.
+
+    Each pair of non-parallel planes intersects by line (`plane_plane_intersection`),
+    each other plane crosses that line at candidate point (`line_plane_intersection`).
+    Candidates inside region (within tolerance) are vertices. Vertices where more than
+    three planes meet are found several times and merged within tolerance.
+    Unbounded regions give only their vertices, not points at infinity.
+    '''
+    planes = region.planes
+    vertices: typing.List[Vec3] = []
+    for (i, a_plane) in enumerate(planes):
+        for (j, b_plane) in enumerate(planes[i + 1:], i + 1):
+            line = relations3.plane_plane_intersection(a_plane, b_plane)
+            if line is None:
+                continue
+            for c_plane in planes[j + 1:]:
+                point = relations3.line_plane_intersection(line, c_plane)
+                if not isinstance(point, Vec3) or not point_in_convex3(point, region, tolerance):
+                    continue
+                if not any(eq3(point, vertex, tolerance) for vertex in vertices):
+                    vertices.append(point)
+    return vertices
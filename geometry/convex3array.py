@@ -0,0 +1,46 @@
+import typing
+import numpy as np
+from .vec3array import Vec3Array, Vec3Like, as_data3
+from .convex3 import Convex3
+
+__all__ = ['point_in_convex3_array', 'clip_segment3_array']
+
+def convex_data3(region: Convex3) -> np.ndarray:
+    '''Gives (P, 4) buffer of unit normals and distances of region planes.'''
+    return np.array(
+        [(*plane.unit_normal, plane.distance) for plane in region.planes], dtype=np.float64,
+    ).reshape(-1, 4)
+
+def convex_signed_distance_data(point: np.ndarray, planes: np.ndarray) -> np.ndarray:
+    '''Gives (N, P) signed distances of points to all planes with one matrix product.'''
+    return point @ planes[:, 0:3].T - planes[:, 3]
+
+def point_in_convex3_array(
+    point: Vec3Like, region: Convex3, tolerance: float = 0.0,
+) -> np.ndarray:
+    '''Checks points against region, see `point_in_convex3`.'''
+    distances = convex_signed_distance_data(as_data3(point), convex_data3(region))
+    return np.all(distances >= -tolerance, axis=1)
+
+def clip_segment3_array(
+    start: Vec3Like, end: Vec3Like, region: Convex3,
+) -> typing.Tuple[np.ndarray, Vec3Array, Vec3Array]:
+    '''Clips segments by region, see `clip_segment3`.
+
+    Gives mask of segments that are not outside and clipped starts and ends,
+    which are NaN for segments outside. All planes are applied in one pass
+    as min/max of crossing parameters over (N, P) matrices.
+    '''
+    (starts, ends) = np.broadcast_arrays(as_data3(start), as_data3(end))
+    planes = convex_data3(region)
+    start_distance = convex_signed_distance_data(starts, planes)
+    end_distance = convex_signed_distance_data(ends, planes)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = start_distance / (start_distance - end_distance)
+    enter = np.max(np.where(start_distance < 0, t, 0), axis=1, initial=0)
+    leave = np.min(np.where((start_distance >= 0) & (end_distance < 0), t, 1), axis=1, initial=1)
+    inside = ~np.any((start_distance < 0) & (end_distance < 0), axis=1) & (enter <= leave)
+    enter = np.where(inside, enter, np.nan)[:, np.newaxis]
+    leave = np.where(inside, leave, np.nan)[:, np.newaxis]
+    direction = ends - starts
+    return inside, Vec3Array(starts + direction * enter), Vec3Array(starts + direction * leave)
@@ -0,0 +1,228 @@
+import typing
+import math
+import numpy as np
+from .vec3 import Vec3
+from .vec3array import REL_TOLS, Vec3Array, iszero_data, dot_data, norm_data, cross_data
+from .line3 import Line3
+from .plane3 import Plane3
+from .relations3array import len_data, point_line_distance_data
+
+__all__ = [
+    'Residuals3', 'PlaneFit3', 'LineFit3', 'Covariance3', 'covariance3', 'fit_plane3_array',
+    'fit_line3_array', 'ransac_plane3_array', 'ransac_line3_array',
+]
+
+# Candidates of RANSAC are scored in blocks of about this many point-candidate pairs.
+RANSAC_BLOCK_SIZE = 1 << 22
+
+class Residuals3(typing.NamedTuple):
+    '''Distances from fitted points to fitted plane or line.
+
+    Fit from accumulated covariance alone does not see points, so `max_distance` is NaN there.
+    '''
+    point_count: int
+    rms_distance: float
+    max_distance: float
+
+class PlaneFit3(typing.NamedTuple):
+    plane: Plane3
+    residuals: Residuals3
+
+class LineFit3(typing.NamedTuple):
+    line: Line3
+    residuals: Residuals3
+
+class Covariance3:
+    '''Accumulates mean and scatter matrix of points chunk by chunk.
+
+    Scatter is `sum((x - mean) * (x - mean)^T)`. Chunks are merged by Chan's formula
+    `S = S_a + S_b + (m_b - m_a) * (m_b - m_a)^T * n_a * n_b / n` which, unlike sums of
+    `x * x^T`, does not lose precision on points far from (0,0,0).
+    Memory does not depend on number of points, so inputs larger than memory can be streamed.
+    '''
+    __slots__ = ('count', 'mean', 'scatter')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = np.zeros(3)
+        self.scatter = np.zeros((3, 3))
+
+    def add(self, points: Vec3Array) -> None:
+        if len(points) == 0:
+            return
+        chunk = Covariance3()
+        chunk.count = len(points)
+        chunk.mean = points.data.mean(axis=0)
+        centered = points.data - chunk.mean
+        chunk.scatter = centered.T @ centered
+        self.merge(chunk)
+
+    def merge(self, other: 'Covariance3') -> None:
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.scatter = self.scatter + other.scatter \
+            + np.outer(delta, delta) * (self.count * other.count / count)
+        self.mean = self.mean + delta * (other.count / count)
+        self.count = count
+
+    @property
+    def covariance(self) -> np.ndarray:
+        return self.scatter / self.count
+
+    def fit_plane3(self) -> PlaneFit3:
+        '''Fits plane through mean along the two directions of the greatest spread.
+
+        Eigenvector of the least eigenvalue of scatter is plane normal and the eigenvalue
+        is the sum of squared distances to plane. Normal is directed so that distance >= 0.
+        '''
+        if self.count < 3:
+            raise ValueError('at least 3 points are needed to fit plane')
+        (values, vectors) = np.linalg.eigh(self.scatter)
+        normal = vectors[:, 0]
+        distance = float(normal @ self.mean)
+        if distance < 0:
+            (normal, distance) = (-normal, -distance)
+        rms = math.sqrt(max(values[0], 0) / self.count)
+        return PlaneFit3(
+            plane=Plane3(normal=Vec3(*normal.tolist()), distance=distance),
+            residuals=Residuals3(point_count=self.count, rms_distance=rms, max_distance=math.nan),
+        )
+
+    def fit_line3(self) -> LineFit3:
+        '''Fits line through mean along the direction of the greatest spread.
+
+        Eigenvector of the greatest eigenvalue of scatter is line direction,
+        the other two eigenvalues sum up to the sum of squared distances to line.
+        '''
+        if self.count < 2:
+            raise ValueError('at least 2 points are needed to fit line')
+        (values, vectors) = np.linalg.eigh(self.scatter)
+        rms = math.sqrt(max(values[0] + values[1], 0) / self.count)
+        return LineFit3(
+            line=Line3(anchor=Vec3(*self.mean.tolist()), direction=Vec3(*vectors[:, 2].tolist())),
+            residuals=Residuals3(point_count=self.count, rms_distance=rms, max_distance=math.nan),
+        )
+
+def covariance3(chunks: typing.Iterable[Vec3Array]) -> Covariance3:
+    '''Accumulates covariance over chunks (such as ones of `stream3` readers).'''
+    result = Covariance3()
+    for chunk in chunks:
+        result.add(chunk)
+    return result
+
+def _residuals(distances: np.ndarray) -> Residuals3:
+    return Residuals3(
+        point_count=len(distances),
+        rms_distance=float(np.sqrt(np.mean(distances ** 2))),
+        max_distance=float(np.max(distances)),
+    )
+
+def _plane_distances(points: np.ndarray, plane: Plane3) -> np.ndarray:
+    return np.abs(points @ np.array(plane.normal) - plane.distance)
+
+def _line_distances(points: np.ndarray, line: Line3) -> np.ndarray:
+    return point_line_distance_data(points, np.array(line.anchor), np.array(line.direction))
+
+def fit_plane3_array(points: Vec3Array) -> PlaneFit3:
+    '''Fits plane by least squares of distances (PCA), see `Covariance3.fit_plane3`.'''
+    plane = covariance3([points]).fit_plane3().plane
+    return PlaneFit3(plane=plane, residuals=_residuals(_plane_distances(points.data, plane)))
+
+def fit_line3_array(points: Vec3Array) -> LineFit3:
+    '''Fits line by least squares of distances (PCA), see `Covariance3.fit_line3`.'''
+    line = covariance3([points]).fit_line3().line
+    return LineFit3(line=line, residuals=_residuals(_line_distances(points.data, line)))
+
+def _best_inliers(
+    candidates: typing.Iterable[np.ndarray],
+    threshold: float,
+) -> typing.Optional[np.ndarray]:
+    '''Gives inliers of candidate with the greatest number of them.
+
+    Each candidate is a (points, block) matrix of distances.
+    '''
+    (best_count, best) = (0, None)
+    for distances in candidates:
+        inliers = distances <= threshold
+        counts = inliers.sum(axis=0)
+        if len(counts) and counts.max() > best_count:
+            best_count = int(counts.max())
+            best = inliers[:, int(counts.argmax())]
+    return best
+
+def _samples(
+    data: np.ndarray, sample_size: int, iterations: int, seed: typing.Optional[int],
+) -> np.ndarray:
+    '''Gives (iterations, sample_size, 3) random points.
+
+    Points are drawn independently, degenerate samples (such as ones with repeated point)
+    are skipped by callers, see `_degenerate`.
+    '''
+    if len(data) < sample_size:
+        raise ValueError(f'at least {sample_size} points are needed')
+    return data[np.random.default_rng(seed).integers(0, len(data), (iterations, sample_size))]
+
+def _degenerate(value: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    '''Tests lengths of sample normals or directions for zero relative to `scale`.
+
+    Normal of nearly collinear sample is rounding noise that normalization would turn into
+    unit vector, so such samples are skipped with `REL_TOLS` for float64 too.
+    '''
+    return iszero_data(len_data(value), scale, REL_TOLS)
+
+def ransac_plane3_array(
+    points: Vec3Array,
+    threshold: float,
+    iterations: int = 100,
+    seed: typing.Optional[int] = None,
+) -> typing.Tuple[PlaneFit3, np.ndarray]:
+    '''Fits plane robust to outliers.
+
+    Each iteration takes plane through three random points and counts inliers
+    (points not farther than threshold). Plane is refitted by least squares to inliers
+    of the best candidate. Candidates are scored in blocks with one matrix product each.
+    Gives fit and inliers mask.
+    '''
+    data = points.data
+    samples = _samples(data, 3, iterations, seed)
+    (edge_1, edge_2) = (samples[:, 1] - samples[:, 0], samples[:, 2] - samples[:, 0])
+    normals = cross_data(edge_1, edge_2)
+    valid = ~_degenerate(normals, len_data(edge_1) * len_data(edge_2))
+    normals = norm_data(normals[valid])
+    distances = dot_data(normals, samples[valid, 0])
+    block = max(1, RANSAC_BLOCK_SIZE // max(len(data), 1))
+    inliers = _best_inliers((
+        np.abs(data @ normals[i:i + block].T - distances[i:i + block])
+        for i in range(0, len(normals), block)
+    ), threshold)
+    if inliers is None or inliers.sum() < 3:
+        raise ValueError('no plane candidate found, points may be collinear')
+    return fit_plane3_array(points[inliers]), inliers
+
+def ransac_line3_array(
+    points: Vec3Array,
+    threshold: float,
+    iterations: int = 100,
+    seed: typing.Optional[int] = None,
+) -> typing.Tuple[LineFit3, np.ndarray]:
+    '''Fits line robust to outliers, see `ransac_plane3_array`.
+
+    Each candidate is line through two random points.
+    '''
+    data = points.data
+    samples = _samples(data, 2, iterations, seed)
+    directions = samples[:, 1] - samples[:, 0]
+    valid = ~_degenerate(directions, np.maximum(len_data(samples[:, 0]), len_data(samples[:, 1])))
+    (anchors, directions) = (samples[valid, 0], directions[valid])
+    block = max(1, RANSAC_BLOCK_SIZE // (4 * max(len(data), 1)))
+    inliers = _best_inliers((
+        point_line_distance_data(
+            data[:, np.newaxis], anchors[i:i + block], directions[i:i + block],
+        )
+        for i in range(0, len(directions), block)
+    ), threshold)
+    if inliers is None or inliers.sum() < 2:
+        raise ValueError('no line candidate found, points may coincide')
+    return fit_line3_array(points[inliers]), inliers
@@ -0,0 +1,263 @@
+import typing
+import math
+from .vec3 import Vec3, add3, sub3, mul3, dot3, len3
+from .line3 import Line3
+from .segment3 import Segment3, segment_line3
+from .aabb3 import AABB3
+from .index3 import Box
+from .relations3 import (
+    point_line_distance, line_line_distance, line_line_intersection, point_segment_distance,
+)
+
+__all__ = ['GridPair3', 'item_distance3', 'LooseGrid3']
+
+Item = typing.Union[Vec3, Segment3, Line3]
+Cell = typing.Tuple[int, int, int]
+
+class GridPair3(typing.NamedTuple):
+    a_handle: int
+    b_handle: int
+    distance: float
+
+def _on_segment(point: Vec3, segment: Segment3) -> bool:
+    direction = sub3(segment.end, segment.start)
+    t = dot3(sub3(point, segment.start), direction) / dot3(direction, direction)
+    return 0 <= t <= 1
+
+def _line_segment_distance(line: Line3, segment: Segment3) -> float:
+    '''Finds distance between line and segment.
+
+    Distance to line is convex along segment, so it is the least either at closest point
+    of segment line (found by `line_line_intersection`) if it is inside segment or at its end.
+    '''
+    distances = [point_line_distance(segment.start, line), point_line_distance(segment.end, line)]
+    pair = line_line_intersection(line, segment_line3(segment))
+    if pair is not None and _on_segment(pair[1], segment):
+        distances.append(len3(sub3(*pair)))
+    return min(distances)
+
+def _segment_segment_distance(a: Segment3, b: Segment3) -> float:
+    '''Finds distance between segments.
+
+    Closest points are either inner points of both (found by `line_line_intersection`)
+    or one of them is an end of a segment.
+    '''
+    distances = [
+        point_segment_distance(a.start, b), point_segment_distance(a.end, b),
+        point_segment_distance(b.start, a), point_segment_distance(b.end, a),
+    ]
+    pair = line_line_intersection(segment_line3(a), segment_line3(b))
+    if pair is not None and _on_segment(pair[0], a) and _on_segment(pair[1], b):
+        distances.append(len3(sub3(*pair)))
+    return min(distances)
+
+def item_distance3(a: Item, b: Item) -> float:
+    '''Finds distance between points, segments or lines by `relations3` functions.'''
+    if isinstance(b, Vec3) and not isinstance(a, Vec3):
+        (a, b) = (b, a)
+    elif isinstance(a, Line3) and isinstance(b, Segment3):
+        (a, b) = (b, a)
+    if isinstance(a, Vec3):
+        if isinstance(b, Vec3):
+            return len3(sub3(a, b))
+        if isinstance(b, Segment3):
+            return point_segment_distance(a, b)
+        return point_line_distance(a, b)
+    if isinstance(a, Segment3):
+        if isinstance(b, Segment3):
+            return _segment_segment_distance(a, b)
+        return _line_segment_distance(typing.cast(Line3, b), a)
+    return line_line_distance(a, typing.cast(Line3, b))
+
+def _clip_line(line: Line3, bounds: AABB3) -> typing.Optional[Segment3]:
+    '''Gives part of line inside bounds (slab method), `None` if line misses them.'''
+    (t_min, t_max) = (-math.inf, math.inf)
+    for axis in range(3):
+        (origin, direction) = (line.anchor[axis], line.direction[axis])
+        (low, high) = (bounds.lower[axis], bounds.upper[axis])
+        if direction == 0:
+            if origin < low or origin > high:
+                return None
+            continue
+        (t_low, t_high) = sorted(((low - origin) / direction, (high - origin) / direction))
+        (t_min, t_max) = (max(t_min, t_low), min(t_max, t_high))
+        if t_min > t_max:
+            return None
+    return Segment3(
+        start=add3(line.anchor, mul3(line.direction, t_min)),
+        end=add3(line.anchor, mul3(line.direction, t_max)),
+    )
+
+def _segment_box(start: Vec3, end: Vec3) -> Box:
+    return (
+        min(start.x, end.x), min(start.y, end.y), min(start.z, end.z),
+        max(start.x, end.x), max(start.y, end.y), max(start.z, end.z),
+    )
+
+def _box_distance(a: Box, b: Box) -> float:
+    dx = max(a[0] - b[3], 0, b[0] - a[3])
+    dy = max(a[1] - b[4], 0, b[1] - a[4])
+    dz = max(a[2] - b[5], 0, b[2] - a[5])
+    return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+class LooseGrid3:
+    '''Broad phase over moving points, segments and lines (loose grid).
+
+    Segments are split into pieces not longer than half of cell along any axis, point is
+    one piece. Piece is kept in the cell that holds center of its box, so boxes stick out
+    of their cells by at most quarter of cell, and items that move a little stay in their
+    cells: updating them costs a few dict operations per piece.
+    Only occupied cells are stored, memory scales with the number of pieces.
+
+    Centers of pieces with boxes within threshold are not farther than `cell / 2 + threshold`
+    along any axis, so pairs are searched in cells within `ceil(1 / 2 + threshold / cell)`
+    cells, the nearest 27 cells for threshold up to half of cell (cell of one to a few
+    thresholds suits best).
+
+    Lines are unbounded: with bounds they are kept as their parts inside bounds, so pairs
+    with lines are found if their closest points are inside bounds (lines that miss bounds
+    are not paired). Without bounds lines are paired with every item.
+    Items are identified by integer handles given on insertion.
+    '''
+
+    def __init__(self, cell_size: float, bounds: typing.Optional[AABB3] = None) -> None:
+        if cell_size <= 0:
+            raise ValueError('cell_size must be positive')
+        self.cell_size = cell_size
+        self.bounds = bounds
+        self._items: typing.Dict[int, Item] = {}
+        # Cells of pieces of each item and pieces of each cell by (handle, piece index).
+        self._places: typing.Dict[int, typing.List[Cell]] = {}
+        self._cells: typing.Dict[Cell, typing.Dict[typing.Tuple[int, int], Box]] = {}
+        self._unbounded: typing.Set[int] = set()
+        self._next_handle = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, handle: int) -> Item:
+        return self._items[handle]
+
+    def cell_count(self) -> int:
+        return len(self._cells)
+
+    def insert(self, item: Item) -> int:
+        handle = self._next_handle
+        self._next_handle += 1
+        self._place(handle, item)
+        return handle
+
+    def update(self, handle: int, item: Item) -> None:
+        '''Replaces item (such as one that moved), moves its pieces to other cells if needed.'''
+        if handle not in self._items:
+            raise KeyError(handle)
+        self._place(handle, item)
+
+    def remove(self, handle: int) -> None:
+        self._unplace(handle)
+        del self._items[handle]
+
+    def _pieces(self, item: Item) -> typing.Optional[typing.List[Box]]:
+        if isinstance(item, Vec3):
+            return [_segment_box(item, item)]
+        if isinstance(item, Line3):
+            if self.bounds is None:
+                return None
+            segment = _clip_line(item, self.bounds)
+            if segment is None:
+                return []
+            item = segment
+        direction = sub3(item.end, item.start)
+        count = max(1, math.ceil(2 * max(map(abs, direction)) / self.cell_size))
+        return [
+            _segment_box(
+                add3(item.start, mul3(direction, i / count)),
+                add3(item.start, mul3(direction, (i + 1) / count)),
+            )
+            for i in range(count)
+        ]
+
+    def _place(self, handle: int, item: Item) -> None:
+        self._items[handle] = item
+        pieces = self._pieces(item)
+        if pieces is None:
+            self._unplace(handle)
+            self._unbounded.add(handle)
+            return
+        self._unbounded.discard(handle)
+        size = self.cell_size
+        cells = [
+            (
+                math.floor((box[0] + box[3]) / 2 / size), math.floor((box[1] + box[4]) / 2 / size),
+                math.floor((box[2] + box[5]) / 2 / size),
+            )
+            for box in pieces
+        ]
+        for (i, old_cell) in enumerate(self._places.pop(handle, [])):
+            if i >= len(cells) or cells[i] != old_cell:
+                self._remove_piece(old_cell, (handle, i))
+        for (i, (cell, box)) in enumerate(zip(cells, pieces)):
+            self._cells.setdefault(cell, {})[(handle, i)] = box
+        self._places[handle] = cells
+
+    def _unplace(self, handle: int) -> None:
+        self._unbounded.discard(handle)
+        for (i, cell) in enumerate(self._places.pop(handle, [])):
+            self._remove_piece(cell, (handle, i))
+
+    def _remove_piece(self, cell: Cell, key: typing.Tuple[int, int]) -> None:
+        pieces = self._cells[cell]
+        del pieces[key]
+        if not pieces:
+            del self._cells[cell]
+
+    def _nearby_cells(self, cell: Cell, reach: int) -> typing.Iterable[Cell]:
+        if (2 * reach + 1) ** 3 > len(self._cells):
+            # Far reach (large threshold) scans occupied cells instead of all cells in reach.
+            return [
+                other for other in self._cells
+                if all(abs(i - j) <= reach for (i, j) in zip(cell, other))
+            ]
+        (cx, cy, cz) = cell
+        offsets = range(-reach, reach + 1)
+        return [(cx + dx, cy + dy, cz + dz) for dx in offsets for dy in offsets for dz in offsets]
+
+    def candidates(self, threshold: float) -> typing.Iterator[typing.Tuple[int, int]]:
+        '''Gives pairs of handles `(a, b)`, a < b, of items with pieces within threshold.
+
+        Every pair of items not farther than threshold is given once, along with some farther ones.
+        '''
+        reach = math.ceil(0.5 + threshold / self.cell_size)
+        found: typing.Set[typing.Tuple[int, int]] = set()
+        for (cell, pieces) in self._cells.items():
+            nearby = [
+                item
+                for other_cell in self._nearby_cells(cell, reach)
+                for item in self._cells.get(other_cell, {}).items()
+            ]
+            for ((handle, _), box) in pieces.items():
+                for ((other, _), other_box) in nearby:
+                    if other <= handle or (handle, other) in found:
+                        continue
+                    if _box_distance(box, other_box) <= threshold:
+                        found.add((handle, other))
+                        yield (handle, other)
+        unbounded = sorted(self._unbounded)
+        for (i, handle) in enumerate(unbounded):
+            for other in unbounded[i + 1:]:
+                yield (handle, other)
+            for other in self._places:
+                yield (min(handle, other), max(handle, other))
+
+    def pairs(self, threshold: float) -> typing.List[GridPair3]:
+        '''Finds pairs of items not farther than threshold, ordered by handles.
+
+        Candidates are checked by exact distance, see `item_distance3`.
+        '''
+        result = []
+        for (a, b) in self.candidates(threshold):
+            distance = item_distance3(self._items[a], self._items[b])
+            if distance <= threshold:
+                result.append(GridPair3(a, b, distance))
+        result.sort()
+        return result
@@ -0,0 +1,70 @@
+import typing
+import itertools
+import math
+from .vec3 import Vec3, eq3
+from .line3 import Line3, eq_line3
+from .plane3 import AnyPlane3, eq_plane3
+
+__all__ = ['group3', 'unique3', 'group_line3', 'unique_line3', 'group_plane3', 'unique_plane3']
+
+T = typing.TypeVar('T')
+
+def _group(
+    items: typing.Sequence[T],
+    tolerance: float,
+    components: typing.Callable[[T], typing.Tuple[float, ...]],
+    eq: typing.Callable[[T, T, float], bool],
+) -> typing.List[typing.List[int]]:
+    '''Groups items equal with tolerance.
+
+    Each group is represented by its first item. Representatives are kept in hash grid
+    with cell size of two tolerances. Component that is within tolerance from its value
+    lies either in the same cell or in the neighbor cell on the side of closer cell border.
+    So item is compared only with representatives from 2^D cells (D - number of components).
+    Item joins the first group whose representative it equals.
+    '''
+    cells: typing.Dict[typing.Tuple[int, ...], typing.List[int]] = {}
+    groups: typing.List[typing.List[int]] = []
+    for index, item in enumerate(items):
+        options = []
+        for value in components(item):
+            cell = value / (2 * tolerance)
+            key = math.floor(cell)
+            options.append((key, key - 1 if cell - key < 0.5 else key + 1))
+        found = None
+        for cell_key in itertools.product(*options):
+            for group in cells.get(cell_key, []):
+                if eq(items[groups[group][0]], item, tolerance):
+                    found = group
+                    break
+            if found is not None:
+                break
+        if found is None:
+            found = len(groups)
+            groups.append([])
+            cells.setdefault(tuple(key for (key, _) in options), []).append(found)
+        groups[found].append(index)
+    return groups
+
+def group3(points: typing.Sequence[Vec3], tolerance: float) -> typing.List[typing.List[int]]:
+    '''Groups indexes of vectors equal with tolerance (see `eq3`).'''
+    return _group(points, tolerance, tuple, eq3)
+
+def unique3(points: typing.Sequence[Vec3], tolerance: float) -> typing.List[Vec3]:
+    return [points[group[0]] for group in group3(points, tolerance)]
+
+def group_line3(lines: typing.Sequence[Line3], tolerance: float) -> typing.List[typing.List[int]]:
+    '''Groups indexes of lines equal with tolerance (see `eq_line3`).'''
+    return _group(lines, tolerance, lambda line: line.anchor + line.direction, eq_line3)
+
+def unique_line3(lines: typing.Sequence[Line3], tolerance: float) -> typing.List[Line3]:
+    return [lines[group[0]] for group in group_line3(lines, tolerance)]
+
+def group_plane3(
+    planes: typing.Sequence[AnyPlane3], tolerance: float,
+) -> typing.List[typing.List[int]]:
+    '''Groups indexes of planes equal with tolerance (see `eq_plane3`).'''
+    return _group(planes, tolerance, lambda plane: plane.normal + (plane.distance,), eq_plane3)
+
+def unique_plane3(planes: typing.Sequence[AnyPlane3], tolerance: float) -> typing.List[AnyPlane3]:
+    return [planes[group[0]] for group in group_plane3(planes, tolerance)]
@@ -0,0 +1,318 @@
+import typing
+import heapq
+import math
+from .vec3 import Vec3, add3, sub3, mul3, dot3, len3, is_zero3
+from .line3 import Line3
+from .segment3 import Segment3
+from .relations3 import point_segment_projection, line_line_intersection
+
+__all__ = ['IndexHit3', 'BVH3']
+
+# Box is kept as flat tuple (min_x, min_y, min_z, max_x, max_y, max_z).
+Box = typing.Tuple[float, float, float, float, float, float]
+
+class IndexHit3(typing.NamedTuple):
+    handle: int
+    distance: float
+
+class _Node: # pylint: disable=too-few-public-methods
+    __slots__ = ('box', 'parent', 'left', 'right', 'handles')
+
+    def __init__(self, box: Box, handles: typing.Optional[typing.List[int]] = None) -> None:
+        self.box = box
+        self.parent: typing.Optional[_Node] = None
+        self.left: typing.Optional[_Node] = None
+        self.right: typing.Optional[_Node] = None
+        self.handles = handles
+
+def _segment_box(segment: Line3) -> Box:
+    (ax, ay, az) = segment.anchor
+    (bx, by, bz) = add3(segment.anchor, segment.direction)
+    return (min(ax, bx), min(ay, by), min(az, bz), max(ax, bx), max(ay, by), max(az, bz))
+
+def _union_box(a: Box, b: Box) -> Box:
+    return (
+        min(a[0], b[0]), min(a[1], b[1]), min(a[2], b[2]),
+        max(a[3], b[3]), max(a[4], b[4]), max(a[5], b[5]),
+    )
+
+def _box_area(box: Box) -> float:
+    dx = box[3] - box[0]
+    dy = box[4] - box[1]
+    dz = box[5] - box[2]
+    return dx * dy + dy * dz + dz * dx
+
+def _box_point_distance(box: Box, point: Vec3) -> float:
+    (x, y, z) = point
+    dx = max(box[0] - x, 0, x - box[3])
+    dy = max(box[1] - y, 0, y - box[4])
+    dz = max(box[2] - z, 0, z - box[5])
+    return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+def _box_ray_hit(box: Box, ray: Line3, radius: float, max_t: float) -> bool:
+    '''Tests ray against box grown by radius (slab method).'''
+    t_min = 0.0
+    t_max = max_t
+    for axis in range(3):
+        origin = ray.anchor[axis]
+        direction = ray.direction[axis]
+        low = box[axis] - radius
+        high = box[axis + 3] + radius
+        if direction == 0:
+            if origin < low or origin > high:
+                return False
+            continue
+        t_low = (low - origin) / direction
+        t_high = (high - origin) / direction
+        if t_low > t_high:
+            (t_low, t_high) = (t_high, t_low)
+        t_min = max(t_min, t_low)
+        t_max = min(t_max, t_high)
+        if t_min > t_max:
+            return False
+    return True
+
+def _segment_point_closest(segment: Line3, point: Vec3) -> Vec3:
+    '''Finds segment point closest to target point, see `point_segment_projection`.'''
+    end = add3(segment.anchor, segment.direction)
+    return point_segment_projection(point, Segment3(start=segment.anchor, end=end))
+
+def _ray_point_closest(ray: Line3, point: Vec3) -> float:
+    '''Finds ray parameter of ray point closest to target point.'''
+    t = dot3(sub3(point, ray.anchor), ray.direction) / dot3(ray.direction, ray.direction)
+    return max(t, 0.0)
+
+def _ray_segment_closest(ray: Line3, segment: Line3) -> typing.Tuple[float, float]:
+    '''Finds closest approach of ray and segment. Gives ray parameter and distance.
+
+    Closest points are either inner points of both (found by `line_line_intersection`)
+    or one of them is an end point: ray origin or one of segment ends.
+    '''
+    candidates = []
+    if not is_zero3(segment.direction):
+        pair = line_line_intersection(ray, segment)
+        if pair is not None:
+            (ray_point, segment_point) = pair
+            ray_t = dot3(sub3(ray_point, ray.anchor), ray.direction) \
+                / dot3(ray.direction, ray.direction)
+            segment_t = dot3(sub3(segment_point, segment.anchor), segment.direction) \
+                / dot3(segment.direction, segment.direction)
+            if ray_t >= 0 and 0 <= segment_t <= 1:
+                candidates.append((len3(sub3(ray_point, segment_point)), ray_t))
+    origin_closest = _segment_point_closest(segment, ray.anchor)
+    candidates.append((len3(sub3(origin_closest, ray.anchor)), 0.0))
+    for end in (segment.anchor, add3(segment.anchor, segment.direction)):
+        ray_t = _ray_point_closest(ray, end)
+        ray_point = add3(ray.anchor, mul3(ray.direction, ray_t))
+        candidates.append((len3(sub3(ray_point, end)), ray_t))
+    (distance, ray_t) = min(candidates)
+    return ray_t, distance
+
+class BVH3:
+    '''Bounding volume hierarchy over points and segments.
+
+    Supports nearest, radius and ray queries with exact distances taken at leaves.
+    Items are identified by integer handles given on insertion.
+    Point is stored as segment with zero direction.
+    Lines and planes are unbounded and cannot be indexed.
+    '''
+
+    def __init__(self, leaf_size: int = 4) -> None:
+        self.leaf_size = leaf_size
+        self._root: typing.Optional[_Node] = None
+        self._segments: typing.Dict[int, Line3] = {}
+        self._boxes: typing.Dict[int, Box] = {}
+        self._leaves: typing.Dict[int, _Node] = {}
+        self._next_handle = 0
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def _add(self, segment: Line3) -> int:
+        handle = self._next_handle
+        self._next_handle += 1
+        self._segments[handle] = segment
+        self._boxes[handle] = _segment_box(segment)
+        return handle
+
+    def build(
+        self,
+        points: typing.Iterable[Vec3] = (),
+        segments: typing.Iterable[typing.Tuple[Vec3, Vec3]] = (),
+    ) -> typing.List[int]:
+        '''Adds items and rebuilds the whole tree. Gives handles of points then segments.'''
+        handles = [self._add(Line3(anchor=point, direction=Vec3(0, 0, 0))) for point in points]
+        handles.extend(
+            self._add(Line3(anchor=start, direction=sub3(end, start))) for (start, end) in segments
+        )
+        self._leaves.clear()
+        self._root = self._build_node(list(self._segments)) if self._segments else None
+        return handles
+
+    def _build_node(self, handles: typing.List[int]) -> _Node:
+        box = self._boxes[handles[0]]
+        for handle in handles:
+            box = _union_box(box, self._boxes[handle])
+        if len(handles) <= self.leaf_size:
+            node = _Node(box, handles)
+            for handle in handles:
+                self._leaves[handle] = node
+            return node
+        extents = [box[3] - box[0], box[4] - box[1], box[5] - box[2]]
+        axis = extents.index(max(extents))
+        handles.sort(key=lambda handle: self._boxes[handle][axis] + self._boxes[handle][axis + 3])
+        middle = len(handles) // 2
+        node = _Node(box)
+        node.left = self._build_node(handles[:middle])
+        node.right = self._build_node(handles[middle:])
+        node.left.parent = node
+        node.right.parent = node
+        return node
+
+    def insert_point(self, point: Vec3) -> int:
+        return self._insert(Line3(anchor=point, direction=Vec3(0, 0, 0)))
+
+    def insert_segment(self, start: Vec3, end: Vec3) -> int:
+        return self._insert(Line3(anchor=start, direction=sub3(end, start)))
+
+    def _insert(self, segment: Line3) -> int:
+        '''Inserts item into the leaf whose box grows least, splits leaf when it overflows.'''
+        handle = self._add(segment)
+        box = self._boxes[handle]
+        if self._root is None:
+            self._root = _Node(box, [handle])
+            self._leaves[handle] = self._root
+            return handle
+        node = self._root
+        while node.handles is None:
+            node.box = _union_box(node.box, box)
+            (left, right) = (typing.cast(_Node, node.left), typing.cast(_Node, node.right))
+            left_growth = _box_area(_union_box(left.box, box)) - _box_area(left.box)
+            right_growth = _box_area(_union_box(right.box, box)) - _box_area(right.box)
+            node = left if left_growth <= right_growth else right
+        node.box = _union_box(node.box, box)
+        node.handles.append(handle)
+        self._leaves[handle] = node
+        if len(node.handles) > self.leaf_size:
+            split = self._build_node(node.handles)
+            node.handles = None
+            node.left = split.left
+            node.right = split.right
+            typing.cast(_Node, node.left).parent = node
+            typing.cast(_Node, node.right).parent = node
+        return handle
+
+    def remove(self, handle: int) -> None:
+        '''Removes item, collapses emptied leaf into its sibling and refits boxes above.'''
+        leaf = self._leaves.pop(handle)
+        del self._segments[handle]
+        del self._boxes[handle]
+        handles = typing.cast(typing.List[int], leaf.handles)
+        handles.remove(handle)
+        node: typing.Optional[_Node] = leaf
+        if not handles:
+            parent = leaf.parent
+            if parent is None:
+                self._root = None
+                return
+            sibling = typing.cast(_Node, parent.right if parent.left is leaf else parent.left)
+            grand = parent.parent
+            sibling.parent = grand
+            if grand is None:
+                self._root = sibling
+            elif grand.left is parent:
+                grand.left = sibling
+            else:
+                grand.right = sibling
+            node = grand
+        while node is not None:
+            if node.handles is not None:
+                box = self._boxes[node.handles[0]]
+                for item in node.handles:
+                    box = _union_box(box, self._boxes[item])
+            else:
+                box = _union_box(
+                    typing.cast(_Node, node.left).box, typing.cast(_Node, node.right).box)
+            node.box = box
+            node = node.parent
+
+    def item_distance(self, handle: int, point: Vec3) -> float:
+        segment = self._segments[handle]
+        return len3(sub3(point, _segment_point_closest(segment, point)))
+
+    def nearest(self, point: Vec3, k: int = 1) -> typing.List[IndexHit3]:
+        '''Finds k items closest to point, ordered by distance.
+
+        Best-first traversal: nodes are visited in order of distance to their boxes
+        and search stops once the next box is farther than the current k-th item.
+        '''
+        if self._root is None or k <= 0:
+            return []
+        found: typing.List[typing.Tuple[float, int]] = []
+        queue = [(0.0, 0, self._root)]
+        counter = 1
+        while queue:
+            (box_distance, _, node) = heapq.heappop(queue)
+            if len(found) == k and box_distance > -found[0][0]:
+                break
+            if node.handles is not None:
+                for handle in node.handles:
+                    distance = self.item_distance(handle, point)
+                    if len(found) < k:
+                        heapq.heappush(found, (-distance, handle))
+                    elif distance < -found[0][0]:
+                        heapq.heapreplace(found, (-distance, handle))
+                continue
+            for child in (node.left, node.right):
+                child = typing.cast(_Node, child)
+                heapq.heappush(queue, (_box_point_distance(child.box, point), counter, child))
+                counter += 1
+        return [IndexHit3(handle, -distance) for (distance, handle) in sorted(found, reverse=True)]
+
+    def within(self, point: Vec3, radius: float) -> typing.List[IndexHit3]:
+        '''Finds all items not farther than radius from point, ordered by distance.'''
+        hits = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            if _box_point_distance(node.box, point) > radius:
+                continue
+            if node.handles is not None:
+                for handle in node.handles:
+                    distance = self.item_distance(handle, point)
+                    if distance <= radius:
+                        hits.append(IndexHit3(handle, distance))
+                continue
+            stack.append(typing.cast(_Node, node.left))
+            stack.append(typing.cast(_Node, node.right))
+        hits.sort(key=lambda hit: hit.distance)
+        return hits
+
+    def raycast(
+        self, ray: Line3, radius: float, max_distance: float = math.inf,
+    ) -> typing.List[IndexHit3]:
+        '''Finds items passing not farther than radius from ray.
+
+        Ray starts at line anchor and goes along line direction.
+        Hits are ordered by distance from ray origin to point of closest approach.
+        '''
+        if is_zero3(ray.direction):
+            raise ValueError('ray direction must be non-zero')
+        hits = []
+        ray_len = len3(ray.direction)
+        max_t = max_distance / ray_len
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            if not _box_ray_hit(node.box, ray, radius, max_t):
+                continue
+            if node.handles is not None:
+                for handle in node.handles:
+                    (ray_t, distance) = _ray_segment_closest(ray, self._segments[handle])
+                    if distance <= radius and ray_t <= max_t:
+                        hits.append(IndexHit3(handle, ray_t * ray_len))
+                continue
+            stack.append(typing.cast(_Node, node.left))
+            stack.append(typing.cast(_Node, node.right))
+        hits.sort(key=lambda hit: hit.distance)
+        return hits
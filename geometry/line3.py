@@ -1,5 +1,7 @@
 import typing
-from .vec3 import Vec3, ZERO3, XUNIT3, YUNIT3, ZUNIT3, eq3
+from .vec3 import Vec3, ZERO3, XUNIT3, YUNIT3, ZUNIT3, eq3, key3
+
+__all__ = ['Line3', 'OX3', 'OY3', 'OZ3', 'eq_line3', 'key_line3']
 
 class Line3(typing.NamedTuple):
     anchor: Vec3
@@ -15,5 +17,9 @@ OX3 = Line3(anchor=ZERO3, direction=XUNIT3)
 OY3 = Line3(anchor=ZERO3, direction=YUNIT3)
 OZ3 = Line3(anchor=ZERO3, direction=ZUNIT3)
 
-def eq_line3(a: Line3, b: Line3) -> bool:
-    return eq3(a.anchor, b.anchor) and eq3(a.direction, b.direction)
+def eq_line3(a: Line3, b: Line3, tolerance: typing.Optional[float] = None) -> bool:
+    return eq3(a.anchor, b.anchor, tolerance) and eq3(a.direction, b.direction, tolerance)
+
+def key_line3(line: Line3, tolerance: float) -> typing.Tuple[int, ...]:
+    '''Quantizes line anchor and direction, see `key3`.'''
+    return key3(line.anchor, tolerance) + key3(line.direction, tolerance)
@@ -0,0 +1,107 @@
+import typing
+import numpy as np
+import numpy.typing as npt
+from .vec3 import Vec3
+from .storage3 import PathLike, MmapMode, save_data, load_data
+from .vec3array import Vec3Array, Vec3Like, as_data3, float_data, isclose_data
+from .line3 import Line3
+
+__all__ = ['Line3View', 'Line3Array', 'save_line3_array', 'load_line3_array']
+
+class Line3View:
+    '''Line of `Line3Array` that shares memory with array buffer.'''
+    __slots__ = ('data',)
+
+    def __init__(self, data: np.ndarray) -> None:
+        self.data = data
+
+    @property
+    def anchor(self) -> np.ndarray:
+        return self.data[0:3]
+
+    @property
+    def direction(self) -> np.ndarray:
+        return self.data[3:6]
+
+    def to_line3(self) -> Line3:
+        (ax, ay, az, dx, dy, dz) = self.data.tolist()
+        return Line3(anchor=Vec3(ax, ay, az), direction=Vec3(dx, dy, dz))
+
+class Line3Array:
+    '''Array of lines stored as (N, 6) float64 or float32 buffer.
+
+    Each row keeps line anchor followed by line direction.
+    It takes 48 bytes per line, buffer can be saved to file and memory-mapped back.
+    '''
+    __slots__ = ('data',)
+
+    def __init__(
+        self, items: typing.Any = (), dtype: typing.Optional[npt.DTypeLike] = None,
+    ) -> None:
+        data = float_data(items, dtype)
+        if data.ndim == 3:
+            data = data.reshape(len(data), 6)
+        if data.size == 0:
+            data = data.reshape(0, 6)
+        if data.ndim != 2 or data.shape[1] != 6:
+            raise ValueError(f'expected (N, 6) shape, got {data.shape}')
+        self.data: np.ndarray = data
+
+    @staticmethod
+    def from_parts(anchor: Vec3Like, direction: Vec3Like) -> 'Line3Array':
+        (anchor_data, direction_data) = np.broadcast_arrays(as_data3(anchor), as_data3(direction))
+        return Line3Array(np.concatenate((anchor_data, direction_data), axis=1))
+
+    @property
+    def anchor(self) -> Vec3Array:
+        return Vec3Array(self.data[:, 0:3])
+
+    @property
+    def direction(self) -> Vec3Array:
+        return Vec3Array(self.data[:, 3:6])
+
+    def view(self, index: int) -> Line3View:
+        return Line3View(self.data[index])
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: typing.Any) -> typing.Any:
+        if isinstance(index, (int, np.integer)):
+            (ax, ay, az, dx, dy, dz) = self.data[index].tolist()
+            return Line3(anchor=Vec3(ax, ay, az), direction=Vec3(dx, dy, dz))
+        return Line3Array(self.data[index])
+
+    def __iter__(self) -> typing.Iterator[Line3]:
+        for (ax, ay, az, dx, dy, dz) in self.data.tolist():
+            yield Line3(anchor=Vec3(ax, ay, az), direction=Vec3(dx, dy, dz))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Line3Array) or len(self) != len(other):
+            return False
+        return bool(np.all(isclose_data(self.data, other.data)))
+
+    __hash__ = None # type: ignore
+
+    def __repr__(self) -> str:
+        return f'Line3Array({self.to_list()!r})'
+
+    def to_list(self) -> typing.List[Line3]:
+        return list(self)
+
+    def astype(self, dtype: npt.DTypeLike) -> 'Line3Array':
+        return Line3Array(self.data, dtype)
+
+Line3Like = typing.Union[Line3Array, Line3]
+
+def as_line_data3(line: Line3Like) -> np.ndarray:
+    '''Gives (N, 6) buffer of array or (1, 6) buffer of single line.'''
+    if isinstance(line, Line3Array):
+        return line.data
+    return np.asarray(line, dtype=np.float64).reshape(1, 6)
+
+def save_line3_array(path: PathLike, lines: Line3Array) -> None:
+    save_data(path, lines.data)
+
+def load_line3_array(path: PathLike, mmap_mode: MmapMode = 'r') -> Line3Array:
+    return Line3Array(load_data(path, 6, mmap_mode))
@@ -0,0 +1,160 @@
+import typing
+import numpy as np
+from .vec3 import Vec3
+from .vec3array import Vec3Like, as_data3
+from .line3array import Line3Like, as_line_data3
+from .plane3array import Plane3Like, as_plane_data3
+from .relations3array import (
+    NO_INTERSECTION, point_line_distance_data, point_line_projection_data,
+    point_plane_signed_distance_data, line_line_distance_data, line_line_intersection_data,
+)
+
+__all__ = [
+    'line_line_distance_matrix', 'line_line_closest_points_matrix', 'point_line_distance_matrix',
+    'point_plane_distance_matrix', 'line_line_nearest_pairs', 'point_line_nearest_pairs',
+    'point_plane_nearest_pairs', 'line_line_closest_pair',
+]
+
+# Rows of the first set are evaluated in blocks of about this many pairs,
+# so temporary buffers do not depend on size of sets.
+BLOCK_SIZE = 1 << 18
+
+# Distances of block of rows of the first set to all items of the second one.
+BlockFunc = typing.Callable[[slice], np.ndarray]
+
+# Indexes into the first set, indexes into the second set and distances of pairs.
+Pairs = typing.Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+def _blocks(count: int, other_count: int, block_size: int) -> typing.Iterator[slice]:
+    rows = max(1, block_size // max(other_count, 1))
+    for start in range(0, count, rows):
+        yield slice(start, min(start + rows, count))
+
+def _matrix(count: int, other_count: int, block: BlockFunc, block_size: int) -> np.ndarray:
+    result = np.empty((count, other_count))
+    for rows in _blocks(count, other_count, block_size):
+        result[rows] = block(rows)
+    return result
+
+def _nearest(count: int, other_count: int, block: BlockFunc, k: int, block_size: int) -> Pairs:
+    '''Keeps k least distances over blocks, matrix is never built as a whole.'''
+    best_index = np.empty(0, dtype=np.int64)
+    best_distance = np.empty(0)
+    for rows in _blocks(count, other_count, block_size):
+        distances = np.concatenate((best_distance, block(rows).ravel()))
+        indexes = np.concatenate((best_index, rows.start * other_count + np.arange(
+            (rows.stop - rows.start) * other_count)))
+        if len(distances) > k:
+            keep = np.argpartition(distances, k - 1)[:k]
+            (distances, indexes) = (distances[keep], indexes[keep])
+        (best_distance, best_index) = (distances, indexes)
+    order = np.argsort(best_distance, kind='stable')
+    (a_index, b_index) = np.divmod(best_index[order], max(other_count, 1))
+    return a_index, b_index, best_distance[order]
+
+def _line_line_block(a_lines: np.ndarray, b_lines: np.ndarray) -> BlockFunc:
+    return lambda rows: line_line_distance_data(
+        a_lines[rows, np.newaxis, 0:3], a_lines[rows, np.newaxis, 3:6],
+        b_lines[:, 0:3], b_lines[:, 3:6],
+    )
+
+def _point_line_block(points: np.ndarray, lines: np.ndarray) -> BlockFunc:
+    return lambda rows: point_line_distance_data(
+        points[rows, np.newaxis], lines[:, 0:3], lines[:, 3:6],
+    )
+
+def _point_plane_block(points: np.ndarray, planes: np.ndarray) -> BlockFunc:
+    return lambda rows: np.abs(point_plane_signed_distance_data(
+        points[rows, np.newaxis], planes[:, 0:3], planes[:, 3],
+    ))
+
+def line_line_distance_matrix(
+    a_line: Line3Like, b_line: Line3Like, block_size: int = BLOCK_SIZE,
+) -> np.ndarray:
+    '''Gives (N, M) distances between each line of the first set and each of the second.'''
+    (a_lines, b_lines) = (as_line_data3(a_line), as_line_data3(b_line))
+    return _matrix(len(a_lines), len(b_lines), _line_line_block(a_lines, b_lines), block_size)
+
+def line_line_closest_points_matrix(
+    a_line: Line3Like, b_line: Line3Like, block_size: int = BLOCK_SIZE,
+) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''Gives (N, M) status and (N, M, 3) closest points of each pair of lines.
+
+    See `line_line_intersection_array`, points are NaN for collinear lines.
+    '''
+    (a_lines, b_lines) = (as_line_data3(a_line), as_line_data3(b_line))
+    (count, other_count) = (len(a_lines), len(b_lines))
+    status = np.empty((count, other_count), dtype=np.int8)
+    a_points = np.empty((count, other_count, 3))
+    b_points = np.empty((count, other_count, 3))
+    for rows in _blocks(count, other_count, block_size):
+        (status[rows], a_points[rows], b_points[rows]) = line_line_intersection_data(
+            a_lines[rows, np.newaxis, 0:3], a_lines[rows, np.newaxis, 3:6],
+            b_lines[:, 0:3], b_lines[:, 3:6],
+        )
+    return status, a_points, b_points
+
+def point_line_distance_matrix(
+    target_point: Vec3Like, line: Line3Like, block_size: int = BLOCK_SIZE,
+) -> np.ndarray:
+    '''Gives (N, M) distances between each point and each line.'''
+    (points, lines) = (as_data3(target_point), as_line_data3(line))
+    return _matrix(len(points), len(lines), _point_line_block(points, lines), block_size)
+
+def point_plane_distance_matrix(
+    target_point: Vec3Like, plane: Plane3Like, block_size: int = BLOCK_SIZE,
+) -> np.ndarray:
+    '''Gives (N, M) distances between each point and each plane.'''
+    (points, planes) = (as_data3(target_point), as_plane_data3(plane))
+    return _matrix(len(points), len(planes), _point_plane_block(points, planes), block_size)
+
+def line_line_nearest_pairs(
+    a_line: Line3Like, b_line: Line3Like, k: int, block_size: int = BLOCK_SIZE,
+) -> Pairs:
+    '''Gives k pairs of lines with the least distances, nearest first.
+
+    Result is indexes into the first set, indexes into the second set and distances.
+    Memory is bounded by block size and k, not by number of pairs.
+    '''
+    (a_lines, b_lines) = (as_line_data3(a_line), as_line_data3(b_line))
+    return _nearest(
+        len(a_lines), len(b_lines), _line_line_block(a_lines, b_lines), k, block_size)
+
+def point_line_nearest_pairs(
+    target_point: Vec3Like, line: Line3Like, k: int, block_size: int = BLOCK_SIZE,
+) -> Pairs:
+    '''Gives k pairs of point and line with the least distances, see `line_line_nearest_pairs`.'''
+    (points, lines) = (as_data3(target_point), as_line_data3(line))
+    return _nearest(len(points), len(lines), _point_line_block(points, lines), k, block_size)
+
+def point_plane_nearest_pairs(
+    target_point: Vec3Like, plane: Plane3Like, k: int, block_size: int = BLOCK_SIZE,
+) -> Pairs:
+    '''Gives k pairs of point and plane with the least distances, see `line_line_nearest_pairs`.'''
+    (points, planes) = (as_data3(target_point), as_plane_data3(plane))
+    return _nearest(len(points), len(planes), _point_plane_block(points, planes), k, block_size)
+
+def line_line_closest_pair(
+    a_line: Line3Like, b_line: Line3Like, block_size: int = BLOCK_SIZE,
+) -> typing.Optional[typing.Tuple[int, int, Vec3, Vec3]]:
+    '''Finds the nearest pair of lines across two sets and its closest points.
+
+    For collinear lines closest points are anchor of the first line and its projection
+    onto the second one. Gives `None` if any set is empty.
+    '''
+    (a_lines, b_lines) = (as_line_data3(a_line), as_line_data3(b_line))
+    (a_index, b_index, _) = line_line_nearest_pairs(a_line, b_line, 1, block_size)
+    if len(a_index) == 0:
+        return None
+    (a_row, b_row) = (a_lines[a_index[0]], b_lines[b_index[0]])
+    (status, a_point, b_point) = line_line_intersection_data(
+        a_row[0:3], a_row[3:6], b_row[0:3], b_row[3:6],
+    )
+    if status == NO_INTERSECTION:
+        (a_point, b_point) = (a_row[0:3], point_line_projection_data(
+            a_row[0:3], b_row[0:3], b_row[3:6],
+        ))
+    return (
+        int(a_index[0]), int(b_index[0]),
+        Vec3(*a_point.tolist()), Vec3(*b_point.tolist()),
+    )
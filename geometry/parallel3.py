@@ -0,0 +1,143 @@
+import typing
+import collections
+import concurrent.futures
+import os
+from multiprocessing import shared_memory
+import numpy as np
+from .vec3array import Vec3Array
+from .line3array import Line3Array
+from .plane3array import Plane3Array
+
+__all__ = ['ParallelExecutor3', 'gather']
+
+ARRAY_TYPES = (Vec3Array, Line3Array, Plane3Array)
+
+Func = typing.Callable[..., typing.Any]
+
+class _SharedArg(typing.NamedTuple):
+    array_type: type
+    name: str
+    shape: typing.Tuple[int, ...]
+    dtype: np.dtype
+
+# Shared memory blocks attached by worker process, kept while its tasks refer to them.
+_attached: typing.Dict[str, shared_memory.SharedMemory] = {}
+
+def _attach(arg: _SharedArg, start: int, stop: int) -> typing.Any:
+    block = _attached.get(arg.name)
+    if block is None:
+        block = shared_memory.SharedMemory(name=arg.name)
+        _attached[arg.name] = block
+    data: np.ndarray = np.ndarray(arg.shape, dtype=arg.dtype, buffer=block.buf)
+    return arg.array_type(data[start:stop])
+
+def _run_shared_chunk(
+    func: Func, args: typing.Sequence[typing.Any], start: int, stop: int,
+) -> typing.Any:
+    names = {arg.name for arg in args if isinstance(arg, _SharedArg)}
+    for name in [name for name in _attached if name not in names]:
+        try:
+            _attached.pop(name).close()
+        except BufferError:
+            pass
+    return func(*(
+        _attach(arg, start, stop) if isinstance(arg, _SharedArg) else arg for arg in args
+    ))
+
+def _run_chunk(func: Func, args: typing.Sequence[typing.Any], start: int, stop: int) -> typing.Any:
+    return func(*(arg[start:stop] if isinstance(arg, ARRAY_TYPES) else arg for arg in args))
+
+def _row_count(args: typing.Sequence[typing.Any]) -> int:
+    counts = {len(arg) for arg in args if isinstance(arg, ARRAY_TYPES)}
+    if len(counts) != 1:
+        raise ValueError('expected one or more array arguments of same length')
+    return counts.pop()
+
+class ParallelExecutor3:
+    '''Runs batched functions (such as `relations3array` ones) over chunks of rows in parallel.
+
+    Array arguments (`Vec3Array`, `Line3Array`, `Plane3Array`) are split into chunks of rows,
+    other arguments (single `Vec3`, `Plane3`, ...) are passed to each chunk as is.
+    With processes array buffers are copied once into shared memory which workers attach to,
+    so rows are not pickled. With threads chunks are views and work is parallel
+    as long as function spends its time in NumPy code that releases GIL.
+    Results of chunks are given in order of chunks.
+    '''
+
+    def __init__(
+        self,
+        workers: typing.Optional[int] = None,
+        chunk_size: int = 65536,
+        use_threads: bool = False,
+    ) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.use_threads = use_threads
+        self._pool: concurrent.futures.Executor = (
+            concurrent.futures.ThreadPoolExecutor(self.workers) if use_threads
+            else concurrent.futures.ProcessPoolExecutor(self.workers)
+        )
+
+    def __enter__(self) -> 'ParallelExecutor3':
+        return self
+
+    def __exit__(self, *_: typing.Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._pool.shutdown()
+
+    def map(self, func: Func, *args: typing.Any) -> typing.Iterator[typing.Any]:
+        '''Gives results of `func` for consecutive chunks of rows.
+
+        At most two chunks per worker are in flight, so results that are not consumed yet
+        do not pile up in memory. Empty arrays are run as one empty chunk, so result
+        has dtype and shape of what `func` gives for no rows.
+        '''
+        count = _row_count(args)
+        blocks: typing.List[shared_memory.SharedMemory] = []
+        try:
+            if self.use_threads:
+                (run, task_args) = (_run_chunk, list(args))
+            else:
+                (run, task_args) = (_run_shared_chunk, [self._share(arg, blocks) for arg in args])
+            pending: typing.Deque[concurrent.futures.Future] = collections.deque()
+            for start in range(0, max(count, 1), self.chunk_size):
+                stop = min(start + self.chunk_size, count)
+                pending.append(self._pool.submit(run, func, task_args, start, stop))
+                if len(pending) >= 2 * self.workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    @staticmethod
+    def _share(arg: typing.Any, blocks: typing.List[shared_memory.SharedMemory]) -> typing.Any:
+        if not isinstance(arg, ARRAY_TYPES):
+            return arg
+        block = shared_memory.SharedMemory(create=True, size=max(arg.data.nbytes, 1))
+        blocks.append(block)
+        data: np.ndarray = np.ndarray(arg.data.shape, dtype=arg.data.dtype, buffer=block.buf)
+        data[:] = arg.data
+        return _SharedArg(type(arg), block.name, arg.data.shape, arg.data.dtype)
+
+    def run(self, func: Func, *args: typing.Any) -> typing.Any:
+        '''Gives result of `func` for all rows, see `gather`.'''
+        return gather(list(self.map(func, *args)))
+
+def gather(chunks: typing.Sequence[typing.Any]) -> typing.Any:
+    '''Joins results of chunks into one result.
+
+    Arrays are concatenated, tuples (such as status and points) are joined item by item.
+    '''
+    if not chunks:
+        raise ValueError('expected one or more chunks')
+    first = chunks[0]
+    if isinstance(first, tuple):
+        return tuple(gather([chunk[i] for chunk in chunks]) for i in range(len(first)))
+    if isinstance(first, ARRAY_TYPES):
+        return type(first)(np.concatenate([chunk.data for chunk in chunks]))
+    return np.concatenate(chunks)
@@ -1,6 +1,10 @@
 import typing
 import math
-from .vec3 import Vec3, XUNIT3, YUNIT3, ZUNIT3, eq3
+from .vec3 import Vec3, XUNIT3, YUNIT3, ZUNIT3, eq3, key3, norm3, mul3
+
+__all__ = [
+    'Plane3', 'PreparedPlane3', 'XOY3', 'YOZ3', 'ZOX3', 'eq_plane3', 'key_plane3', 'prepare_plane3',
+]
 
 class Plane3(typing.NamedTuple):
     normal: Vec3
@@ -12,9 +16,51 @@ class Plane3(typing.NamedTuple):
         except: # pylint: disable=bare-except
             return False
 
+    @property
+    def unit_normal(self) -> Vec3:
+        return norm3(self.normal)
+
+    @property
+    def origin(self) -> Vec3:
+        return mul3(norm3(self.normal), self.distance)
+
+class PreparedPlane3(typing.NamedTuple):
+    '''Plane with precomputed unit normal and origin (plane point closest to (0,0,0)).
+
+    Can be passed wherever `Plane3` is expected.
+    Saves normalization of plane normal on each call when plane is used many times.
+    '''
+    normal: Vec3
+    distance: float
+    unit_normal: Vec3
+    origin: Vec3
+
+    def __eq__(self, other: object) -> bool:
+        try:
+            return eq_plane3(self, typing.cast(Plane3, other))
+        except: # pylint: disable=bare-except
+            return False
+
+AnyPlane3 = typing.Union[Plane3, PreparedPlane3]
+
 XOY3 = Plane3(normal=ZUNIT3, distance=0)
 YOZ3 = Plane3(normal=XUNIT3, distance=0)
 ZOX3 = Plane3(normal=YUNIT3, distance=0)
 
-def eq_plane3(a: Plane3, b: Plane3) -> bool:
+def eq_plane3(a: AnyPlane3, b: AnyPlane3, tolerance: typing.Optional[float] = None) -> bool:
+    if tolerance is not None:
+        return eq3(a.normal, b.normal, tolerance) and abs(a.distance - b.distance) <= tolerance
     return eq3(a.normal, b.normal) and math.isclose(a.distance, b.distance)
+
+def key_plane3(plane: AnyPlane3, tolerance: float) -> typing.Tuple[int, ...]:
+    '''Quantizes plane normal and distance, see `key3`.'''
+    return key3(plane.normal, tolerance) + (math.floor(plane.distance / tolerance),)
+
+def prepare_plane3(plane: AnyPlane3) -> PreparedPlane3:
+    unit_normal = norm3(plane.normal)
+    return PreparedPlane3(
+        normal=plane.normal,
+        distance=plane.distance,
+        unit_normal=unit_normal,
+        origin=mul3(unit_normal, plane.distance),
+    )
@@ -0,0 +1,111 @@
+import typing
+import numpy as np
+import numpy.typing as npt
+from .vec3 import Vec3
+from .storage3 import PathLike, MmapMode, save_data, load_data
+from .vec3array import Vec3Array, Vec3Like, Scalars, as_data3, float_data, isclose_data
+from .plane3 import Plane3, PreparedPlane3, AnyPlane3
+
+__all__ = ['Plane3View', 'Plane3Array', 'save_plane3_array', 'load_plane3_array']
+
+class Plane3View:
+    '''Plane of `Plane3Array` that shares memory with array buffer.'''
+    __slots__ = ('data',)
+
+    def __init__(self, data: np.ndarray) -> None:
+        self.data = data
+
+    @property
+    def normal(self) -> np.ndarray:
+        return self.data[0:3]
+
+    @property
+    def distance(self) -> float:
+        return float(self.data[3])
+
+    def to_plane3(self) -> Plane3:
+        (nx, ny, nz, distance) = self.data.tolist()
+        return Plane3(normal=Vec3(nx, ny, nz), distance=distance)
+
+class Plane3Array:
+    '''Array of planes stored as (N, 4) float64 or float32 buffer.
+
+    Each row keeps plane normal followed by plane distance.
+    It takes 32 bytes per plane, buffer can be saved to file and memory-mapped back.
+    '''
+    __slots__ = ('data',)
+
+    def __init__(
+        self, items: typing.Any = (), dtype: typing.Optional[npt.DTypeLike] = None,
+    ) -> None:
+        if isinstance(items, (list, tuple)) and items \
+                and isinstance(items[0], (Plane3, PreparedPlane3)):
+            items = [(*plane.normal, plane.distance) for plane in items]
+        data = float_data(items, dtype)
+        if data.size == 0:
+            data = data.reshape(0, 4)
+        if data.ndim != 2 or data.shape[1] != 4:
+            raise ValueError(f'expected (N, 4) shape, got {data.shape}')
+        self.data: np.ndarray = data
+
+    @staticmethod
+    def from_parts(normal: Vec3Like, distance: Scalars) -> 'Plane3Array':
+        distance_data = float_data(distance).reshape(-1, 1)
+        (normal_data, distance_data) = np.broadcast_arrays(as_data3(normal), distance_data)
+        return Plane3Array(np.concatenate((normal_data, distance_data[:, :1]), axis=1))
+
+    @property
+    def normal(self) -> Vec3Array:
+        return Vec3Array(self.data[:, 0:3])
+
+    @property
+    def distance(self) -> np.ndarray:
+        return self.data[:, 3]
+
+    def view(self, index: int) -> Plane3View:
+        return Plane3View(self.data[index])
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: typing.Any) -> typing.Any:
+        if isinstance(index, (int, np.integer)):
+            (nx, ny, nz, distance) = self.data[index].tolist()
+            return Plane3(normal=Vec3(nx, ny, nz), distance=distance)
+        return Plane3Array(self.data[index])
+
+    def __iter__(self) -> typing.Iterator[Plane3]:
+        for (nx, ny, nz, distance) in self.data.tolist():
+            yield Plane3(normal=Vec3(nx, ny, nz), distance=distance)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Plane3Array) or len(self) != len(other):
+            return False
+        return bool(np.all(isclose_data(self.data, other.data)))
+
+    __hash__ = None # type: ignore
+
+    def __repr__(self) -> str:
+        return f'Plane3Array({self.to_list()!r})'
+
+    def to_list(self) -> typing.List[Plane3]:
+        return list(self)
+
+    def astype(self, dtype: npt.DTypeLike) -> 'Plane3Array':
+        return Plane3Array(self.data, dtype)
+
+Plane3Like = typing.Union[Plane3Array, AnyPlane3]
+
+def as_plane_data3(plane: Plane3Like) -> np.ndarray:
+    '''Gives (N, 4) buffer of array or (1, 4) buffer of single plane.'''
+    if isinstance(plane, Plane3Array):
+        return plane.data
+    (nx, ny, nz) = plane.normal
+    distance = plane.distance
+    return np.array([(nx, ny, nz, distance)], dtype=np.float64)
+
+def save_plane3_array(path: PathLike, planes: Plane3Array) -> None:
+    save_data(path, planes.data)
+
+def load_plane3_array(path: PathLike, mmap_mode: MmapMode = 'r') -> Plane3Array:
+    return Plane3Array(load_data(path, 4, mmap_mode))
@@ -0,0 +1,155 @@
+import typing
+import functools
+import json
+import sys
+import time
+import types
+from . import relations3
+from .vec3 import Vec3, collinear3
+from .line3 import Line3
+from .segment3 import Segment3
+from .ray3 import Ray3
+
+__all__ = ['OUTCOMES', 'FunctionStats3', 'Profiler3']
+
+# Outcome of call by its arguments and result.
+Outcome = typing.Callable[[typing.Tuple[typing.Any, ...], typing.Any], str]
+
+def _kind(result: typing.Any) -> str:
+    if result is None:
+        return 'none'
+    if isinstance(result, Vec3):
+        return 'point'
+    if isinstance(result, Line3):
+        return 'line'
+    if isinstance(result, (Segment3, Ray3)):
+        return 'contained'
+    return 'points'
+
+# Branches of `relations3` functions, degenerate ones are `none` (parallel or collinear),
+# `contained` (ray or segment in plane), `line` (line in plane), `collinear` and `orthogonal`.
+OUTCOMES: typing.Dict[str, Outcome] = {
+    'line_plane_intersection': lambda _, result: _kind(result),
+    'ray_plane_intersection': lambda _, result: _kind(result),
+    'segment_plane_intersection': lambda _, result: _kind(result),
+    'line_line_intersection': lambda _, result: _kind(result),
+    'plane_plane_intersection': lambda _, result: _kind(result),
+    'ray_triangle_intersection': lambda _, result: _kind(result),
+    'segment_triangle_intersection': lambda _, result: _kind(result),
+    'line_line_distance': lambda args, _: (
+        'collinear' if collinear3(args[0].direction, args[1].direction) else 'skew'
+    ),
+    'line_plane_projection': lambda args, _: (
+        'orthogonal' if collinear3(args[0].direction, args[1].normal) else 'oblique'
+    ),
+}
+
+class FunctionStats3: # pylint: disable=too-few-public-methods
+    __slots__ = ('calls', 'total_time', 'outcomes')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        # Seconds including nested calls of other profiled functions.
+        self.total_time = 0.0
+        self.outcomes: typing.Dict[str, int] = {}
+
+def _public_functions(
+    module: types.ModuleType,
+) -> typing.Dict[str, typing.Callable[..., typing.Any]]:
+    return {
+        name: value for (name, value) in vars(module).items()
+        if callable(value) and not name.startswith('_') and not isinstance(value, type)
+        and getattr(value, '__module__', None) == module.__name__
+    }
+
+class Profiler3:
+    '''Counts calls, time and branch outcomes of public functions of modules.
+
+    When enabled, functions are replaced by counting wrappers in their modules, in the package
+    and in every loaded module of the package that imported them by name (such as `index3`).
+    When disabled, original functions are put back, so profiling costs nothing.
+    Not thread safe: counters of calls from several threads may be lost.
+    '''
+
+    def __init__(self, modules: typing.Sequence[types.ModuleType] = (relations3,)) -> None:
+        self.modules = modules
+        self.stats: typing.Dict[str, FunctionStats3] = {}
+        self._patched: typing.List[typing.Tuple[types.ModuleType, str, typing.Any]] = []
+
+    def __enter__(self) -> 'Profiler3':
+        self.enable()
+        return self
+
+    def __exit__(self, *_: typing.Any) -> None:
+        self.disable()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._patched)
+
+    def enable(self) -> None:
+        if self.enabled:
+            raise RuntimeError('profiler is already enabled')
+        wrappers = {}
+        for module in self.modules:
+            for (name, func) in _public_functions(module).items():
+                wrappers[id(func)] = (func, self._wrap(f'{module.__name__}.{name}', func, name))
+        package = __name__.rpartition('.')[0]
+        for module in list(sys.modules.values()):
+            module_name = getattr(module, '__name__', '')
+            if module_name == __name__ or (
+                module_name != package and not module_name.startswith(package + '.')):
+                continue
+            for (name, value) in list(vars(module).items()):
+                found = wrappers.get(id(value))
+                if found is not None and found[0] is value:
+                    self._patched.append((module, name, value))
+                    setattr(module, name, found[1])
+
+    def disable(self) -> None:
+        while self._patched:
+            (module, name, value) = self._patched.pop()
+            setattr(module, name, value)
+
+    def _wrap(
+        self, qualified_name: str, func: typing.Callable[..., typing.Any], name: str,
+    ) -> typing.Callable[..., typing.Any]:
+        stats = self.stats.setdefault(qualified_name, FunctionStats3())
+        outcome = OUTCOMES.get(name)
+
+        @functools.wraps(func)
+        def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            stats.total_time += time.perf_counter() - start
+            stats.calls += 1
+            if outcome is not None:
+                key = outcome(args + tuple(kwargs.values()), result)
+                stats.outcomes[key] = stats.outcomes.get(key, 0) + 1
+            return result
+        return wrapper
+
+    def reset(self) -> None:
+        for stats in self.stats.values():
+            stats.calls = 0
+            stats.total_time = 0.0
+            stats.outcomes.clear()
+
+    def snapshot(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        '''Gives stats of called functions by qualified name, the most time consuming first.'''
+        called = sorted(
+            ((name, stats) for (name, stats) in self.stats.items() if stats.calls),
+            key=lambda item: -item[1].total_time,
+        )
+        return {
+            name: {
+                'calls': stats.calls,
+                'total_time': stats.total_time,
+                'mean_time': stats.total_time / stats.calls,
+                'outcomes': dict(stats.outcomes),
+            }
+            for (name, stats) in called
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
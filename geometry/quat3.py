@@ -0,0 +1,141 @@
+import typing
+import math
+from .vec3 import (
+    Vec3, ZERO3, XUNIT3, YUNIT3, add3, mul3, dot3, len3, norm3, cross3, is_zero3,
+)
+from .line3 import Line3
+from .transform3 import Mat3, Transform3, transpose_mat3
+
+__all__ = [
+    'Quat3', 'IDENTITY_QUAT3', 'eq_quat3', 'norm_quat3', 'axis_angle_quat3', 'between_quat3',
+    'compose_quat3', 'inverse_quat3', 'slerp_quat3', 'quat_mat3', 'quat_transform3',
+    'quat_axis_angle3', 'rotate_point3', 'rotate_line3',
+]
+
+class Quat3(typing.NamedTuple):
+    '''Rotation quaternion `w + x * i + y * j + z * k`.
+
+    Rotation around unit axis `n` by angle `a` is `(cos(a / 2), n * sin(a / 2))`.
+    Functions below expect unit quaternions, which constructors give.
+    Quaternions `q` and `-q` give the same rotation but are not equal.
+    '''
+    w: float
+    x: float
+    y: float
+    z: float
+
+    def __eq__(self, other: object) -> bool:
+        try:
+            return eq_quat3(self, typing.cast(Quat3, other))
+        except: # pylint: disable=bare-except
+            return False
+
+IDENTITY_QUAT3 = Quat3(1, 0, 0, 0)
+
+def eq_quat3(a: Quat3, b: Quat3, tolerance: typing.Optional[float] = None) -> bool:
+    '''Compares quaternions component by component, see `eq3`.'''
+    if tolerance is not None:
+        return all(abs(x - y) <= tolerance for (x, y) in zip(a, b))
+    return all(math.isclose(x, y) for (x, y) in zip(a, b))
+
+def norm_quat3(q: Quat3) -> Quat3:
+    (w, x, y, z) = q
+    q_len = math.sqrt(w * w + x * x + y * y + z * z)
+    return Quat3(w / q_len, x / q_len, y / q_len, z / q_len)
+
+def axis_angle_quat3(axis: Vec3, angle: float) -> Quat3:
+    '''Makes rotation around axis by angle, same as `rotation3`.'''
+    s = math.sin(angle / 2)
+    (nx, ny, nz) = norm3(axis)
+    return Quat3(math.cos(angle / 2), nx * s, ny * s, nz * s)
+
+def _orthogonal3(v: Vec3) -> Vec3:
+    '''Gives vector orthogonal to v, crossing with the least collinear unit axis.'''
+    (vx, vy, _) = v
+    return cross3(v, XUNIT3 if abs(vx) <= abs(vy) else YUNIT3)
+
+def between_quat3(a: Vec3, b: Vec3) -> Quat3:
+    '''Makes the shortest rotation that turns direction of a to direction of b.
+
+    Axis is `a x b` and angle is `atan2(|a x b|, (a, b))`, which unlike `angle3` does not
+    fail on (nearly) collinear vectors. Opposite vectors are turned by half turn around
+    any axis orthogonal to them.
+    '''
+    if is_zero3(a) or is_zero3(b):
+        raise ValueError('vectors must not be zero')
+    axis = cross3(a, b)
+    angle = math.atan2(len3(axis), dot3(a, b))
+    if is_zero3(axis):
+        axis = _orthogonal3(a)
+    return axis_angle_quat3(axis, angle)
+
+def compose_quat3(outer: Quat3, inner: Quat3) -> Quat3:
+    '''Makes rotation that applies `inner` and then `outer` (Hamilton product).'''
+    (aw, ax, ay, az) = outer
+    (bw, bx, by, bz) = inner
+    return Quat3(
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    )
+
+def inverse_quat3(q: Quat3) -> Quat3:
+    '''Inverts rotation, inverse of unit quaternion is its conjugate.'''
+    (w, x, y, z) = q
+    return Quat3(w, -x, -y, -z)
+
+def slerp_quat3(a: Quat3, b: Quat3, t: float) -> Quat3:
+    '''Interpolates rotations along the shortest arc with constant angular speed.
+
+    Angle between quaternions is `theta = 2 * atan2(|a - b|, |a + b|)`, which unlike
+    `acos((a, b))` stays accurate for close quaternions. Then
+    `slerp = a * sin((1 - t) * theta) / sin(theta) + b * sin(t * theta) / sin(theta)`.
+    If `(a, b) < 0` then b is negated, so that the shorter of two arcs is taken.
+    '''
+    if sum(x * y for (x, y) in zip(a, b)) < 0:
+        b = Quat3(*(-y for y in b))
+    diff = math.sqrt(sum((x - y) ** 2 for (x, y) in zip(a, b)))
+    total = math.sqrt(sum((x + y) ** 2 for (x, y) in zip(a, b)))
+    theta = 2 * math.atan2(diff, total)
+    if theta == 0:
+        return a
+    a_k = math.sin((1 - t) * theta) / math.sin(theta)
+    b_k = math.sin(t * theta) / math.sin(theta)
+    return norm_quat3(Quat3(*(x * a_k + y * b_k for (x, y) in zip(a, b))))
+
+def quat_mat3(q: Quat3) -> Mat3:
+    '''Gives rotation matrix, same as one of `rotation3`.'''
+    (w, x, y, z) = q
+    return (
+        Vec3(1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)),
+        Vec3(2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)),
+        Vec3(2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)),
+    )
+
+def quat_transform3(q: Quat3) -> Transform3:
+    '''Gives rotation as transform, so it can be composed with translations and scalings.'''
+    matrix = quat_mat3(q)
+    return Transform3(matrix=matrix, offset=ZERO3, inverse_matrix=transpose_mat3(matrix))
+
+def quat_axis_angle3(q: Quat3) -> typing.Tuple[Vec3, float]:
+    '''Gives unit axis and angle in [0, 2 * pi] of rotation, axis is X for identity.'''
+    (w, x, y, z) = q
+    axis = Vec3(x, y, z)
+    axis_len = len3(axis)
+    if axis_len == 0:
+        return XUNIT3, 0.0
+    return mul3(axis, 1 / axis_len), 2 * math.atan2(axis_len, w)
+
+def rotate_point3(q: Quat3, point: Vec3) -> Vec3:
+    '''Rotates point around (0,0,0).
+
+    For `q = (w, u)` rotated point is `p + 2 * w * (u x p) + 2 * u x (u x p)`.
+    '''
+    (w, x, y, z) = q
+    u = Vec3(x, y, z)
+    u_p = cross3(u, point)
+    return add3(point, add3(mul3(u_p, 2 * w), mul3(cross3(u, u_p), 2)))
+
+def rotate_line3(q: Quat3, line: Line3) -> Line3:
+    return Line3(anchor=rotate_point3(q, line.anchor), direction=rotate_point3(q, line.direction))
@@ -0,0 +1,172 @@
+import typing
+import numpy as np
+import numpy.typing as npt
+from .vec3array import (
+    Vec3Array, Vec3Like, Scalars, as_data3, float_data, isclose_data, iszero_data, dot_data,
+    norm_data, cross_data,
+)
+from .line3array import Line3Array, Line3Like, as_line_data3
+from .quat3 import Quat3
+
+__all__ = [
+    'Quat3Array', 'axis_angle_quat3_array', 'between_quat3_array', 'compose_quat3_array',
+    'inverse_quat3_array', 'norm_quat3_array', 'slerp_quat3_array', 'quat_mat3_array',
+    'rotate_point3_array', 'rotate_line3_array',
+]
+
+class Quat3Array:
+    '''Array of rotation quaternions stored as (N, 4) float64 or float32 buffer.
+
+    Each row keeps w, x, y, z, see `Quat3`.
+    Rotations of many objects are applied by one composed rotation per object
+    (`compose_quat3_array`), which is turned to matrix once per row.
+    '''
+    __slots__ = ('data',)
+
+    def __init__(
+        self, items: typing.Any = (), dtype: typing.Optional[npt.DTypeLike] = None,
+    ) -> None:
+        data = float_data(items, dtype)
+        if data.size == 0:
+            data = data.reshape(-1, 4)
+        if data.ndim != 2 or data.shape[1] != 4:
+            raise ValueError(f'expected (N, 4) shape, got {data.shape}')
+        self.data: np.ndarray = data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: typing.Any) -> typing.Any:
+        if isinstance(index, (int, np.integer)):
+            return Quat3(*self.data[index].tolist())
+        return Quat3Array(self.data[index])
+
+    def __iter__(self) -> typing.Iterator[Quat3]:
+        for row in self.data.tolist():
+            yield Quat3(*row)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Quat3Array) or len(self) != len(other):
+            return False
+        return bool(np.all(isclose_data(self.data, other.data)))
+
+    __hash__ = None # type: ignore
+
+    def __repr__(self) -> str:
+        return f'Quat3Array({self.to_list()!r})'
+
+    def to_list(self) -> typing.List[Quat3]:
+        return list(self)
+
+    def astype(self, dtype: npt.DTypeLike) -> 'Quat3Array':
+        return Quat3Array(self.data, dtype)
+
+Quat3Like = typing.Union[Quat3Array, Quat3]
+
+def as_quat_data3(q: Quat3Like) -> np.ndarray:
+    '''Gives (N, 4) buffer of array or (1, 4) buffer of single quaternion.'''
+    if isinstance(q, Quat3Array):
+        return q.data
+    return np.asarray(q, dtype=np.float64).reshape(1, 4)
+
+def compose_quat_data(outer: np.ndarray, inner: np.ndarray) -> np.ndarray:
+    (aw, ax, ay, az) = np.moveaxis(outer, -1, 0)
+    (bw, bx, by, bz) = np.moveaxis(inner, -1, 0)
+    return np.stack((
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ), axis=-1)
+
+def quat_mat_data(q: np.ndarray) -> np.ndarray:
+    '''Gives (..., 3, 3) rotation matrices, see `quat_mat3`.'''
+    (w, x, y, z) = np.moveaxis(q, -1, 0)
+    return np.stack((
+        np.stack((1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)), axis=-1),
+        np.stack((2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)), axis=-1),
+        np.stack((2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)), axis=-1),
+    ), axis=-2)
+
+def rotate_data(q: np.ndarray, v: np.ndarray) -> np.ndarray:
+    '''Rotates (N, 3) vectors by (N, 4) or (1, 4) quaternions.
+
+    Single quaternion is turned to matrix once, otherwise each row takes its own matrix.
+    '''
+    matrices = quat_mat_data(q)
+    if len(q) == 1:
+        return v @ matrices[0].T
+    return np.einsum('nij,nj->ni', matrices, v)
+
+def axis_angle_quat3_array(axis: Vec3Like, angle: Scalars) -> Quat3Array:
+    '''Makes rotations around axes by angles, see `axis_angle_quat3`.'''
+    half = float_data(angle).reshape(-1, 1) / 2
+    (axis_data, half) = np.broadcast_arrays(norm_data(as_data3(axis)), half)
+    return Quat3Array(np.concatenate((np.cos(half[:, :1]), axis_data * np.sin(half)), axis=1))
+
+def between_quat3_array(a: Vec3Like, b: Vec3Like) -> Quat3Array:
+    '''Makes the shortest rotations that turn directions of a to directions of b.
+
+    See `between_quat3`, rows with zero vectors give NaN.
+    '''
+    (a_data, b_data) = np.broadcast_arrays(as_data3(a), as_data3(b))
+    (a_len, b_len) = (np.sqrt(dot_data(a_data, a_data)), np.sqrt(dot_data(b_data, b_data)))
+    axis = cross_data(a_data, b_data)
+    axis_len = np.sqrt(dot_data(axis, axis))
+    angle = np.arctan2(axis_len, dot_data(a_data, b_data))
+    use_x = np.abs(a_data[:, 0]) <= np.abs(a_data[:, 1])
+    orthogonal = cross_data(a_data, np.where(use_x[:, np.newaxis], [1, 0, 0], [0, 1, 0]))
+    # Axis of (nearly) collinear vectors is rounding noise, see `iszero_data`.
+    axis = np.where(iszero_data(axis_len, a_len * b_len)[:, np.newaxis], orthogonal, axis)
+    zero = iszero_data(a_len) | iszero_data(b_len)
+    result = axis_angle_quat3_array(Vec3Array(axis), angle).data
+    result[zero] = np.nan
+    return Quat3Array(result)
+
+def compose_quat3_array(outer: Quat3Like, inner: Quat3Like) -> Quat3Array:
+    '''Makes rotations that apply `inner` and then `outer`, see `compose_quat3`.'''
+    return Quat3Array(compose_quat_data(as_quat_data3(outer), as_quat_data3(inner)))
+
+def inverse_quat3_array(q: Quat3Like) -> Quat3Array:
+    return Quat3Array(as_quat_data3(q) * np.array([1, -1, -1, -1], dtype=np.int8))
+
+def norm_quat3_array(q: Quat3Like) -> Quat3Array:
+    data = as_quat_data3(q)
+    return Quat3Array(data / np.sqrt(dot_data(data, data))[:, np.newaxis])
+
+def slerp_quat3_array(a: Quat3Like, b: Quat3Like, t: Scalars) -> Quat3Array:
+    '''Interpolates rotations row by row, see `slerp_quat3`.
+
+    `sin(k * theta) / sin(theta)` is evaluated as `k * sinc(k * theta) / sinc(theta)`,
+    so equal rows need no separate branch.
+    '''
+    (a_data, b_data) = np.broadcast_arrays(as_quat_data3(a), as_quat_data3(b))
+    b_data = np.where((dot_data(a_data, b_data) < 0)[:, np.newaxis], -b_data, b_data)
+    diff = a_data - b_data
+    total = a_data + b_data
+    theta = 2 * np.arctan2(np.sqrt(dot_data(diff, diff)), np.sqrt(dot_data(total, total)))
+    t_data = float_data(t).reshape(-1)
+    sinc = np.sinc(theta / np.pi)
+    a_k = (1 - t_data) * np.sinc((1 - t_data) * theta / np.pi) / sinc
+    b_k = t_data * np.sinc(t_data * theta / np.pi) / sinc
+    return norm_quat3_array(Quat3Array(a_data * a_k[:, np.newaxis] + b_data * b_k[:, np.newaxis]))
+
+def quat_mat3_array(q: Quat3Like) -> np.ndarray:
+    '''Gives (N, 3, 3) rotation matrices, see `quat_mat3`.'''
+    return quat_mat_data(as_quat_data3(q))
+
+def rotate_point3_array(q: Quat3Like, point: Vec3Like) -> Vec3Array:
+    '''Rotates points around (0,0,0), single quaternion or point is broadcast.'''
+    (q_data, points) = (as_quat_data3(q), as_data3(point))
+    if len(points) == 1 and len(q_data) != 1:
+        points = np.broadcast_to(points, (len(q_data), 3))
+    return Vec3Array(rotate_data(q_data, points))
+
+def rotate_line3_array(q: Quat3Like, line: Line3Like) -> Line3Array:
+    '''Rotates lines around (0,0,0), single quaternion or line is broadcast.'''
+    (q_data, lines) = (as_quat_data3(q), as_line_data3(line))
+    if len(lines) == 1 and len(q_data) != 1:
+        lines = np.broadcast_to(lines, (len(q_data), 6))
+    return Line3Array(np.concatenate((
+        rotate_data(q_data, lines[:, 0:3]), rotate_data(q_data, lines[:, 3:6]),
+    ), axis=1))
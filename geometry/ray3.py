@@ -0,0 +1,22 @@
+import typing
+from .vec3 import Vec3, eq3
+from .line3 import Line3
+
+__all__ = ['Ray3', 'eq_ray3', 'ray_line3']
+
+class Ray3(typing.NamedTuple):
+    origin: Vec3
+    direction: Vec3
+
+    def __eq__(self, other: object) -> bool:
+        try:
+            return eq_ray3(self, typing.cast(Ray3, other))
+        except: # pylint: disable=bare-except
+            return False
+
+def eq_ray3(a: Ray3, b: Ray3, tolerance: typing.Optional[float] = None) -> bool:
+    return eq3(a.origin, b.origin, tolerance) and eq3(a.direction, b.direction, tolerance)
+
+def ray_line3(ray: Ray3) -> Line3:
+    '''Gives line that contains ray, ray is `anchor + direction * t` for t >= 0.'''
+    return Line3(anchor=ray.origin, direction=ray.direction)
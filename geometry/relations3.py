@@ -2,7 +2,62 @@ import typing
 import math
 from .vec3 import Vec3, add3, sub3, mul3, len3, project3, norm3, dot3, is_zero3, cross3
 from .line3 import Line3
-from .plane3 import Plane3
+from .plane3 import AnyPlane3
+from .segment3 import Segment3
+from .ray3 import Ray3
+from .triangle3 import Triangle3
+from .backend3 import BACKEND, NUMBA
+
+__all__ = [
+    'ERROR_BUDGETS', 'point_line_projection', 'point_line_distance', 'point_plane_projection',
+    'point_plane_distance', 'point_plane_signed_distance', 'line_plane_intersection',
+    'line_plane_projection', 'line_line_distance', 'line_line_intersection',
+    'plane_plane_intersection', 'point_segment_projection', 'point_segment_distance',
+    'ray_plane_intersection', 'segment_plane_intersection', 'ray_triangle_intersection',
+    'segment_triangle_intersection',
+]
+
+# Error budget of each function in units of machine epsilon of float type it computes in
+# (float64 here, float64 or float32 for `relations3array` kernels with buffers of that dtype).
+# Absolute error of each component of result (point, distance, line anchor and direction)
+# against exact result for the same arguments does not exceed `budget * epsilon * scale`,
+# where scale is the greatest absolute coordinate of arguments. It holds for well-conditioned
+# arguments: plane normals of unit length, directions and triangle edges not shorter than
+# scale / 10, sines of angles between intersecting lines, planes and triangles not less
+# than 0.1 and hits not closer than that to triangle edges. Near degenerate configurations
+# error grows as inverse of such sine.
+ERROR_BUDGETS = {
+    'point_line_projection': 16,
+    'point_line_distance': 16,
+    'point_plane_projection': 16,
+    'point_plane_distance': 16,
+    'point_plane_signed_distance': 8,
+    'line_plane_intersection': 128,
+    'line_plane_projection': 16,
+    'line_line_distance': 16,
+    'line_line_intersection': 64,
+    'plane_plane_intersection': 128,
+    'point_segment_projection': 16,
+    'point_segment_distance': 16,
+    'ray_plane_intersection': 128,
+    'segment_plane_intersection': 128,
+    'ray_triangle_intersection': 64,
+    'segment_triangle_intersection': 64,
+}
+
+class _CompiledBackend: # pylint: disable=too-few-public-methods
+    '''Stands for `relations3numba` until first call of a compiled function imports it.'''
+
+    def __getattr__(self, name: str) -> typing.Any:
+        global _backend # pylint: disable=global-statement
+        from . import relations3numba # pylint: disable=import-outside-toplevel
+        _backend = relations3numba
+        return getattr(relations3numba, name)
+
+# Module of compiled counterparts of functions named by `backend3.COMPILED` (`None` with pure
+# backend). They check it and call their counterparts, so callers that imported them by name
+# get compiled ones too, and numba is not imported by code that does not call them.
+_backend: typing.Any = _CompiledBackend() if BACKEND == NUMBA else None
 
 def point_line_projection(target_point: Vec3, line: Line3) -> Vec3:
     '''Projects point onto line.
@@ -10,6 +65,8 @@ def point_line_projection(target_point: Vec3, line: Line3) -> Vec3:
     For an arbitrary line point project vector from line point to target point onto line.
     Offset line point by that projection.
     '''
+    if _backend is not None:
+        return _backend.point_line_projection(target_point, line)
     line_point_to_target_dir = sub3(target_point, line.anchor)
     line_point_to_target_proj = project3(line_point_to_target_dir, line.direction)
     return add3(line.anchor, line_point_to_target_proj)
@@ -19,10 +76,12 @@ def point_line_distance(target_point: Vec3, line: Line3) -> float:
 
     Take distance between target point and its projection onto line.
     '''
+    if _backend is not None:
+        return _backend.point_line_distance(target_point, line)
     target_point_proj = point_line_projection(target_point, line)
     return len3(sub3(target_point, target_point_proj))
 
-def point_plane_projection(target_point: Vec3, plane: Plane3) -> Vec3:
+def point_plane_projection(target_point: Vec3, plane: AnyPlane3) -> Vec3:
     '''Projects point onto plane.
 
     For an arbitrary plane point project vector from target point to plane point onto plane normal.
@@ -30,20 +89,33 @@ def point_plane_projection(target_point: Vec3, plane: Plane3) -> Vec3:
 
     Set of plane points is defined by the equation: `(normalized_normal, x) = distance`.
     '''
-    plane_point = mul3(norm3(plane.normal), plane.distance)
-    target_to_plane_point_dir = sub3(plane_point, target_point)
-    target_to_plane_point_proj = project3(target_to_plane_point_dir, plane.normal)
+    if _backend is not None:
+        return _backend.point_plane_projection(target_point, plane)
+    plane_normal = plane.unit_normal
+    target_to_plane_point_dir = sub3(plane.origin, target_point)
+    target_to_plane_point_proj = mul3(plane_normal, dot3(target_to_plane_point_dir, plane_normal))
     return add3(target_point, target_to_plane_point_proj)
 
-def point_plane_distance(target_point: Vec3, plane: Plane3) -> float:
+def point_plane_distance(target_point: Vec3, plane: AnyPlane3) -> float:
     '''Finds distance from point to plane.
 
     Take distance between target point and its projection onto plane.
     '''
+    if _backend is not None:
+        return _backend.point_plane_distance(target_point, plane)
     target_point_proj = point_plane_projection(target_point, plane)
     return len3(sub3(target_point, target_point_proj))
 
-def line_plane_intersection(line: Line3, plane: Plane3) -> typing.Union[Vec3, Line3, None]:
+def point_plane_signed_distance(target_point: Vec3, plane: AnyPlane3) -> float:
+    '''Finds signed distance from point to plane.
+
+    Distance is positive on the side plane normal points to and negative on the other side.
+    Set of plane points is defined by the equation: `(normalized_normal, x) = distance`.
+    So `(normalized_normal, target_point) - distance` gives signed distance.
+    '''
+    return dot3(target_point, plane.unit_normal) - plane.distance
+
+def line_plane_intersection(line: Line3, plane: AnyPlane3) -> typing.Union[Vec3, Line3, None]:
     '''Finds intersection of line and plane.
 
     Set of line points is defined by the equation: `anchor + direction * t = x`
@@ -57,7 +129,9 @@ def line_plane_intersection(line: Line3, plane: Plane3) -> typing.Union[Vec3, Li
     line belongs to plane (if line point belongs to plane).
     Otherwise t defines one intersection point.
     '''
-    plane_normal = norm3(plane.normal)
+    if _backend is not None:
+        return _backend.line_plane_intersection(line, plane)
+    plane_normal = plane.unit_normal
     num = plane.distance - dot3(line.anchor, plane_normal)
     den = dot3(line.direction, plane_normal)
     if math.isclose(num, 0) and math.isclose(den, 0):
@@ -66,13 +140,15 @@ def line_plane_intersection(line: Line3, plane: Plane3) -> typing.Union[Vec3, Li
         return None
     return add3(line.anchor, mul3(line.direction, num / den))
 
-def line_plane_projection(line: Line3, plane: Plane3) -> Line3:
+def line_plane_projection(line: Line3, plane: AnyPlane3) -> Line3:
     '''Projects line onto plane.
 
     Take two line points, project them onto plane.
     If line is orthogonal to plane then two projected points are same.
     In that case use original line direction.
     '''
+    if _backend is not None:
+        return _backend.line_plane_projection(line, plane)
 
     anchor_proj = point_plane_projection(line.anchor, plane)
     other_anchor = add3(line.anchor, line.direction)
@@ -92,6 +168,8 @@ def line_line_distance(a_line: Line3, b_line: Line3) -> float:
 
     If lines are collinear then take distance from point of one line to other line.
     '''
+    if _backend is not None:
+        return _backend.line_line_distance(a_line, b_line)
     normal = norm3(cross3(a_line.direction, b_line.direction))
     if is_zero3(normal):
         return point_line_distance(a_line.anchor, b_line)
@@ -122,6 +200,8 @@ def line_line_intersection(a_line: Line3, b_line: Line3) -> \
 
     If lines are collinear then no intersection.
     '''
+    if _backend is not None:
+        return _backend.line_line_intersection(a_line, b_line)
     normal = cross3(a_line.direction, b_line.direction)
     if is_zero3(normal):
         return None
@@ -137,7 +217,7 @@ def line_line_intersection(a_line: Line3, b_line: Line3) -> \
         add3(b_line.anchor, mul3(b_line.direction, b_t)),
     )
 
-def plane_plane_intersection(a_plane: Plane3, b_plane: Plane3) -> typing.Union[Line3, None]:
+def plane_plane_intersection(a_plane: AnyPlane3, b_plane: AnyPlane3) -> typing.Union[Line3, None]:
     '''Finds intersection between planes.
 
     Cross product of planes normals gives line direction.
@@ -147,12 +227,14 @@ def plane_plane_intersection(a_plane: Plane3, b_plane: Plane3) -> typing.Union[L
 
     If planes are parallel then no intersection.
     '''
+    if _backend is not None:
+        return _backend.plane_plane_intersection(a_plane, b_plane)
 
     direction = cross3(a_plane.normal, b_plane.normal)
     if is_zero3(direction):
         return None
-    a_anchor = mul3(norm3(a_plane.normal), a_plane.distance)
-    b_anchor = mul3(norm3(b_plane.normal), b_plane.distance)
+    a_anchor = a_plane.origin
+    b_anchor = b_plane.origin
     a_direction = cross3(a_plane.normal, direction)
     b_direction = cross3(b_plane.normal, direction)
     a_point, b_point = typing.cast(typing.Tuple[Vec3, Vec3], line_line_intersection(
@@ -162,3 +244,112 @@ def plane_plane_intersection(a_plane: Plane3, b_plane: Plane3) -> typing.Union[L
     # They are equal actually.
     point = mul3(add3(a_point, b_point), 0.5)
     return Line3(anchor=point, direction=direction)
+
+def point_segment_projection(target_point: Vec3, segment: Segment3) -> Vec3:
+    '''Finds segment point closest to target point.
+
+    Segment points are `start + (end - start) * t` for t in [0, 1].
+    Projection of target point onto segment line gives t, clamp it to segment.
+    If segment is degenerate then its start is the closest point.
+    '''
+    direction = sub3(segment.end, segment.start)
+    direction_sq = dot3(direction, direction)
+    if math.isclose(direction_sq, 0):
+        return segment.start
+    t = dot3(sub3(target_point, segment.start), direction) / direction_sq
+    return add3(segment.start, mul3(direction, min(max(t, 0), 1)))
+
+def point_segment_distance(target_point: Vec3, segment: Segment3) -> float:
+    return len3(sub3(target_point, point_segment_projection(target_point, segment)))
+
+def ray_plane_intersection(ray: Ray3, plane: AnyPlane3) -> typing.Union[Vec3, Ray3, None]:
+    '''Finds intersection of ray and plane.
+
+    Same as `line_plane_intersection` for ray line, intersection point must have t >= 0.
+    '''
+    plane_normal = plane.unit_normal
+    num = plane.distance - dot3(ray.origin, plane_normal)
+    den = dot3(ray.direction, plane_normal)
+    if math.isclose(num, 0) and math.isclose(den, 0):
+        return ray
+    if math.isclose(den, 0):
+        return None
+    t = num / den
+    if t < 0:
+        return None
+    return add3(ray.origin, mul3(ray.direction, t))
+
+def segment_plane_intersection(
+    segment: Segment3, plane: AnyPlane3,
+) -> typing.Union[Vec3, Segment3, None]:
+    '''Finds intersection of segment and plane.
+
+    Same as `line_plane_intersection` for segment line `start + (end - start) * t`,
+    intersection point must have t in [0, 1].
+    '''
+    direction = sub3(segment.end, segment.start)
+    plane_normal = plane.unit_normal
+    num = plane.distance - dot3(segment.start, plane_normal)
+    den = dot3(direction, plane_normal)
+    if math.isclose(num, 0) and math.isclose(den, 0):
+        return segment
+    if math.isclose(den, 0):
+        return None
+    t = num / den
+    if t < 0 or t > 1:
+        return None
+    return add3(segment.start, mul3(direction, t))
+
+def _triangle_parameter(
+    origin: Vec3, direction: Vec3, triangle: Triangle3,
+) -> typing.Optional[float]:
+    '''Finds t of intersection of `origin + direction * t` with triangle (Moller-Trumbore).
+
+    Triangle points are `a + e1 * u + e2 * v` for u >= 0, v >= 0, u + v <= 1
+    where `e1 = b - a`, `e2 = c - a`.
+    Equating it with line point gives linear system `-direction * t + e1 * u + e2 * v = s`
+    where `s = origin - a`. By Cramer's rule with `p = direction x e2`, `q = s x e1`:
+    `det = (e1, p)`, `u = (s, p) / det`, `v = (direction, q) / det`, `t = (e2, q) / det`.
+    Barycentric coordinates are checked as soon as they are known so misses exit early.
+
+    If line is parallel to triangle plane (or triangle is degenerate) then no intersection.
+    '''
+    edge_1 = sub3(triangle.b, triangle.a)
+    edge_2 = sub3(triangle.c, triangle.a)
+    p = cross3(direction, edge_2)
+    det = dot3(edge_1, p)
+    if math.isclose(det, 0):
+        return None
+    s = sub3(origin, triangle.a)
+    u = dot3(s, p) / det
+    if u < 0 or u > 1:
+        return None
+    q = cross3(s, edge_1)
+    v = dot3(direction, q) / det
+    if v < 0 or u + v > 1:
+        return None
+    return dot3(edge_2, q) / det
+
+def ray_triangle_intersection(ray: Ray3, triangle: Triangle3) -> typing.Optional[Vec3]:
+    '''Finds intersection of ray and triangle (both triangle sides are hit).
+
+    Ray that lies in triangle plane does not intersect it.
+    '''
+    if _backend is not None:
+        return _backend.ray_triangle_intersection(ray, triangle)
+    t = _triangle_parameter(ray.origin, ray.direction, triangle)
+    if t is None or t < 0:
+        return None
+    return add3(ray.origin, mul3(ray.direction, t))
+
+def segment_triangle_intersection(
+    segment: Segment3, triangle: Triangle3,
+) -> typing.Optional[Vec3]:
+    '''Finds intersection of segment and triangle, see `ray_triangle_intersection`.'''
+    if _backend is not None:
+        return _backend.segment_triangle_intersection(segment, triangle)
+    direction = sub3(segment.end, segment.start)
+    t = _triangle_parameter(segment.start, direction, triangle)
+    if t is None or t < 0 or t > 1:
+        return None
+    return add3(segment.start, mul3(direction, t))
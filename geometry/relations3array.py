@@ -0,0 +1,265 @@
+import typing
+import numpy as np
+from .vec3array import (
+    Vec3Array, Vec3Like, as_data3, iszero_data, dot_data, norm_data, cross_data,
+)
+from .line3array import Line3Array, Line3Like, as_line_data3
+from .plane3array import Plane3Like, as_plane_data3
+from .ray3 import Ray3, ray_line3
+from .triangle3array import Triangle3Like, as_triangle_data3
+
+__all__ = [
+    'NO_INTERSECTION', 'POINT_INTERSECTION', 'LINE_INTERSECTION', 'point_line_projection_array',
+    'point_line_distance_array', 'point_plane_projection_array', 'point_plane_distance_array',
+    'point_plane_signed_distance_array', 'line_plane_intersection_array',
+    'line_plane_projection_array', 'line_line_distance_array', 'line_line_intersection_array',
+    'plane_plane_intersection_array', 'ray_triangle_intersection_array',
+]
+
+# Per-row outcome of batched intersection queries.
+# Scalar functions return `None`, `Vec3` or `Line3` for these cases.
+NO_INTERSECTION = 0
+POINT_INTERSECTION = 1
+LINE_INTERSECTION = 2
+
+# Batches of rays are kept in `Line3Array` with ray origin as line anchor.
+Ray3Like = typing.Union[Line3Array, Ray3]
+
+# Kernels below work on raw buffers with last axis of size 3 and any broadcastable leading axes.
+# Batched functions wrap them for `Vec3Array`, `Line3Array` and `Plane3Array` arguments.
+# Zero tests of computed values are relative to magnitude of their operands, see `iszero_data`.
+
+def len_data(v: np.ndarray) -> np.ndarray:
+    return np.sqrt(dot_data(v, v))
+
+def is_zero_data(v: np.ndarray, scale: typing.Any = 0.0) -> np.ndarray:
+    return iszero_data(len_data(v), scale)
+
+def project_data(v: np.ndarray, axis: np.ndarray) -> np.ndarray:
+    vec_dir = norm_data(axis)
+    return vec_dir * dot_data(v, vec_dir)[..., np.newaxis]
+
+def point_line_projection_data(
+    point: np.ndarray, anchor: np.ndarray, direction: np.ndarray,
+) -> np.ndarray:
+    return anchor + project_data(point - anchor, direction)
+
+def point_line_distance_data(
+    point: np.ndarray, anchor: np.ndarray, direction: np.ndarray,
+) -> np.ndarray:
+    diff = point - point_line_projection_data(point, anchor, direction)
+    return np.sqrt(dot_data(diff, diff))
+
+def point_plane_projection_data(
+    point: np.ndarray, normal: np.ndarray, distance: np.ndarray,
+) -> np.ndarray:
+    plane_point = norm_data(normal) * distance[..., np.newaxis]
+    return point + project_data(plane_point - point, normal)
+
+def point_plane_distance_data(
+    point: np.ndarray, normal: np.ndarray, distance: np.ndarray,
+) -> np.ndarray:
+    diff = point - point_plane_projection_data(point, normal, distance)
+    return np.sqrt(dot_data(diff, diff))
+
+def point_plane_signed_distance_data(
+    point: np.ndarray, normal: np.ndarray, distance: np.ndarray,
+) -> np.ndarray:
+    return dot_data(point, norm_data(normal)) - distance
+
+def line_plane_intersection_data(
+    anchor: np.ndarray, direction: np.ndarray, normal: np.ndarray, distance: np.ndarray,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    plane_normal = norm_data(normal)
+    num = distance - dot_data(anchor, plane_normal)
+    den = dot_data(direction, plane_normal)
+    num_zero = iszero_data(num, np.maximum(np.abs(distance), len_data(anchor)))
+    den_zero = iszero_data(den, len_data(direction))
+    status = np.where(
+        den_zero,
+        np.where(num_zero, LINE_INTERSECTION, NO_INTERSECTION),
+        POINT_INTERSECTION,
+    ).astype(np.int8)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(den_zero, np.nan, num / np.where(den_zero, 1, den))
+    return status, anchor + direction * t[..., np.newaxis]
+
+def line_line_distance_data(
+    a_anchor: np.ndarray, a_direction: np.ndarray, b_anchor: np.ndarray, b_direction: np.ndarray,
+) -> np.ndarray:
+    normal = cross_data(a_direction, b_direction)
+    collinear = is_zero_data(normal, len_data(a_direction) * len_data(b_direction))
+    normal = norm_data(np.where(collinear[..., np.newaxis], 0, normal))
+    skew_distance = np.abs(dot_data(normal, a_anchor - b_anchor))
+    if not np.any(collinear):
+        return skew_distance
+    return np.where(
+        collinear,
+        point_line_distance_data(a_anchor, b_anchor, b_direction),
+        skew_distance,
+    )
+
+def line_line_intersection_data(
+    a_anchor: np.ndarray, a_direction: np.ndarray, b_anchor: np.ndarray, b_direction: np.ndarray,
+) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    normal = cross_data(a_direction, b_direction)
+    normal_sq = dot_data(normal, normal)
+    collinear = iszero_data(np.sqrt(normal_sq), len_data(a_direction) * len_data(b_direction))
+    status = np.where(collinear, NO_INTERSECTION, POINT_INTERSECTION).astype(np.int8)
+    a_normal = cross_data(a_direction, normal)
+    b_normal = cross_data(b_direction, normal)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k = np.where(collinear, np.nan, 1 / np.where(collinear, 1, normal_sq))
+    a_t = k * dot_data(b_normal, b_anchor - a_anchor) \
+        * np.copysign(1, dot_data(b_normal, a_direction))
+    b_t = k * dot_data(a_normal, a_anchor - b_anchor) \
+        * np.copysign(1, dot_data(a_normal, b_direction))
+    return (
+        status,
+        a_anchor + a_direction * a_t[..., np.newaxis],
+        b_anchor + b_direction * b_t[..., np.newaxis],
+    )
+
+def plane_plane_intersection_data(
+    a_normal: np.ndarray, a_distance: np.ndarray, b_normal: np.ndarray, b_distance: np.ndarray,
+) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    direction = cross_data(a_normal, b_normal)
+    a_anchor = norm_data(a_normal) * a_distance[..., np.newaxis]
+    b_anchor = norm_data(b_normal) * b_distance[..., np.newaxis]
+    (status, a_point, b_point) = line_line_intersection_data(
+        a_anchor, cross_data(a_normal, direction), b_anchor, cross_data(b_normal, direction),
+    )
+    status = np.where(status == POINT_INTERSECTION, LINE_INTERSECTION, NO_INTERSECTION)
+    return status.astype(np.int8), (a_point + b_point) * 0.5, direction
+
+def line_triangle_parameter_data(
+    anchor: np.ndarray, direction: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray,
+) -> np.ndarray:
+    '''Gives t of intersection of `anchor + direction * t` with triangle, NaN if none.
+
+    See `relations3._triangle_parameter`, all rows are evaluated without early exits.
+    '''
+    edge_1 = b - a
+    edge_2 = c - a
+    p = cross_data(direction, edge_2)
+    det = dot_data(edge_1, p)
+    parallel = iszero_data(det, len_data(edge_1) * len_data(direction) * len_data(edge_2))
+    det = np.where(parallel, 1, det)
+    s = anchor - a
+    u = dot_data(s, p) / det
+    q = cross_data(s, edge_1)
+    v = dot_data(direction, q) / det
+    t = dot_data(edge_2, q) / det
+    return np.where(~parallel & (u >= 0) & (u <= 1) & (v >= 0) & (u + v <= 1), t, np.nan)
+
+def point_line_projection_array(target_point: Vec3Like, line: Line3Like) -> Vec3Array:
+    lines = as_line_data3(line)
+    return Vec3Array(point_line_projection_data(
+        as_data3(target_point), lines[:, 0:3], lines[:, 3:6],
+    ))
+
+def point_line_distance_array(target_point: Vec3Like, line: Line3Like) -> np.ndarray:
+    lines = as_line_data3(line)
+    return point_line_distance_data(as_data3(target_point), lines[:, 0:3], lines[:, 3:6])
+
+def point_plane_projection_array(target_point: Vec3Like, plane: Plane3Like) -> Vec3Array:
+    planes = as_plane_data3(plane)
+    return Vec3Array(point_plane_projection_data(
+        as_data3(target_point), planes[:, 0:3], planes[:, 3],
+    ))
+
+def point_plane_distance_array(target_point: Vec3Like, plane: Plane3Like) -> np.ndarray:
+    planes = as_plane_data3(plane)
+    return point_plane_distance_data(as_data3(target_point), planes[:, 0:3], planes[:, 3])
+
+def point_plane_signed_distance_array(target_point: Vec3Like, plane: Plane3Like) -> np.ndarray:
+    planes = as_plane_data3(plane)
+    return point_plane_signed_distance_data(as_data3(target_point), planes[:, 0:3], planes[:, 3])
+
+def line_plane_intersection_array(
+    line: Line3Like, plane: Plane3Like,
+) -> typing.Tuple[np.ndarray, Vec3Array]:
+    '''Finds intersections of lines and planes.
+
+    Gives status and intersection point for each row.
+    Point is NaN unless status is `POINT_INTERSECTION`.
+    For `LINE_INTERSECTION` status line itself is the intersection.
+    '''
+    lines = as_line_data3(line)
+    planes = as_plane_data3(plane)
+    (status, point) = line_plane_intersection_data(
+        lines[:, 0:3], lines[:, 3:6], planes[:, 0:3], planes[:, 3],
+    )
+    return status, Vec3Array(point)
+
+def line_plane_projection_array(line: Line3Like, plane: Plane3Like) -> Line3Array:
+    lines = as_line_data3(line)
+    planes = as_plane_data3(plane)
+    (normal, distance) = (planes[:, 0:3], planes[:, 3])
+    anchor_proj = point_plane_projection_data(lines[:, 0:3], normal, distance)
+    other_anchor_proj = point_plane_projection_data(lines[:, 0:3] + lines[:, 3:6], normal, distance)
+    direction_proj = other_anchor_proj - anchor_proj
+    direction = np.where(
+        is_zero_data(direction_proj, len_data(lines[:, 3:6]))[..., np.newaxis],
+        lines[:, 3:6],
+        direction_proj,
+    )
+    return Line3Array.from_parts(Vec3Array(anchor_proj), Vec3Array(direction))
+
+def line_line_distance_array(a_line: Line3Like, b_line: Line3Like) -> np.ndarray:
+    a_lines = as_line_data3(a_line)
+    b_lines = as_line_data3(b_line)
+    return line_line_distance_data(
+        a_lines[:, 0:3], a_lines[:, 3:6], b_lines[:, 0:3], b_lines[:, 3:6],
+    )
+
+def line_line_intersection_array(
+    a_line: Line3Like, b_line: Line3Like,
+) -> typing.Tuple[np.ndarray, Vec3Array, Vec3Array]:
+    '''Finds intersections between lines.
+
+    Gives status and pair of closest points for each row.
+    Points are NaN where status is `NO_INTERSECTION` (collinear lines).
+    '''
+    a_lines = as_line_data3(a_line)
+    b_lines = as_line_data3(b_line)
+    (status, a_point, b_point) = line_line_intersection_data(
+        a_lines[:, 0:3], a_lines[:, 3:6], b_lines[:, 0:3], b_lines[:, 3:6],
+    )
+    return status, Vec3Array(a_point), Vec3Array(b_point)
+
+def plane_plane_intersection_array(
+    a_plane: Plane3Like, b_plane: Plane3Like,
+) -> typing.Tuple[np.ndarray, Line3Array]:
+    '''Finds intersections between planes.
+
+    Gives status and intersection line for each row.
+    Line anchor is NaN where status is `NO_INTERSECTION` (parallel planes).
+    '''
+    a_planes = as_plane_data3(a_plane)
+    b_planes = as_plane_data3(b_plane)
+    (status, anchor, direction) = plane_plane_intersection_data(
+        a_planes[:, 0:3], a_planes[:, 3], b_planes[:, 0:3], b_planes[:, 3],
+    )
+    return status, Line3Array.from_parts(Vec3Array(anchor), Vec3Array(direction))
+
+def ray_triangle_intersection_array(
+    ray: Ray3Like, triangle: Triangle3Like,
+) -> typing.Tuple[np.ndarray, Vec3Array]:
+    '''Finds intersections of rays and triangles.
+
+    Gives status and intersection point for each row.
+    Point is NaN where status is `NO_INTERSECTION`.
+    Single ray against many triangles (picking) is broadcast, nearest hit is the one
+    with the least distance to ray origin.
+    '''
+    rays = as_line_data3(ray if isinstance(ray, Line3Array) else ray_line3(ray))
+    triangles = as_triangle_data3(triangle)
+    (origin, direction) = (rays[:, 0:3], rays[:, 3:6])
+    t = line_triangle_parameter_data(
+        origin, direction, triangles[:, 0:3], triangles[:, 3:6], triangles[:, 6:9],
+    )
+    hit = t >= 0
+    status = np.where(hit, POINT_INTERSECTION, NO_INTERSECTION).astype(np.int8)
+    t = np.where(hit, t, np.nan)
+    return status, Vec3Array(origin + direction * t[..., np.newaxis])
@@ -0,0 +1,248 @@
+# Kernels take vectors as separate floats, so they have many arguments and locals.
+# pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+import typing
+import math
+import numba # type: ignore # pylint: disable=import-error
+from .vec3 import Vec3
+from .line3 import Line3
+from .plane3 import AnyPlane3
+from .segment3 import Segment3
+from .ray3 import Ray3
+from .triangle3 import Triangle3
+
+# Compiled counterparts of `relations3` functions named by `backend3.COMPILED`.
+# Kernels take and give plain floats, so no `Vec3` is built for intermediate results.
+# They repeat operations of pure functions in the same order, so results match them.
+# `relations3` functions call these when numba backend is selected, this module is imported
+# (and kernels are compiled) on first such call.
+
+_MISS = 0.0
+_POINT = 1.0
+_LINE = 2.0
+
+def _kernel(args: int, results: int = 1) -> typing.Callable[..., typing.Any]:
+    '''Compiles function of `args` floats that gives `results` floats.'''
+    result = numba.float64 if results == 1 else numba.types.UniTuple(numba.float64, results)
+    return typing.cast(
+        typing.Callable[..., typing.Any],
+        numba.njit(result(*[numba.float64] * args), cache=True),
+    )
+
+_inline = numba.njit(cache=True)
+
+@_inline
+def _isclose(a, b): # type: ignore
+    return abs(a - b) <= max(1e-9 * max(abs(a), abs(b)), 0.0)
+
+@_inline
+def _dot(ax, ay, az, bx, by, bz): # type: ignore
+    return ax * bx + ay * by + az * bz
+
+@_inline
+def _cross(ax, ay, az, bx, by, bz): # type: ignore
+    return (ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx)
+
+@_inline
+def _norm(x, y, z): # type: ignore
+    vec_len = math.sqrt(_dot(x, y, z, x, y, z))
+    if _isclose(vec_len, 0.0):
+        return (0.0, 0.0, 0.0)
+    k = 1 / vec_len
+    return (x * k, y * k, z * k)
+
+@_inline
+def _point_line_projection(px, py, pz, ax, ay, az, dx, dy, dz): # type: ignore
+    (ux, uy, uz) = _norm(dx, dy, dz)
+    k = _dot(px - ax, py - ay, pz - az, ux, uy, uz)
+    return (ax + ux * k, ay + uy * k, az + uz * k)
+
+@_inline
+def _point_plane_projection(px, py, pz, nx, ny, nz, distance): # type: ignore
+    (ux, uy, uz) = _norm(nx, ny, nz)
+    k = _dot(ux * distance - px, uy * distance - py, uz * distance - pz, ux, uy, uz)
+    return (px + ux * k, py + uy * k, pz + uz * k)
+
+@_inline
+def _line_line_intersection(ax, ay, az, adx, ady, adz, bx, by, bz, bdx, bdy, bdz): # type: ignore
+    (nx, ny, nz) = _cross(adx, ady, adz, bdx, bdy, bdz)
+    normal_sq = _dot(nx, ny, nz, nx, ny, nz)
+    if _isclose(normal_sq, 0.0):
+        return (_MISS, math.nan, math.nan, math.nan, math.nan, math.nan, math.nan)
+    (anx, any_, anz) = _cross(adx, ady, adz, nx, ny, nz)
+    (bnx, bny, bnz) = _cross(bdx, bdy, bdz, nx, ny, nz)
+    k = 1 / normal_sq
+    a_t = k * _dot(bnx, bny, bnz, bx - ax, by - ay, bz - az) \
+        * math.copysign(1, _dot(bnx, bny, bnz, adx, ady, adz))
+    b_t = k * _dot(anx, any_, anz, ax - bx, ay - by, az - bz) \
+        * math.copysign(1, _dot(anx, any_, anz, bdx, bdy, bdz))
+    return (
+        _POINT,
+        ax + adx * a_t, ay + ady * a_t, az + adz * a_t,
+        bx + bdx * b_t, by + bdy * b_t, bz + bdz * b_t,
+    )
+
+@_inline
+def _triangle_parameter( # type: ignore
+    ox, oy, oz, dx, dy, dz, ax, ay, az, bx, by, bz, cx, cy, cz,
+):
+    (e1x, e1y, e1z) = (bx - ax, by - ay, bz - az)
+    (e2x, e2y, e2z) = (cx - ax, cy - ay, cz - az)
+    (px, py, pz) = _cross(dx, dy, dz, e2x, e2y, e2z)
+    det = _dot(e1x, e1y, e1z, px, py, pz)
+    if _isclose(det, 0.0):
+        return math.nan
+    (sx, sy, sz) = (ox - ax, oy - ay, oz - az)
+    u = _dot(sx, sy, sz, px, py, pz) / det
+    if u < 0 or u > 1:
+        return math.nan
+    (qx, qy, qz) = _cross(sx, sy, sz, e1x, e1y, e1z)
+    v = _dot(dx, dy, dz, qx, qy, qz) / det
+    if v < 0 or u + v > 1:
+        return math.nan
+    return _dot(e2x, e2y, e2z, qx, qy, qz) / det
+
+@_kernel(9, 3)
+def _point_line_projection_kernel(px, py, pz, ax, ay, az, dx, dy, dz): # type: ignore
+    return _point_line_projection(px, py, pz, ax, ay, az, dx, dy, dz)
+
+@_kernel(9)
+def _point_line_distance_kernel(px, py, pz, ax, ay, az, dx, dy, dz): # type: ignore
+    (qx, qy, qz) = _point_line_projection(px, py, pz, ax, ay, az, dx, dy, dz)
+    return math.sqrt(_dot(px - qx, py - qy, pz - qz, px - qx, py - qy, pz - qz))
+
+@_kernel(7, 3)
+def _point_plane_projection_kernel(px, py, pz, nx, ny, nz, distance): # type: ignore
+    return _point_plane_projection(px, py, pz, nx, ny, nz, distance)
+
+@_kernel(7)
+def _point_plane_distance_kernel(px, py, pz, nx, ny, nz, distance): # type: ignore
+    (qx, qy, qz) = _point_plane_projection(px, py, pz, nx, ny, nz, distance)
+    return math.sqrt(_dot(px - qx, py - qy, pz - qz, px - qx, py - qy, pz - qz))
+
+@_kernel(10, 4)
+def _line_plane_intersection_kernel(ax, ay, az, dx, dy, dz, nx, ny, nz, distance): # type: ignore
+    (ux, uy, uz) = _norm(nx, ny, nz)
+    num = distance - _dot(ax, ay, az, ux, uy, uz)
+    den = _dot(dx, dy, dz, ux, uy, uz)
+    if _isclose(num, 0.0) and _isclose(den, 0.0):
+        return (_LINE, math.nan, math.nan, math.nan)
+    if _isclose(den, 0.0):
+        return (_MISS, math.nan, math.nan, math.nan)
+    t = num / den
+    return (_POINT, ax + dx * t, ay + dy * t, az + dz * t)
+
+@_kernel(10, 6)
+def _line_plane_projection_kernel(ax, ay, az, dx, dy, dz, nx, ny, nz, distance): # type: ignore
+    (px, py, pz) = _point_plane_projection(ax, ay, az, nx, ny, nz, distance)
+    (qx, qy, qz) = _point_plane_projection(ax + dx, ay + dy, az + dz, nx, ny, nz, distance)
+    (ex, ey, ez) = (qx - px, qy - py, qz - pz)
+    if _isclose(_dot(ex, ey, ez, ex, ey, ez), 0.0):
+        return (px, py, pz, dx, dy, dz)
+    return (px, py, pz, ex, ey, ez)
+
+@_kernel(12)
+def _line_line_distance_kernel(ax, ay, az, adx, ady, adz, bx, by, bz, bdx, bdy, bdz): # type: ignore
+    (cx, cy, cz) = _cross(adx, ady, adz, bdx, bdy, bdz)
+    (nx, ny, nz) = _norm(cx, cy, cz)
+    if _isclose(_dot(nx, ny, nz, nx, ny, nz), 0.0):
+        (qx, qy, qz) = _point_line_projection(ax, ay, az, bx, by, bz, bdx, bdy, bdz)
+        return math.sqrt(_dot(ax - qx, ay - qy, az - qz, ax - qx, ay - qy, az - qz))
+    return abs(_dot(nx, ny, nz, ax - bx, ay - by, az - bz))
+
+@_kernel(12, 7)
+def _line_line_intersection_kernel( # type: ignore
+    ax, ay, az, adx, ady, adz, bx, by, bz, bdx, bdy, bdz,
+):
+    return _line_line_intersection(ax, ay, az, adx, ady, adz, bx, by, bz, bdx, bdy, bdz)
+
+@_kernel(8, 7)
+def _plane_plane_intersection_kernel(anx, any_, anz, a_distance, bnx, bny, bnz, b_distance): # type: ignore
+    (dx, dy, dz) = _cross(anx, any_, anz, bnx, bny, bnz)
+    if _isclose(_dot(dx, dy, dz, dx, dy, dz), 0.0):
+        return (_MISS, math.nan, math.nan, math.nan, math.nan, math.nan, math.nan)
+    (aux, auy, auz) = _norm(anx, any_, anz)
+    (bux, buy, buz) = _norm(bnx, bny, bnz)
+    (adx, ady, adz) = _cross(anx, any_, anz, dx, dy, dz)
+    (bdx, bdy, bdz) = _cross(bnx, bny, bnz, dx, dy, dz)
+    (_, px, py, pz, qx, qy, qz) = _line_line_intersection(
+        aux * a_distance, auy * a_distance, auz * a_distance, adx, ady, adz,
+        bux * b_distance, buy * b_distance, buz * b_distance, bdx, bdy, bdz,
+    )
+    return (_LINE, (px + qx) * 0.5, (py + qy) * 0.5, (pz + qz) * 0.5, dx, dy, dz)
+
+@_kernel(15)
+def _triangle_parameter_kernel( # type: ignore
+    ox, oy, oz, dx, dy, dz, ax, ay, az, bx, by, bz, cx, cy, cz,
+):
+    return _triangle_parameter(ox, oy, oz, dx, dy, dz, ax, ay, az, bx, by, bz, cx, cy, cz)
+
+def point_line_projection(target_point: Vec3, line: Line3) -> Vec3:
+    ((ax, ay, az), (dx, dy, dz)) = line
+    return Vec3(*_point_line_projection_kernel(*target_point, ax, ay, az, dx, dy, dz))
+
+def point_line_distance(target_point: Vec3, line: Line3) -> float:
+    ((ax, ay, az), (dx, dy, dz)) = line
+    return typing.cast(float, _point_line_distance_kernel(*target_point, ax, ay, az, dx, dy, dz))
+
+def point_plane_projection(target_point: Vec3, plane: AnyPlane3) -> Vec3:
+    return Vec3(*_point_plane_projection_kernel(*target_point, *plane.normal, plane.distance))
+
+def point_plane_distance(target_point: Vec3, plane: AnyPlane3) -> float:
+    return typing.cast(
+        float, _point_plane_distance_kernel(*target_point, *plane.normal, plane.distance))
+
+def line_plane_intersection(line: Line3, plane: AnyPlane3) -> typing.Union[Vec3, Line3, None]:
+    ((ax, ay, az), (dx, dy, dz)) = line
+    (status, x, y, z) = _line_plane_intersection_kernel(
+        ax, ay, az, dx, dy, dz, *plane.normal, plane.distance)
+    if status == _POINT:
+        return Vec3(x, y, z)
+    return line if status == _LINE else None
+
+def line_plane_projection(line: Line3, plane: AnyPlane3) -> Line3:
+    ((ax, ay, az), (dx, dy, dz)) = line
+    (px, py, pz, ex, ey, ez) = _line_plane_projection_kernel(
+        ax, ay, az, dx, dy, dz, *plane.normal, plane.distance)
+    return Line3(anchor=Vec3(px, py, pz), direction=Vec3(ex, ey, ez))
+
+def line_line_distance(a_line: Line3, b_line: Line3) -> float:
+    ((ax, ay, az), (adx, ady, adz)) = a_line
+    ((bx, by, bz), (bdx, bdy, bdz)) = b_line
+    return typing.cast(float, _line_line_distance_kernel(
+        ax, ay, az, adx, ady, adz, bx, by, bz, bdx, bdy, bdz))
+
+def line_line_intersection(a_line: Line3, b_line: Line3) -> \
+    typing.Union[typing.Tuple[Vec3, Vec3], None]:
+    ((ax, ay, az), (adx, ady, adz)) = a_line
+    ((bx, by, bz), (bdx, bdy, bdz)) = b_line
+    (status, px, py, pz, qx, qy, qz) = _line_line_intersection_kernel(
+        ax, ay, az, adx, ady, adz, bx, by, bz, bdx, bdy, bdz)
+    if status == _MISS:
+        return None
+    return (Vec3(px, py, pz), Vec3(qx, qy, qz))
+
+def plane_plane_intersection(a_plane: AnyPlane3, b_plane: AnyPlane3) -> typing.Union[Line3, None]:
+    (status, px, py, pz, dx, dy, dz) = _plane_plane_intersection_kernel(
+        *a_plane.normal, a_plane.distance, *b_plane.normal, b_plane.distance)
+    if status == _MISS:
+        return None
+    return Line3(anchor=Vec3(px, py, pz), direction=Vec3(dx, dy, dz))
+
+def ray_triangle_intersection(ray: Ray3, triangle: Triangle3) -> typing.Optional[Vec3]:
+    ((ox, oy, oz), (dx, dy, dz)) = ray
+    ((ax, ay, az), (bx, by, bz), (cx, cy, cz)) = triangle
+    t = _triangle_parameter_kernel(ox, oy, oz, dx, dy, dz, ax, ay, az, bx, by, bz, cx, cy, cz)
+    if math.isnan(t) or t < 0:
+        return None
+    return Vec3(ox + dx * t, oy + dy * t, oz + dz * t)
+
+def segment_triangle_intersection(
+    segment: Segment3, triangle: Triangle3,
+) -> typing.Optional[Vec3]:
+    ((sx, sy, sz), (ex, ey, ez)) = segment
+    ((ax, ay, az), (bx, by, bz), (cx, cy, cz)) = triangle
+    (dx, dy, dz) = (ex - sx, ey - sy, ez - sz)
+    t = _triangle_parameter_kernel(sx, sy, sz, dx, dy, dz, ax, ay, az, bx, by, bz, cx, cy, cz)
+    if math.isnan(t) or t < 0 or t > 1:
+        return None
+    return Vec3(sx + dx * t, sy + dy * t, sz + dz * t)
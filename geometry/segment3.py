@@ -0,0 +1,22 @@
+import typing
+from .vec3 import Vec3, sub3, eq3
+from .line3 import Line3
+
+__all__ = ['Segment3', 'eq_segment3', 'segment_line3']
+
+class Segment3(typing.NamedTuple):
+    start: Vec3
+    end: Vec3
+
+    def __eq__(self, other: object) -> bool:
+        try:
+            return eq_segment3(self, typing.cast(Segment3, other))
+        except: # pylint: disable=bare-except
+            return False
+
+def eq_segment3(a: Segment3, b: Segment3, tolerance: typing.Optional[float] = None) -> bool:
+    return eq3(a.start, b.start, tolerance) and eq3(a.end, b.end, tolerance)
+
+def segment_line3(segment: Segment3) -> Line3:
+    '''Gives line that contains segment, segment is `anchor + direction * t` for t in [0, 1].'''
+    return Line3(anchor=segment.start, direction=sub3(segment.end, segment.start))
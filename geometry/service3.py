@@ -0,0 +1,204 @@
+import typing
+import asyncio
+import concurrent.futures
+from .vec3 import Vec3
+from .line3 import Line3
+from .plane3 import AnyPlane3
+from .vec3array import Vec3Array
+from .line3array import Line3Array
+from .plane3array import Plane3Array
+from .relations3array import (
+    POINT_INTERSECTION, LINE_INTERSECTION,
+    point_plane_distance_array, line_plane_intersection_array, plane_plane_intersection_array,
+)
+
+__all__ = [
+    'QueryStats3', 'QueryService3', 'point_plane_distance_batch', 'line_plane_intersection_batch',
+    'plane_plane_intersection_batch',
+]
+
+Args = typing.Tuple[typing.Any, ...]
+BatchFunc = typing.Callable[[typing.Sequence[Args]], typing.List[typing.Any]]
+# Error or result of a request.
+RequestOutcome = typing.Tuple[typing.Optional[Exception], typing.Any]
+
+class QueryStats3(typing.NamedTuple):
+    requests: int
+    batches: int
+    max_batch_size: int
+
+def point_plane_distance_batch(args: typing.Sequence[Args]) -> typing.List[float]:
+    '''Gives `point_plane_distance` of each `(point, plane)`, computed as one batch.'''
+    (points, planes) = zip(*args)
+    distances = point_plane_distance_array(Vec3Array(points), Plane3Array(planes))
+    return typing.cast(typing.List[float], distances.tolist())
+
+def line_plane_intersection_batch(
+    args: typing.Sequence[Args],
+) -> typing.List[typing.Union[Vec3, Line3, None]]:
+    '''Gives `line_plane_intersection` of each `(line, plane)`, computed as one batch.'''
+    (lines, planes) = zip(*args)
+    (status, points) = line_plane_intersection_array(Line3Array(lines), Plane3Array(planes))
+    return [
+        Vec3(*point) if kind == POINT_INTERSECTION else line if kind == LINE_INTERSECTION else None
+        for (kind, point, line) in zip(status.tolist(), points.data.tolist(), lines)
+    ]
+
+def plane_plane_intersection_batch(
+    args: typing.Sequence[Args],
+) -> typing.List[typing.Optional[Line3]]:
+    '''Gives `plane_plane_intersection` of each `(a_plane, b_plane)`, computed as one batch.'''
+    (a_planes, b_planes) = zip(*args)
+    (status, lines) = plane_plane_intersection_array(Plane3Array(a_planes), Plane3Array(b_planes))
+    return [
+        line if kind == LINE_INTERSECTION else None
+        for (kind, line) in zip(status.tolist(), lines)
+    ]
+
+def _run_split(func: BatchFunc, args: typing.Sequence[Args]) -> typing.List[RequestOutcome]:
+    '''Runs requests as one batch, gives error or result of each.
+
+    If batch fails (or gives other count of results), its halves are run the same way, so
+    `k` failing requests of `n` take about `2 k log2(n)` batches, not `n` batches of one.
+    '''
+    try:
+        results = func(args)
+        if len(results) != len(args):
+            raise ValueError(f'batch function gave {len(results)} results for {len(args)} requests')
+        return [(None, result) for result in results]
+    except Exception as error: # pylint: disable=broad-except
+        if len(args) == 1:
+            return [(error, None)]
+    middle = len(args) // 2
+    return _run_split(func, args[:middle]) + _run_split(func, args[middle:])
+
+class QueryService3: # pylint: disable=too-many-instance-attributes
+    '''Answers single queries of many asyncio clients by batched functions.
+
+    Requests to the same function are queued. Queue is run as one batch once its first
+    request waited `max_delay` seconds or it holds `max_batch` requests, so batches grow
+    with load. Batches run in executor (default one of event loop), at most `max_running`
+    at once: while they are busy, queues keep growing up to `max_batch` and are run as soon
+    as one of running batches is done. So request waits at most `max_delay` plus time of
+    queued batches, each bounded by `max_batch`.
+    Each caller gets result of its request. If batch fails, its halves are run recursively,
+    so only callers of failing requests get their errors, at cost of few more batches.
+    '''
+
+    def __init__(
+        self,
+        max_delay: float = 0.001,
+        max_batch: int = 4096,
+        max_running: int = 2,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+    ) -> None:
+        if max_batch <= 0 or max_running <= 0:
+            raise ValueError('max_batch and max_running must be positive')
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.max_running = max_running
+        self.executor = executor
+        self._queues: typing.Dict[BatchFunc, typing.List[typing.Tuple[Args, asyncio.Future]]] = {}
+        self._timers: typing.Dict[BatchFunc, asyncio.TimerHandle] = {}
+        # Queues ready to run, in order they got ready.
+        self._due: typing.Dict[BatchFunc, None] = {}
+        self._running: typing.Set[asyncio.Task] = set()
+        self._stats = QueryStats3(requests=0, batches=0, max_batch_size=0)
+
+    async def __aenter__(self) -> 'QueryService3':
+        return self
+
+    async def __aexit__(self, *_: typing.Any) -> None:
+        await self.drain()
+
+    async def point_plane_distance(self, target_point: Vec3, plane: AnyPlane3) -> float:
+        return typing.cast(
+            float, await self.submit(point_plane_distance_batch, target_point, plane),
+        )
+
+    async def line_plane_intersection(
+        self, line: Line3, plane: AnyPlane3,
+    ) -> typing.Union[Vec3, Line3, None]:
+        return typing.cast(
+            typing.Union[Vec3, Line3, None],
+            await self.submit(line_plane_intersection_batch, line, plane),
+        )
+
+    async def plane_plane_intersection(
+        self, a_plane: AnyPlane3, b_plane: AnyPlane3,
+    ) -> typing.Optional[Line3]:
+        return typing.cast(
+            typing.Optional[Line3],
+            await self.submit(plane_plane_intersection_batch, a_plane, b_plane),
+        )
+
+    async def submit(self, func: BatchFunc, *args: typing.Any) -> typing.Any:
+        '''Queues request to batch function, which takes list of arguments and gives results.'''
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        queue = self._queues.setdefault(func, [])
+        queue.append((args, future))
+        self._stats = self._stats._replace(requests=self._stats.requests + 1)
+        if len(queue) >= self.max_batch:
+            self._due[func] = None
+        elif len(queue) == 1 and func not in self._due:
+            self._timers[func] = loop.call_later(self.max_delay, self._expire, func)
+        self._dispatch()
+        return await future
+
+    async def drain(self) -> None:
+        '''Runs all queued requests and waits until they are done.'''
+        while self._queues or self._running:
+            for func in self._queues:
+                self._due[func] = None
+            self._dispatch()
+            await asyncio.wait(set(self._running))
+
+    def stats(self) -> QueryStats3:
+        return self._stats
+
+    def _expire(self, func: BatchFunc) -> None:
+        self._timers.pop(func, None)
+        if func in self._queues:
+            self._due[func] = None
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._due and len(self._running) < self.max_running:
+            func = next(iter(self._due))
+            timer = self._timers.pop(func, None)
+            if timer is not None:
+                timer.cancel()
+            queue = self._queues.pop(func)
+            (batch, rest) = (queue[:self.max_batch], queue[self.max_batch:])
+            if rest:
+                # The rest of full queue is run next, after other ready queues.
+                self._queues[func] = rest
+                self._due[func] = self._due.pop(func)
+            else:
+                del self._due[func]
+            self._stats = self._stats._replace(
+                batches=self._stats.batches + 1,
+                max_batch_size=max(self._stats.max_batch_size, len(batch)),
+            )
+            task = asyncio.get_running_loop().create_task(self._run(func, batch))
+            self._running.add(task)
+            task.add_done_callback(self._done)
+
+    def _done(self, task: asyncio.Task) -> None:
+        self._running.discard(task)
+        self._dispatch()
+
+    async def _run(
+        self, func: BatchFunc, batch: typing.List[typing.Tuple[Args, asyncio.Future]],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        requests = [args for (args, _) in batch]
+        outcomes = await loop.run_in_executor(self.executor, _run_split, func, requests)
+        for ((_, future), (error, result)) in zip(batch, outcomes):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
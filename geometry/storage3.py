@@ -0,0 +1,30 @@
+import typing
+import os
+import numpy as np
+
+__all__ = ['save_data', 'load_data']
+
+PathLike = typing.Union[str, os.PathLike]
+MmapMode = typing.Optional[typing.Literal['r', 'r+', 'c']]
+
+FLOAT_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+def save_data(path: PathLike, data: np.ndarray) -> None:
+    '''Saves buffer to file in `.npy` format.
+
+    The format is a short header (dtype, shape) followed by raw rows.
+    So file can be memory-mapped on load without any per-row parsing.
+    '''
+    with open(path, 'wb') as file:
+        np.save(file, np.ascontiguousarray(data), allow_pickle=False)
+
+def load_data(path: PathLike, columns: int, mmap_mode: MmapMode) -> np.ndarray:
+    '''Loads buffer saved by `save_data`.
+
+    With `mmap_mode` ("r", "r+", "c") rows are not read until accessed.
+    '''
+    data = np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+    if data.ndim != 2 or data.shape[1] != columns or data.dtype not in FLOAT_DTYPES:
+        raise ValueError(
+            f'expected (N, {columns}) float64 or float32 buffer, got {data.shape} {data.dtype}')
+    return data
@@ -0,0 +1,106 @@
+import typing
+import itertools
+import numpy as np
+from .vec3array import Vec3Array
+from .plane3 import AnyPlane3
+from .storage3 import PathLike
+from .transform3 import Transform3
+from .transform3array import transform_point3_array
+from .relations3array import (
+    point_plane_projection_array, point_plane_distance_array, point_plane_signed_distance_array,
+)
+
+__all__ = [
+    'read_points_binary', 'read_points_csv', 'write_points_binary', 'write_points_csv', 'pipeline',
+    'transform_stage', 'project_stage', 'distance_filter_stage', 'clip_stage',
+]
+
+# Stage takes chunk of points and gives processed chunk of points.
+Stage = typing.Callable[[Vec3Array], Vec3Array]
+
+DEFAULT_CHUNK_SIZE = 65536
+
+def read_points_binary(
+    path: PathLike, chunk_size: int = DEFAULT_CHUNK_SIZE, dtype: str = '<f8',
+) -> typing.Iterator[Vec3Array]:
+    '''Reads points from file of raw coordinates (x, y, z of each point one after another).
+
+    Gives chunks of up to `chunk_size` points, only one chunk is kept in memory.
+    '''
+    with open(path, 'rb') as file:
+        while True:
+            data = np.fromfile(file, dtype=dtype, count=chunk_size * 3)
+            if data.size == 0:
+                return
+            if data.size % 3 != 0:
+                raise ValueError(f'{path}: size is not multiple of 3 coordinates')
+            yield Vec3Array(data.reshape(-1, 3))
+
+def read_points_csv(
+    path: PathLike,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    delimiter: str = ',',
+    skip_rows: int = 0,
+) -> typing.Iterator[Vec3Array]:
+    '''Reads points from text file with x, y, z as the first three columns of each row.'''
+    with open(path, encoding='utf8') as file:
+        lines = itertools.islice(file, skip_rows, None)
+        while True:
+            chunk = list(itertools.islice(lines, chunk_size))
+            if not chunk:
+                return
+            yield Vec3Array(np.loadtxt(chunk, delimiter=delimiter, usecols=(0, 1, 2), ndmin=2))
+
+def write_points_binary(
+    path: PathLike, chunks: typing.Iterable[Vec3Array], dtype: str = '<f8',
+) -> int:
+    '''Writes points as raw coordinates, gives number of written points.'''
+    count = 0
+    with open(path, 'wb') as file:
+        for chunk in chunks:
+            chunk.data.astype(dtype, copy=False).tofile(file)
+            count += len(chunk)
+    return count
+
+def write_points_csv(
+    path: PathLike, chunks: typing.Iterable[Vec3Array], delimiter: str = ',',
+) -> int:
+    '''Writes points as rows of text, gives number of written points.'''
+    count = 0
+    with open(path, 'w', encoding='utf8') as file:
+        for chunk in chunks:
+            np.savetxt(file, chunk.data, delimiter=delimiter, fmt='%.17g')
+            count += len(chunk)
+    return count
+
+def pipeline(
+    source: typing.Iterable[Vec3Array], *stages: Stage,
+) -> typing.Iterator[Vec3Array]:
+    '''Applies stages to each chunk of source in order.
+
+    Chunks are processed one at a time as they are consumed, empty chunks are dropped.
+    '''
+    for chunk in source:
+        for stage in stages:
+            chunk = stage(chunk)
+        if len(chunk) > 0:
+            yield chunk
+
+def transform_stage(transform: Transform3) -> Stage:
+    return lambda points: transform_point3_array(transform, points)
+
+def project_stage(plane: AnyPlane3) -> Stage:
+    '''Projects points onto plane.'''
+    return lambda points: point_plane_projection_array(points, plane)
+
+def distance_filter_stage(plane: AnyPlane3, max_distance: float) -> Stage:
+    '''Keeps points that are not farther than `max_distance` from plane.'''
+    def stage(points: Vec3Array) -> Vec3Array:
+        return points[point_plane_distance_array(points, plane) <= max_distance]
+    return stage
+
+def clip_stage(plane: AnyPlane3) -> Stage:
+    '''Keeps points that are on the plane or on the side plane normal points to.'''
+    def stage(points: Vec3Array) -> Vec3Array:
+        return points[point_plane_signed_distance_array(points, plane) >= 0]
+    return stage
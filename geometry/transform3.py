@@ -0,0 +1,134 @@
+import typing
+import math
+from .vec3 import Vec3, ZERO3, XUNIT3, YUNIT3, ZUNIT3, add3, neg3, mul3, dot3, norm3, len3
+from .line3 import Line3
+from .plane3 import Plane3, AnyPlane3
+
+__all__ = [
+    'IDENTITY_MAT3', 'Transform3', 'IDENTITY_TRANSFORM3', 'mul_mat3_vec3', 'transpose_mat3',
+    'mul_mat3', 'inverse_mat3', 'make_transform3', 'translation3', 'rotation3', 'scaling3',
+    'compose3', 'inverse3', 'transform_point3', 'transform_vec3', 'transform_line3',
+    'transform_plane3',
+]
+
+# Matrix is kept as three rows.
+Mat3 = typing.Tuple[Vec3, Vec3, Vec3]
+
+IDENTITY_MAT3: Mat3 = (XUNIT3, YUNIT3, ZUNIT3)
+
+class Transform3(typing.NamedTuple):
+    '''Affine transform `x -> matrix * x + offset`.
+
+    Inverse of linear part is kept along so that planes (which are transformed
+    by inverse transpose) and inverse transform do not need matrix inversion on each use.
+    '''
+    matrix: Mat3
+    offset: Vec3
+    inverse_matrix: Mat3
+
+IDENTITY_TRANSFORM3 = Transform3(matrix=IDENTITY_MAT3, offset=ZERO3, inverse_matrix=IDENTITY_MAT3)
+
+def mul_mat3_vec3(m: Mat3, v: Vec3) -> Vec3:
+    (row_x, row_y, row_z) = m
+    return Vec3(dot3(row_x, v), dot3(row_y, v), dot3(row_z, v))
+
+def transpose_mat3(m: Mat3) -> Mat3:
+    ((xx, xy, xz), (yx, yy, yz), (zx, zy, zz)) = m
+    return (Vec3(xx, yx, zx), Vec3(xy, yy, zy), Vec3(xz, yz, zz))
+
+def mul_mat3(a: Mat3, b: Mat3) -> Mat3:
+    columns = transpose_mat3(b)
+    (row_x, row_y, row_z) = (mul_mat3_vec3(columns, row) for row in a)
+    return (row_x, row_y, row_z)
+
+def inverse_mat3(m: Mat3) -> Mat3:
+    '''Inverts matrix.
+
+    For matrix rows `a, b, c` inverse columns are `b x c`, `c x a`, `a x b`
+    divided by determinant `(a, b x c)`.
+    '''
+    ((ax, ay, az), (bx, by, bz), (cx, cy, cz)) = m
+    bc = Vec3(by * cz - bz * cy, bz * cx - bx * cz, bx * cy - by * cx)
+    ca = Vec3(cy * az - cz * ay, cz * ax - cx * az, cx * ay - cy * ax)
+    ab = Vec3(ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx)
+    det = ax * bc.x + ay * bc.y + az * bc.z
+    if math.isclose(det, 0):
+        raise ValueError('matrix is not invertible')
+    return transpose_mat3((mul3(bc, 1 / det), mul3(ca, 1 / det), mul3(ab, 1 / det)))
+
+def make_transform3(matrix: Mat3, offset: Vec3 = ZERO3) -> Transform3:
+    return Transform3(matrix=matrix, offset=offset, inverse_matrix=inverse_mat3(matrix))
+
+def translation3(offset: Vec3) -> Transform3:
+    return Transform3(matrix=IDENTITY_MAT3, offset=offset, inverse_matrix=IDENTITY_MAT3)
+
+def rotation3(axis: Vec3, angle: float) -> Transform3:
+    '''Makes rotation around axis by angle (counterclockwise when looking against axis).
+
+    Rotation matrix is orthogonal so its inverse is its transpose.
+    '''
+    c = math.cos(angle)
+    s = math.sin(angle)
+    t = 1 - c
+    (nx, ny, nz) = norm3(axis)
+    matrix = (
+        Vec3(nx * nx * t + c, nx * ny * t - nz * s, nx * nz * t + ny * s),
+        Vec3(ny * nx * t + nz * s, ny * ny * t + c, ny * nz * t - nx * s),
+        Vec3(nz * nx * t - ny * s, nz * ny * t + nx * s, nz * nz * t + c),
+    )
+    return Transform3(matrix=matrix, offset=ZERO3, inverse_matrix=transpose_mat3(matrix))
+
+def scaling3(factors: Vec3) -> Transform3:
+    (kx, ky, kz) = factors
+    if math.isclose(kx * ky * kz, 0):
+        raise ValueError('scaling is not invertible')
+    return Transform3(
+        matrix=(Vec3(kx, 0, 0), Vec3(0, ky, 0), Vec3(0, 0, kz)),
+        offset=ZERO3,
+        inverse_matrix=(Vec3(1 / kx, 0, 0), Vec3(0, 1 / ky, 0), Vec3(0, 0, 1 / kz)),
+    )
+
+def compose3(outer: Transform3, inner: Transform3) -> Transform3:
+    '''Makes transform that applies `inner` and then `outer`.'''
+    return Transform3(
+        matrix=mul_mat3(outer.matrix, inner.matrix),
+        offset=add3(mul_mat3_vec3(outer.matrix, inner.offset), outer.offset),
+        inverse_matrix=mul_mat3(inner.inverse_matrix, outer.inverse_matrix),
+    )
+
+def inverse3(transform: Transform3) -> Transform3:
+    '''Inverts transform.
+
+    `x' = M * x + o` gives `x = M^-1 * x' - M^-1 * o`.
+    '''
+    return Transform3(
+        matrix=transform.inverse_matrix,
+        offset=neg3(mul_mat3_vec3(transform.inverse_matrix, transform.offset)),
+        inverse_matrix=transform.matrix,
+    )
+
+def transform_point3(transform: Transform3, point: Vec3) -> Vec3:
+    return add3(mul_mat3_vec3(transform.matrix, point), transform.offset)
+
+def transform_vec3(transform: Transform3, v: Vec3) -> Vec3:
+    '''Transforms direction vector, offset is not applied.'''
+    return mul_mat3_vec3(transform.matrix, v)
+
+def transform_line3(transform: Transform3, line: Line3) -> Line3:
+    return Line3(
+        anchor=transform_point3(transform, line.anchor),
+        direction=transform_vec3(transform, line.direction),
+    )
+
+def transform_plane3(transform: Transform3, plane: AnyPlane3) -> Plane3:
+    '''Transforms plane.
+
+    Plane points satisfy `(n, x) = d` (n is unit normal). Substitution of `x = M^-1 * (x' - o)`
+    gives `(M^-T * n, x') = d + (M^-T * n, o)`.
+    So normal is transformed by inverse transpose and distance is shifted along it.
+    Result normal is normalized.
+    '''
+    normal = mul_mat3_vec3(transpose_mat3(transform.inverse_matrix), plane.unit_normal)
+    normal_len = len3(normal)
+    distance = plane.distance + dot3(normal, transform.offset)
+    return Plane3(normal=mul3(normal, 1 / normal_len), distance=distance / normal_len)
@@ -0,0 +1,55 @@
+import typing
+import numpy as np
+import numpy.typing as npt
+from .vec3array import Vec3Array, Vec3Like, as_data3, dot_data
+from .line3array import Line3Array, Line3Like, as_line_data3
+from .plane3array import Plane3Array, Plane3Like, as_plane_data3
+from .transform3 import Transform3
+
+__all__ = [
+    'transform_point3_array', 'transform_vec3_array', 'transform_line3_array',
+    'transform_plane3_array',
+]
+
+def transform_data(
+    transform: Transform3, dtype: npt.DTypeLike = np.float64,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    '''Gives (3, 3) matrix and (3,) offset buffers of transform.
+
+    Transform takes dtype of transformed buffer, so float32 arrays stay float32.
+    '''
+    return (
+        np.array(transform.matrix, dtype=dtype),
+        np.array(transform.offset, dtype=dtype),
+    )
+
+def transform_point3_array(transform: Transform3, point: Vec3Like) -> Vec3Array:
+    points = as_data3(point)
+    (matrix, offset) = transform_data(transform, points.dtype)
+    return Vec3Array(points @ matrix.T + offset)
+
+def transform_vec3_array(transform: Transform3, v: Vec3Like) -> Vec3Array:
+    data = as_data3(v)
+    return Vec3Array(data @ np.array(transform.matrix, dtype=data.dtype).T)
+
+def transform_line3_array(transform: Transform3, line: Line3Like) -> Line3Array:
+    lines = as_line_data3(line)
+    (matrix, offset) = transform_data(transform, lines.dtype)
+    result = np.empty_like(lines)
+    result[:, 0:3] = lines[:, 0:3] @ matrix.T + offset
+    result[:, 3:6] = lines[:, 3:6] @ matrix.T
+    return Line3Array(result)
+
+def transform_plane3_array(transform: Transform3, plane: Plane3Like) -> Plane3Array:
+    '''Transforms planes by inverse transpose of transform matrix, see `transform_plane3`.'''
+    planes = as_plane_data3(plane)
+    normal = planes[:, 0:3]
+    normal = normal / np.sqrt(dot_data(normal, normal))[:, np.newaxis]
+    # Row vectors: `(M^-T * n)^T = n^T * M^-1`.
+    normal = normal @ np.array(transform.inverse_matrix, dtype=planes.dtype)
+    normal_len = np.sqrt(dot_data(normal, normal))
+    distance = planes[:, 3] + normal @ np.array(transform.offset, dtype=planes.dtype)
+    result = np.empty_like(planes)
+    result[:, 0:3] = normal / normal_len[:, np.newaxis]
+    result[:, 3] = distance / normal_len
+    return Plane3Array(result)
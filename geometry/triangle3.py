@@ -0,0 +1,28 @@
+import typing
+from .vec3 import Vec3, sub3, eq3, cross3, norm3, dot3
+from .plane3 import Plane3
+
+__all__ = ['Triangle3', 'eq_triangle3', 'triangle_normal3', 'triangle_plane3']
+
+class Triangle3(typing.NamedTuple):
+    a: Vec3
+    b: Vec3
+    c: Vec3
+
+    def __eq__(self, other: object) -> bool:
+        try:
+            return eq_triangle3(self, typing.cast(Triangle3, other))
+        except: # pylint: disable=bare-except
+            return False
+
+def eq_triangle3(a: Triangle3, b: Triangle3, tolerance: typing.Optional[float] = None) -> bool:
+    return eq3(a.a, b.a, tolerance) and eq3(a.b, b.b, tolerance) and eq3(a.c, b.c, tolerance)
+
+def triangle_normal3(triangle: Triangle3) -> Vec3:
+    '''Gives triangle normal `(b - a) x (c - a)`, its length is twice the triangle area.'''
+    return cross3(sub3(triangle.b, triangle.a), sub3(triangle.c, triangle.a))
+
+def triangle_plane3(triangle: Triangle3) -> Plane3:
+    '''Gives plane that contains triangle, plane normal is directed as `triangle_normal3`.'''
+    normal = triangle_normal3(triangle)
+    return Plane3(normal=normal, distance=dot3(norm3(normal), triangle.a))
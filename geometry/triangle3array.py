@@ -0,0 +1,93 @@
+import typing
+import numpy as np
+import numpy.typing as npt
+from .vec3 import Vec3
+from .storage3 import PathLike, MmapMode, save_data, load_data
+from .vec3array import Vec3Array, Vec3Like, as_data3, float_data, isclose_data
+from .triangle3 import Triangle3
+
+__all__ = ['Triangle3Array', 'save_triangle3_array', 'load_triangle3_array']
+
+def _to_triangle3(row: typing.Sequence[float]) -> Triangle3:
+    (ax, ay, az, bx, by, bz, cx, cy, cz) = row
+    return Triangle3(a=Vec3(ax, ay, az), b=Vec3(bx, by, bz), c=Vec3(cx, cy, cz))
+
+class Triangle3Array:
+    '''Array of triangles stored as (N, 9) float64 or float32 buffer.
+
+    Each row keeps vertices a, b, c one after another.
+    It takes 72 bytes per triangle, buffer can be saved to file and memory-mapped back.
+    '''
+    __slots__ = ('data',)
+
+    def __init__(
+        self, items: typing.Any = (), dtype: typing.Optional[npt.DTypeLike] = None,
+    ) -> None:
+        data = float_data(items, dtype)
+        if data.ndim == 3:
+            data = data.reshape(len(data), 9)
+        if data.size == 0:
+            data = data.reshape(0, 9)
+        if data.ndim != 2 or data.shape[1] != 9:
+            raise ValueError(f'expected (N, 9) shape, got {data.shape}')
+        self.data: np.ndarray = data
+
+    @staticmethod
+    def from_parts(a: Vec3Like, b: Vec3Like, c: Vec3Like) -> 'Triangle3Array':
+        return Triangle3Array(np.concatenate(
+            np.broadcast_arrays(as_data3(a), as_data3(b), as_data3(c)), axis=1,
+        ))
+
+    @property
+    def a(self) -> Vec3Array:
+        return Vec3Array(self.data[:, 0:3])
+
+    @property
+    def b(self) -> Vec3Array:
+        return Vec3Array(self.data[:, 3:6])
+
+    @property
+    def c(self) -> Vec3Array:
+        return Vec3Array(self.data[:, 6:9])
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: typing.Any) -> typing.Any:
+        if isinstance(index, (int, np.integer)):
+            return _to_triangle3(self.data[index].tolist())
+        return Triangle3Array(self.data[index])
+
+    def __iter__(self) -> typing.Iterator[Triangle3]:
+        for row in self.data.tolist():
+            yield _to_triangle3(row)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Triangle3Array) or len(self) != len(other):
+            return False
+        return bool(np.all(isclose_data(self.data, other.data)))
+
+    __hash__ = None # type: ignore
+
+    def __repr__(self) -> str:
+        return f'Triangle3Array({self.to_list()!r})'
+
+    def to_list(self) -> typing.List[Triangle3]:
+        return list(self)
+
+    def astype(self, dtype: npt.DTypeLike) -> 'Triangle3Array':
+        return Triangle3Array(self.data, dtype)
+
+Triangle3Like = typing.Union[Triangle3Array, Triangle3]
+
+def as_triangle_data3(triangle: Triangle3Like) -> np.ndarray:
+    '''Gives (N, 9) buffer of array or (1, 9) buffer of single triangle.'''
+    if isinstance(triangle, Triangle3Array):
+        return triangle.data
+    return np.asarray(triangle, dtype=np.float64).reshape(1, 9)
+
+def save_triangle3_array(path: PathLike, triangles: Triangle3Array) -> None:
+    save_data(path, triangles.data)
+
+def load_triangle3_array(path: PathLike, mmap_mode: MmapMode = 'r') -> Triangle3Array:
+    return Triangle3Array(load_data(path, 9, mmap_mode))
@@ -1,6 +1,12 @@
 import typing
 import math
 
+__all__ = [
+    'Vec3', 'ZERO3', 'UNIT3', 'XUNIT3', 'YUNIT3', 'ZUNIT3', 'eq3', 'key3', 'dot3', 'len3',
+    'is_zero3', 'is_unit3', 'mul3', 'neg3', 'pos3', 'norm3', 'add3', 'sub3', 'cross3', 'angle3',
+    'orthogonal3', 'collinear3', 'rotate3', 'project3',
+]
+
 class Vec3(typing.NamedTuple):
     x: float
     y: float
@@ -18,11 +24,28 @@ XUNIT3 = Vec3(1, 0, 0)
 YUNIT3 = Vec3(0, 1, 0)
 ZUNIT3 = Vec3(0, 0, 1)
 
-def eq3(a: Vec3, b: Vec3) -> bool:
+def eq3(a: Vec3, b: Vec3, tolerance: typing.Optional[float] = None) -> bool:
+    '''Compares vectors.
+
+    Without tolerance components are compared with `math.isclose`.
+    With tolerance components must differ by no more than tolerance.
+    '''
     (ax, ay, az) = a
     (bx, by, bz) = b
+    if tolerance is not None:
+        return abs(ax - bx) <= tolerance and abs(ay - by) <= tolerance and abs(az - bz) <= tolerance
     return math.isclose(ax, bx) and math.isclose(ay, by) and math.isclose(az, bz)
 
+def key3(v: Vec3, tolerance: float) -> typing.Tuple[int, int, int]:
+    '''Quantizes vector onto grid with cell size equal to tolerance.
+
+    Vectors with same key are equal with that tolerance.
+    Vectors equal with that tolerance have keys that differ by no more than 1 in each component.
+    Unlike `Vec3` hash, key is consistent with tolerant equality and can be used in dicts.
+    '''
+    (vx, vy, vz) = v
+    return (math.floor(vx / tolerance), math.floor(vy / tolerance), math.floor(vz / tolerance))
+
 def dot3(a: Vec3, b: Vec3) -> float:
     (ax, ay, az) = a
     (bx, by, bz) = b
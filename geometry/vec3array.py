@@ -0,0 +1,213 @@
+import typing
+import numpy as np
+import numpy.typing as npt
+from .vec3 import Vec3
+from .storage3 import FLOAT_DTYPES
+
+__all__ = [
+    'REL_TOL', 'ABS_TOL', 'REL_TOLS', 'ZERO_REL_TOLS', 'ABS_TOLS', 'Vec3Array', 'eq3_array',
+    'key3_array', 'dot3_array', 'len3_array', 'is_zero3_array', 'is_unit3_array', 'mul3_array',
+    'neg3_array',
+    'pos3_array', 'norm3_array', 'add3_array', 'sub3_array', 'cross3_array', 'angle3_array',
+    'orthogonal3_array', 'collinear3_array', 'rotate3_array', 'project3_array',
+]
+
+# Same tolerances as `math.isclose` defaults used by scalar functions.
+REL_TOL = 1e-9
+ABS_TOL = 0.0
+
+# Relative tolerances of predicates by dtype of buffers (`FLOAT_DTYPES`).
+# Float32 halves memory traffic, its tolerance is about a hundred float32 epsilons.
+REL_TOLS = {np.dtype(np.float64): REL_TOL, np.dtype(np.float32): 1e-5}
+
+# Tolerances of zero tests by dtype. Float64 ones test for exact zero as `math.isclose(x, 0)`
+# of scalar functions does, so batched results agree with scalar ones. Rounding of float32
+# leaves products of parallel vectors nonzero, so float32 values are zero within relative
+# tolerance of magnitude of their operands, or within absolute tolerance (about ten thousand
+# epsilons) when there are no operands to scale by (such as length of a single vector).
+ZERO_REL_TOLS = {np.dtype(np.float64): 0.0, np.dtype(np.float32): REL_TOLS[np.dtype(np.float32)]}
+ABS_TOLS = {np.dtype(np.float64): ABS_TOL, np.dtype(np.float32): 1e-6}
+
+class Vec3Array:
+    '''Array of vectors stored as (N, 3) float64 or float32 buffer.
+
+    Buffer is contiguous unless array is a view into a larger buffer (such as line anchors).
+    Functions in this module accept either `Vec3Array` or single `Vec3` arguments.
+    Single vector is broadcast against all rows of array arguments.
+    Results follow NumPy type promotion: float32 arrays give float32 results, but single
+    vectors are float64, so they promote float32 arguments (convert them to float32 arrays
+    to stay in float32). Predicates use tolerances of dtype, see `REL_TOLS` and `ZERO_REL_TOLS`.
+    '''
+    __slots__ = ('data',)
+
+    def __init__(
+        self, items: typing.Any = (), dtype: typing.Optional[npt.DTypeLike] = None,
+    ) -> None:
+        data = float_data(items, dtype)
+        if data.size == 0:
+            data = data.reshape(0, 3)
+        if data.ndim != 2 or data.shape[1] != 3:
+            raise ValueError(f'expected (N, 3) shape, got {data.shape}')
+        self.data: np.ndarray = data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: typing.Any) -> typing.Any:
+        if isinstance(index, (int, np.integer)):
+            return Vec3(*self.data[index].tolist())
+        return Vec3Array(self.data[index])
+
+    def __iter__(self) -> typing.Iterator[Vec3]:
+        for item in self.data.tolist():
+            yield Vec3(*item)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Vec3Array) or len(self) != len(other):
+            return False
+        return bool(np.all(eq3_array(self, other)))
+
+    __hash__ = None # type: ignore
+
+    def __repr__(self) -> str:
+        return f'Vec3Array({self.data.tolist()!r})'
+
+    def to_list(self) -> typing.List[Vec3]:
+        return list(self)
+
+    def astype(self, dtype: npt.DTypeLike) -> 'Vec3Array':
+        return Vec3Array(self.data, dtype)
+
+Vec3Like = typing.Union[Vec3Array, Vec3]
+Scalars = typing.Union[float, np.ndarray]
+
+def float_data(items: typing.Any, dtype: typing.Optional[npt.DTypeLike] = None) -> np.ndarray:
+    '''Converts items to buffer of one of `FLOAT_DTYPES`.
+
+    Without dtype float32 buffers stay float32 and anything else becomes float64.
+    '''
+    if dtype is None:
+        dtype = np.float32 if getattr(items, 'dtype', None) == np.float32 else np.float64
+    if np.dtype(dtype) not in FLOAT_DTYPES:
+        raise ValueError(f'expected float64 or float32 dtype, got {np.dtype(dtype)}')
+    return np.asarray(items, dtype=dtype)
+
+def as_data3(v: Vec3Like) -> np.ndarray:
+    '''Gives (N, 3) buffer of array or (1, 3) buffer of single vector.'''
+    if isinstance(v, Vec3Array):
+        return v.data
+    return np.asarray(v, dtype=np.float64).reshape(1, 3)
+
+def isclose_data(a: np.ndarray, b: typing.Any) -> np.ndarray:
+    '''Vectorized `math.isclose` with default tolerances of dtype of `a`.'''
+    rel_tol = REL_TOLS.get(np.result_type(a), REL_TOL)
+    return np.abs(a - b) <= np.maximum(rel_tol * np.maximum(np.abs(a), np.abs(b)), ABS_TOL)
+
+def iszero_data(
+    value: np.ndarray,
+    scale: typing.Any = 0.0,
+    rel_tols: typing.Optional[typing.Mapping[typing.Any, float]] = None,
+) -> np.ndarray:
+    '''Tests values for zero with tolerances of dtype of `value`, see `ZERO_REL_TOLS`.
+
+    Value computed from operands (such as dot or cross product) has rounding error relative
+    to their magnitude `scale` (such as product of their lengths), so it is zero if it is
+    within relative tolerance of scale. Without scale it is compared with absolute tolerance.
+    Code with no scalar counterpart to agree with may pass `REL_TOLS` to scale float64 too.
+    '''
+    dtype = np.result_type(value)
+    tol = ABS_TOLS.get(dtype, ABS_TOL)
+    rel_tol = (ZERO_REL_TOLS if rel_tols is None else rel_tols).get(dtype, 0.0)
+    if rel_tol:
+        tol = np.maximum(rel_tol * scale, tol)
+    return np.abs(value) <= tol
+
+def dot_data(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.einsum('...i,...i->...', a, b)
+
+def norm_data(v: np.ndarray) -> np.ndarray:
+    vec_len = np.sqrt(dot_data(v, v))[..., np.newaxis]
+    return np.divide(v, vec_len, out=np.zeros_like(v), where=vec_len != 0)
+
+def cross_data(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.cross(a, b)
+
+def eq3_array(a: Vec3Like, b: Vec3Like) -> np.ndarray:
+    return np.all(isclose_data(as_data3(a), as_data3(b)), axis=-1)
+
+def key3_array(v: Vec3Like, tolerance: float) -> np.ndarray:
+    '''Quantizes vectors onto grid with cell size equal to tolerance, see `key3`.
+
+    Gives (N, 3) int64 keys, rows can be grouped with `np.unique(keys, axis=0)`.
+    '''
+    return np.floor(as_data3(v) / tolerance).astype(np.int64)
+
+def dot3_array(a: Vec3Like, b: Vec3Like) -> np.ndarray:
+    return dot_data(as_data3(a), as_data3(b))
+
+def len3_array(v: Vec3Like) -> np.ndarray:
+    return np.sqrt(dot3_array(v, v))
+
+def is_zero3_array(v: Vec3Like) -> np.ndarray:
+    return iszero_data(len3_array(v))
+
+def is_unit3_array(v: Vec3Like) -> np.ndarray:
+    return isclose_data(dot3_array(v, v), 1)
+
+def mul3_array(v: Vec3Like, k: Scalars) -> Vec3Array:
+    factor = np.asarray(k)
+    return Vec3Array(as_data3(v) * (factor[..., np.newaxis] if factor.ndim else k))
+
+def neg3_array(v: Vec3Like) -> Vec3Array:
+    return Vec3Array(-as_data3(v))
+
+def pos3_array(v: Vec3Like) -> Vec3Array:
+    return Vec3Array(+as_data3(v))
+
+def norm3_array(v: Vec3Like) -> Vec3Array:
+    return Vec3Array(norm_data(as_data3(v)))
+
+def add3_array(a: Vec3Like, b: Vec3Like) -> Vec3Array:
+    return Vec3Array(as_data3(a) + as_data3(b))
+
+def sub3_array(a: Vec3Like, b: Vec3Like) -> Vec3Array:
+    return Vec3Array(as_data3(a) - as_data3(b))
+
+def cross3_array(a: Vec3Like, b: Vec3Like) -> Vec3Array:
+    return Vec3Array(cross_data(as_data3(a), as_data3(b)))
+
+def angle3_array(a: Vec3Like, b: Vec3Like) -> np.ndarray:
+    cos = dot_data(norm_data(as_data3(a)), norm_data(as_data3(b)))
+    return np.arccos(np.clip(cos, -1, 1))
+
+def orthogonal3_array(a: Vec3Like, b: Vec3Like) -> np.ndarray:
+    '''Tests cosine of angle for zero: dot product within tolerance of product of lengths.'''
+    return iszero_data(dot3_array(a, b), len3_array(a) * len3_array(b))
+
+def collinear3_array(a: Vec3Like, b: Vec3Like) -> np.ndarray:
+    '''Tests sine of angle for zero: cross product within tolerance of product of lengths.'''
+    return iszero_data(len3_array(cross3_array(a, b)), len3_array(a) * len3_array(b))
+
+def rotate3_array(v: Vec3Like, axis: Vec3Like, angle: Scalars) -> Vec3Array:
+    '''Rotates vectors around axes.
+
+    Uses the same rotation matrix as `rotate3`, evaluated for all rows at once.
+    '''
+    angle = float_data(angle).reshape(-1)
+    c = np.cos(angle)
+    s = np.sin(angle)
+    t = 1 - c
+    n = norm_data(as_data3(axis))
+    (nx, ny, nz) = (n[:, 0], n[:, 1], n[:, 2])
+    data = as_data3(v)
+    (vx, vy, vz) = (data[:, 0], data[:, 1], data[:, 2])
+    return Vec3Array(np.stack((
+        vx * (nx * nx * t + c) + vy * (nx * ny * t - nz * s) + vz * (nx * nz * t + ny * s),
+        vx * (ny * nx * t - nz * s) + vy * (ny * ny * t + c) + vz * (ny * nz * t - nx * s),
+        vx * (nz * nx * t - ny * s) + vy * (nz * ny * t + nx * s) + vz * (nz * nz * t + c),
+    ), axis=-1))
+
+def project3_array(v: Vec3Like, axis: Vec3Like) -> Vec3Array:
+    vec_dir = norm_data(as_data3(axis))
+    vec_len = dot_data(as_data3(v), vec_dir)
+    return Vec3Array(vec_dir * vec_len[..., np.newaxis])
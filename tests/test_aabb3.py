@@ -0,0 +1,78 @@
+import unittest
+# pylint: disable=W0401,W0614
+from geometry.aabb3 import *
+from geometry.vec3 import Vec3
+from geometry.plane3 import Plane3, prepare_plane3
+
+BOX = AABB3(lower=Vec3(0, 0, 0), upper=Vec3(2, 4, 6))
+
+# Cube [-1, 1]^3 with normals inwards.
+FRUSTUM = [
+    Plane3(normal=Vec3(1, 0, 0), distance=-1), Plane3(normal=Vec3(-1, 0, 0), distance=-1),
+    Plane3(normal=Vec3(0, 2, 0), distance=-1), Plane3(normal=Vec3(0, -2, 0), distance=-1),
+    Plane3(normal=Vec3(0, 0, 3), distance=-1), Plane3(normal=Vec3(0, 0, -3), distance=-1),
+]
+
+class TestAABB3(unittest.TestCase):
+    def test_points_aabb3(self):
+        self.assertEqual(points_aabb3([Vec3(2, 0, 6), Vec3(0, 4, 1), Vec3(1, 1, 0)]), BOX)
+        self.assertEqual(points_aabb3([Vec3(1, 2, 3)]), AABB3(Vec3(1, 2, 3), Vec3(1, 2, 3)))
+        self.assertTrue(is_empty_aabb3(points_aabb3([])))
+        self.assertFalse(is_empty_aabb3(BOX))
+
+    def test_center_size(self):
+        self.assertEqual(center_aabb3(BOX), Vec3(1, 2, 3))
+        self.assertEqual(size_aabb3(BOX), Vec3(2, 4, 6))
+
+    def test_union_aabb3(self):
+        other = AABB3(lower=Vec3(-1, 1, 1), upper=Vec3(1, 5, 2))
+        self.assertEqual(union_aabb3(BOX, other), AABB3(Vec3(-1, 0, 0), Vec3(2, 5, 6)))
+        self.assertEqual(union_aabb3(BOX, EMPTY_AABB3), BOX)
+        self.assertEqual(union_aabb3(EMPTY_AABB3, BOX), BOX)
+
+    def test_expand_aabb3(self):
+        self.assertEqual(expand_aabb3(BOX, 1), AABB3(Vec3(-1, -1, -1), Vec3(3, 5, 7)))
+        self.assertEqual(expand_aabb3(BOX, -1), AABB3(Vec3(1, 1, 1), Vec3(1, 3, 5)))
+        self.assertTrue(is_empty_aabb3(expand_aabb3(EMPTY_AABB3, 1)))
+
+    def test_intersection_aabb3(self):
+        self.assertEqual(
+            intersection_aabb3(BOX, AABB3(Vec3(-1, 1, 1), Vec3(1, 5, 2))),
+            AABB3(Vec3(0, 1, 1), Vec3(1, 4, 2)),
+        )
+        self.assertEqual(
+            intersection_aabb3(BOX, AABB3(Vec3(2, 4, 6), Vec3(3, 5, 7))),
+            AABB3(Vec3(2, 4, 6), Vec3(2, 4, 6)),
+        )
+        self.assertEqual(intersection_aabb3(BOX, AABB3(Vec3(3, 0, 0), Vec3(4, 1, 1))), None)
+        self.assertEqual(intersection_aabb3(BOX, EMPTY_AABB3), None)
+
+    def test_aabb_plane_classification(self):
+        for (plane, expected) in [
+            (Plane3(normal=Vec3(0, 0, 2), distance=-1), INSIDE),
+            (Plane3(normal=Vec3(0, 0, 2), distance=0), INSIDE),
+            (Plane3(normal=Vec3(0, 0, 2), distance=3), INTERSECTING),
+            (Plane3(normal=Vec3(0, 0, 2), distance=6), INTERSECTING),
+            (Plane3(normal=Vec3(0, 0, 2), distance=7), OUTSIDE),
+            (Plane3(normal=Vec3(0, 0, -2), distance=-6), INSIDE),
+            (Plane3(normal=Vec3(1, 1, 0), distance=-0.1), INSIDE),
+            (Plane3(normal=Vec3(1, 1, 0), distance=1), INTERSECTING),
+            (Plane3(normal=Vec3(-1, -1, 0), distance=0.1), OUTSIDE),
+        ]:
+            self.assertEqual(aabb_plane_classification(BOX, plane), expected)
+            self.assertEqual(aabb_plane_classification(BOX, prepare_plane3(plane)), expected)
+        self.assertEqual(
+            aabb_plane_classification(EMPTY_AABB3, Plane3(Vec3(0, 0, 1), -100)), OUTSIDE)
+
+    def test_aabb_frustum_classification(self):
+        for (box, expected) in [
+            (AABB3(Vec3(-0.5, -0.5, -0.5), Vec3(0.5, 0.5, 0.5)), INSIDE),
+            (AABB3(Vec3(-1, -1, -1), Vec3(1, 1, 1)), INSIDE),
+            (AABB3(Vec3(0.5, 0.5, 0.5), Vec3(2, 2, 2)), INTERSECTING),
+            (AABB3(Vec3(-5, -5, -5), Vec3(5, 5, 5)), INTERSECTING),
+            (AABB3(Vec3(2, 0, 0), Vec3(3, 1, 1)), OUTSIDE),
+            (AABB3(Vec3(0, 0, -3), Vec3(0, 0, -2)), OUTSIDE),
+            (EMPTY_AABB3, OUTSIDE),
+        ]:
+            self.assertEqual(aabb_frustum_classification(box, FRUSTUM), expected)
+        self.assertEqual(aabb_frustum_classification(BOX, []), INSIDE)
@@ -0,0 +1,89 @@
+import unittest
+import numpy as np
+import geometry.aabb3 as b3
+# pylint: disable=W0401,W0614
+from geometry.aabb3array import *
+from geometry.aabb3 import EMPTY_AABB3
+from geometry.vec3 import Vec3
+from geometry.vec3array import Vec3Array
+from geometry.plane3 import Plane3
+from geometry.plane3array import Plane3Array
+
+def random_boxes(rng, count):
+    corners = rng.integers(-5, 6, size=(count, 2, 3))
+    return AABB3Array(np.concatenate((corners.min(axis=1), corners.max(axis=1)), axis=1))
+
+FRUSTUM = [
+    Plane3(normal=Vec3(1, 0, 0), distance=-1), Plane3(normal=Vec3(-1, 0, 0), distance=-1),
+    Plane3(normal=Vec3(0, 2, 0), distance=-1), Plane3(normal=Vec3(0, -2, 0), distance=-1),
+    Plane3(normal=Vec3(1, 1, 3), distance=-1), Plane3(normal=Vec3(0, 0, -3), distance=-1),
+]
+
+class TestAABB3Array(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.boxes = AABB3Array(np.concatenate((
+            random_boxes(rng, 100).data, [EMPTY_AABB3.lower + EMPTY_AABB3.upper],
+        )))
+        self.other_boxes = random_boxes(rng, 101)
+
+    def test_storage(self):
+        boxes = AABB3Array(self.boxes.data[:3])
+        self.assertEqual(boxes.data.shape, (3, 6))
+        self.assertEqual(AABB3Array(boxes.to_list()), boxes)
+        self.assertEqual(AABB3Array.from_parts(boxes.lower, boxes.upper), boxes)
+        self.assertEqual(AABB3Array().data.shape, (0, 6))
+        with self.assertRaises(ValueError):
+            AABB3Array(np.zeros((2, 4)))
+
+    def test_points_aabb3_array(self):
+        points = Vec3Array(np.random.default_rng(2).uniform(-10, 10, (1000, 3)))
+        self.assertEqual(points_aabb3_array(points), b3.points_aabb3(points))
+        self.assertEqual(points_aabb3_array(Vec3Array()), b3.EMPTY_AABB3)
+
+    def test_box_operations(self):
+        self.assertEqual(
+            is_empty_aabb3_array(self.boxes).tolist(),
+            [b3.is_empty_aabb3(box) for box in self.boxes],
+        )
+        self.assertEqual(
+            center_aabb3_array(self.boxes[:-1]).to_list(),
+            [b3.center_aabb3(box) for box in self.boxes[:-1]],
+        )
+        self.assertEqual(
+            size_aabb3_array(self.boxes[:-1]).to_list(),
+            [b3.size_aabb3(box) for box in self.boxes[:-1]],
+        )
+        self.assertEqual(
+            union_aabb3_array(self.boxes, self.other_boxes).to_list(),
+            [b3.union_aabb3(a, b) for a, b in zip(self.boxes, self.other_boxes)],
+        )
+        self.assertEqual(
+            expand_aabb3_array(self.boxes, 0.5).to_list(),
+            [b3.expand_aabb3(box, 0.5) for box in self.boxes],
+        )
+        self.assertEqual(
+            intersection_aabb3_array(self.boxes, self.other_boxes).to_list(),
+            [
+                b3.intersection_aabb3(a, b) or b3.EMPTY_AABB3
+                for a, b in zip(self.boxes, self.other_boxes)
+            ],
+        )
+
+    def test_aabb_plane_classification_array(self):
+        rng = np.random.default_rng(3)
+        planes = Plane3Array(rng.integers(-5, 6, size=(101, 4)))
+        self.assertEqual(
+            aabb_plane_classification_array(self.boxes, planes).tolist(),
+            [b3.aabb_plane_classification(box, plane) for box, plane in zip(self.boxes, planes)],
+        )
+
+    def test_aabb_frustum_classification_array(self):
+        boxes = AABB3Array(np.concatenate((self.boxes.data, [(-0.5, -0.5, -0.5, 0, 0, 0)])))
+        expected = [b3.aabb_frustum_classification(box, FRUSTUM) for box in boxes]
+        self.assertEqual(aabb_frustum_classification_array(boxes, FRUSTUM).tolist(), expected)
+        self.assertEqual(
+            aabb_frustum_classification_array(boxes, Plane3Array(FRUSTUM)).tolist(), expected)
+        self.assertEqual(set(expected), {b3.OUTSIDE, b3.INTERSECTING, b3.INSIDE})
+        self.assertEqual(
+            aabb_frustum_classification_array(boxes, []).tolist(), [b3.INSIDE] * len(boxes))
@@ -0,0 +1,42 @@
+import unittest
+from bench.cases import MODULES, SIGNATURES, all_cases, public_functions
+from bench.__main__ import measure, compare
+from bench import imports
+
+class TestBench(unittest.TestCase):
+    def test_coverage(self):
+        names = {case.name for case in all_cases()}
+        for module in MODULES:
+            for name in public_functions(module):
+                self.assertIn(name, SIGNATURES)
+                self.assertIn(f'{module.__name__}.{name}', names)
+
+    def test_cases_run(self):
+        for case in all_cases():
+            case.func(*case.make_args(3 if case.batch else 1))
+
+    def test_measure(self):
+        case = next(case for case in all_cases() if case.name.endswith('.dot3_array'))
+        result = measure(case, 10)
+        self.assertGreater(result['ns_per_op'], 0)
+        self.assertGreaterEqual(result['alloc_bytes_per_op'], 0)
+
+    def test_compare(self):
+        baseline = {'a[1]': {'ns_per_op': 100}, 'b[1]': {'ns_per_op': 100}}
+        results = {'a[1]': {'ns_per_op': 110}, 'b[1]': {'ns_per_op': 150}, 'c[1]': {'ns_per_op': 1}}
+        self.assertEqual(compare(results, baseline, 0.25), ['b[1]: 1.50x slower than baseline'])
+
+    def test_imports(self):
+        result = imports.measure('import geometry.relations3', repeat=1)
+        self.assertGreater(result['ms'], 0)
+        self.assertEqual(result['loads'], [])
+        results = {
+            'import geometry': {'ms': 20, 'loads': ['numpy']},
+            'import geometry.vec3array': {'ms': 200, 'loads': ['numpy']},
+        }
+        self.assertEqual(imports.check(results), ['import geometry: loads numpy'])
+        baseline = {'import geometry': {'ms': 10}, 'import geometry.vec3array': {'ms': 190}}
+        self.assertEqual(
+            imports.compare(results, baseline, 0.5),
+            ['import geometry: 2.00x slower than baseline'],
+        )
@@ -0,0 +1,80 @@
+import unittest
+import geometry.relations3 as r3
+# pylint: disable=W0401,W0614
+from geometry.cache3 import *
+from geometry.line3 import Line3
+from geometry.vec3 import Vec3
+from geometry.line3 import eq_line3
+from geometry.plane3 import Plane3, prepare_plane3
+from geometry.profile3 import Profiler3
+
+A_PLANE = Plane3(normal=Vec3(2, 0, 0), distance=4)
+B_PLANE = Plane3(normal=Vec3(0, 3, 0), distance=5)
+C_PLANE = Plane3(normal=Vec3(0, 0, 1), distance=1)
+A_LINE = Line3(anchor=Vec3(3, 2, 4), direction=Vec3(2, 1, 0))
+B_LINE = Line3(anchor=Vec3(2, 3, 2), direction=Vec3(1, 2, 0))
+
+class TestCache3(unittest.TestCase):
+    def test_hits(self):
+        cache = RelationCache3()
+        expected = r3.plane_plane_intersection(A_PLANE, B_PLANE)
+        with Profiler3() as profiler:
+            for _ in range(3):
+                self.assertEqual(cache.plane_plane_intersection(A_PLANE, B_PLANE), expected)
+                self.assertEqual(
+                    cache.line_line_intersection(A_LINE, B_LINE),
+                    r3.line_line_intersection(A_LINE, B_LINE),
+                )
+            self.assertEqual(cache.plane_plane_intersection(A_PLANE, A_PLANE), None)
+            self.assertEqual(cache.plane_plane_intersection(A_PLANE, A_PLANE), None)
+        snapshot = profiler.snapshot()
+        self.assertEqual(snapshot['geometry.relations3.plane_plane_intersection']['calls'], 2)
+        self.assertEqual(cache.stats(), CacheStats3(hits=5, misses=3, evictions=0, size=3))
+        self.assertAlmostEqual(cache.stats().hit_rate, 5 / 8)
+        cache.reset_stats()
+        self.assertEqual(cache.stats(), CacheStats3(hits=0, misses=0, evictions=0, size=3))
+
+    def test_lru(self):
+        cache = RelationCache3(max_size=2)
+        cache.plane_plane_intersection(A_PLANE, B_PLANE)
+        cache.plane_plane_intersection(A_PLANE, C_PLANE)
+        cache.plane_plane_intersection(A_PLANE, B_PLANE)
+        cache.plane_plane_intersection(B_PLANE, C_PLANE)
+        self.assertEqual(cache.stats(), CacheStats3(hits=1, misses=3, evictions=1, size=2))
+        cache.plane_plane_intersection(A_PLANE, B_PLANE)
+        self.assertEqual(cache.stats().hits, 2)
+        cache.plane_plane_intersection(A_PLANE, C_PLANE)
+        self.assertEqual(cache.stats().misses, 4)
+        with self.assertRaises(ValueError):
+            RelationCache3(max_size=0)
+
+    def test_tolerance(self):
+        exact = RelationCache3()
+        exact.plane_plane_intersection(A_PLANE, B_PLANE)
+        exact.plane_plane_intersection(prepare_plane3(A_PLANE), B_PLANE)
+        exact.plane_plane_intersection(Plane3(Vec3(2, 0, 0), 4.0001), B_PLANE)
+        self.assertEqual(exact.stats().hits, 1)
+
+        tolerant = RelationCache3(tolerance=0.01)
+        tolerant.plane_plane_intersection(Plane3(Vec3(2, 0, 0), 4.0001), B_PLANE)
+        self.assertTrue(eq_line3(
+            tolerant.plane_plane_intersection(A_PLANE, B_PLANE),
+            r3.plane_plane_intersection(A_PLANE, B_PLANE),
+            0.01,
+        ))
+        self.assertEqual(tolerant.stats().hits, 1)
+
+    def test_invalidate(self):
+        cache = RelationCache3()
+        cache.plane_plane_intersection(A_PLANE, B_PLANE)
+        cache.plane_plane_intersection(C_PLANE, A_PLANE)
+        cache.plane_plane_intersection(B_PLANE, C_PLANE)
+        cache.line_line_intersection(A_LINE, B_LINE)
+        self.assertEqual(cache.invalidate(A_PLANE), 2)
+        self.assertEqual(cache.invalidate(A_PLANE), 0)
+        self.assertEqual(cache.stats().size, 2)
+        cache.plane_plane_intersection(B_PLANE, C_PLANE)
+        self.assertEqual(cache.stats().hits, 1)
+        self.assertEqual(cache.invalidate(B_LINE), 1)
+        cache.clear()
+        self.assertEqual(cache.stats().size, 0)
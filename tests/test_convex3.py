@@ -0,0 +1,83 @@
+import unittest
+import math
+# pylint: disable=W0401,W0614
+from geometry.convex3 import *
+from geometry.vec3 import Vec3, norm3, eq3
+from geometry.plane3 import Plane3
+from geometry.segment3 import Segment3
+from geometry.aabb3 import AABB3
+
+BOX = aabb_convex3(AABB3(lower=Vec3(0, 0, 0), upper=Vec3(1, 2, 3)))
+
+# Tetrahedron with vertices (0,0,0), (1,0,0), (0,1,0), (0,0,1).
+TETRAHEDRON = convex3([
+    Plane3(normal=Vec3(1, 0, 0), distance=0),
+    Plane3(normal=Vec3(0, 1, 0), distance=0),
+    Plane3(normal=Vec3(0, 0, 1), distance=0),
+    Plane3(normal=Vec3(-1, -1, -1), distance=-1 / math.sqrt(3)),
+])
+
+class TestConvex3(unittest.TestCase):
+    def test_point_in_convex3(self):
+        self.assertTrue(point_in_convex3(Vec3(0.5, 1, 1), BOX))
+        self.assertTrue(point_in_convex3(Vec3(1, 2, 3), BOX))
+        self.assertFalse(point_in_convex3(Vec3(1.1, 1, 1), BOX))
+        self.assertTrue(point_in_convex3(Vec3(1.1, 1, 1), BOX, tolerance=0.2))
+        self.assertTrue(point_in_convex3(Vec3(0.2, 0.2, 0.2), TETRAHEDRON))
+        self.assertFalse(point_in_convex3(Vec3(0.4, 0.4, 0.4), TETRAHEDRON))
+        self.assertTrue(point_in_convex3(Vec3(5, 5, 5), convex3([])))
+
+    def test_clip_segment3(self):
+        self.assertEqual(
+            clip_segment3(Segment3(Vec3(-1, 1, 1), Vec3(3, 1, 1)), BOX),
+            Segment3(Vec3(0, 1, 1), Vec3(1, 1, 1)),
+        )
+        self.assertEqual(
+            clip_segment3(Segment3(Vec3(3, 1, 1), Vec3(0.5, 1, 1)), BOX),
+            Segment3(Vec3(1, 1, 1), Vec3(0.5, 1, 1)),
+        )
+        inside = Segment3(Vec3(0.1, 0.1, 0.1), Vec3(0.9, 1.9, 2.9))
+        self.assertEqual(clip_segment3(inside, BOX), inside)
+        self.assertIsNone(clip_segment3(Segment3(Vec3(2, 0, 0), Vec3(3, 1, 1)), BOX))
+        # Crosses two half-spaces but misses their intersection.
+        self.assertIsNone(clip_segment3(Segment3(Vec3(-1, 0.5, 0), Vec3(0.5, -1, 0)), BOX))
+        self.assertEqual(
+            clip_segment3(Segment3(Vec3(-1, -1, -1), Vec3(1, 1, 1)), TETRAHEDRON),
+            Segment3(Vec3(0, 0, 0), Vec3(1 / 3, 1 / 3, 1 / 3)),
+        )
+
+    def test_clip_polygon3(self):
+        square = [Vec3(-1, -1, 1), Vec3(2, -1, 1), Vec3(2, 3, 1), Vec3(-1, 3, 1)]
+        self.assertEqual(
+            sorted(clip_polygon3(square, BOX)),
+            sorted([Vec3(0, 0, 1), Vec3(1, 0, 1), Vec3(1, 2, 1), Vec3(0, 2, 1)]),
+        )
+        triangle = [Vec3(0.5, 0.5, 1), Vec3(2, 0.5, 1), Vec3(0.5, 1.5, 1)]
+        self.assertEqual(clip_polygon3(triangle, BOX), [
+            Vec3(0.5, 0.5, 1), Vec3(1, 0.5, 1), Vec3(1, 7 / 6, 1), Vec3(0.5, 1.5, 1),
+        ])
+        inside = [Vec3(0.2, 0.2, 1), Vec3(0.8, 0.2, 1), Vec3(0.5, 1.5, 1)]
+        self.assertEqual(clip_polygon3(inside, BOX), inside)
+        self.assertEqual(clip_polygon3([Vec3(5, 5, 5), Vec3(6, 5, 5), Vec3(5, 6, 5)], BOX), [])
+        # Vertex on plane is kept once.
+        touching = [Vec3(1, 1, 1), Vec3(2, 1, 1), Vec3(1, 1.5, 1)]
+        self.assertEqual(clip_polygon3(touching, BOX), [Vec3(1, 1, 1), Vec3(1, 1.5, 1)])
+
+    def test_convex_vertices3(self):
+        self.assertEqual(sorted(convex_vertices3(BOX)), sorted(
+            Vec3(x, y, z) for x in (0, 1) for y in (0, 2) for z in (0, 3)
+        ))
+        self.assertEqual(sorted(convex_vertices3(TETRAHEDRON)), sorted([
+            Vec3(0, 0, 0), Vec3(1, 0, 0), Vec3(0, 1, 0), Vec3(0, 0, 1),
+        ]))
+        # Square pyramid, four planes meet at apex.
+        pyramid = convex3([Plane3(normal=Vec3(0, 0, 1), distance=0)] + [
+            Plane3(normal=norm3(Vec3(-x, -y, -1)), distance=-1 / math.sqrt(2))
+            for (x, y) in ((1, 0), (-1, 0), (0, 1), (0, -1))
+        ])
+        vertices = convex_vertices3(pyramid)
+        self.assertEqual(len(vertices), 5)
+        self.assertTrue(any(eq3(vertex, Vec3(0, 0, 1), 1e-9) for vertex in vertices))
+        self.assertEqual(convex_vertices3(convex3([Plane3(Vec3(0, 0, 1), 0)])), [])
+        empty = convex3([Plane3(Vec3(0, 0, 1), 1), Plane3(Vec3(0, 0, -1), 0)])
+        self.assertEqual(convex_vertices3(empty), [])
@@ -0,0 +1,45 @@
+import unittest
+import numpy as np
+# pylint: disable=W0401,W0614
+from geometry.convex3array import *
+from geometry.convex3array import convex_data3
+from geometry.vec3array import Vec3Array
+from geometry.convex3 import convex3, point_in_convex3, clip_segment3
+from geometry.vec3 import Vec3
+from geometry.plane3 import Plane3
+from geometry.segment3 import Segment3
+
+class TestConvex3Array(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        normals = rng.normal(size=(7, 3))
+        self.region = convex3(
+            Plane3(normal=Vec3(*normal), distance=-2) for normal in normals.tolist())
+        self.starts = Vec3Array(rng.uniform(-4, 4, (300, 3)))
+        self.ends = Vec3Array(rng.uniform(-4, 4, (300, 3)))
+
+    def test_convex_data3(self):
+        data = convex_data3(self.region)
+        self.assertEqual(data.shape, (7, 4))
+        np.testing.assert_allclose(np.linalg.norm(data[:, 0:3], axis=1), 1)
+        self.assertEqual(convex_data3(convex3([])).shape, (0, 4))
+
+    def test_point_in_convex3_array(self):
+        result = point_in_convex3_array(self.starts, self.region)
+        self.assertEqual(result.tolist(), [point_in_convex3(p, self.region) for p in self.starts])
+        self.assertTrue(0 < result.sum() < len(result))
+        self.assertEqual(point_in_convex3_array(Vec3(0, 0, 0), self.region).tolist(), [True])
+
+    def test_clip_segment3_array(self):
+        (inside, starts, ends) = clip_segment3_array(self.starts, self.ends, self.region)
+        self.assertTrue(0 < inside.sum() < len(inside))
+        for (i, (start, end)) in enumerate(zip(self.starts, self.ends)):
+            expected = clip_segment3(Segment3(start, end), self.region)
+            if expected is None:
+                self.assertFalse(inside[i])
+                self.assertTrue(np.all(np.isnan(starts.data[i])))
+            else:
+                self.assertTrue(inside[i])
+                self.assertEqual(Segment3(starts[i], ends[i]), expected)
+        (inside, _, _) = clip_segment3_array(Vec3(0, 0, 0), self.ends, self.region)
+        self.assertTrue(np.all(inside))
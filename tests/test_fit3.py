@@ -0,0 +1,106 @@
+import unittest
+import math
+import numpy as np
+# pylint: disable=W0401,W0614
+from geometry.fit3 import *
+from geometry.plane3 import Plane3
+from geometry.vec3array import Vec3Array
+from geometry.vec3 import Vec3, angle3, len3, cross3, norm3
+from geometry.plane3 import eq_plane3
+from geometry.relations3 import point_line_distance
+
+def plane_points(rng, count, noise):
+    '''Points of plane `(0.6, 0, 0.8) x = 5` around (3, 2, 4).'''
+    (u, v) = rng.uniform(-10, 10, (2, count))
+    data = np.stack((3 + 0.8 * u, 2 + v, 4 - 0.6 * u), axis=1)
+    return Vec3Array(data + np.array([0.6, 0, 0.8]) * rng.normal(0, noise, (count, 1)))
+
+def line_points(rng, count, noise):
+    '''Points of line through (1, 2, 3) along (1, 2, 2).'''
+    t = rng.uniform(-10, 10, (count, 1))
+    return Vec3Array(np.array([1, 2, 3]) + np.array([1, 2, 2]) * t
+        + rng.normal(0, noise, (count, 3)))
+
+class TestFit3(unittest.TestCase):
+    def test_fit_plane3_array(self):
+        rng = np.random.default_rng(1)
+        fit = fit_plane3_array(plane_points(rng, 1000, 0))
+        self.assertEqual(fit.plane, Plane3(normal=Vec3(0.6, 0, 0.8), distance=5))
+        self.assertEqual(fit.residuals.point_count, 1000)
+        self.assertAlmostEqual(fit.residuals.rms_distance, 0)
+        self.assertAlmostEqual(fit.residuals.max_distance, 0)
+
+        fit = fit_plane3_array(plane_points(rng, 10000, 0.1))
+        self.assertTrue(eq_plane3(fit.plane, Plane3(normal=Vec3(0.6, 0, 0.8), distance=5), 0.01))
+        self.assertAlmostEqual(fit.residuals.rms_distance, 0.1, delta=0.005)
+        self.assertGreater(fit.residuals.max_distance, fit.residuals.rms_distance)
+
+        with self.assertRaises(ValueError):
+            fit_plane3_array(Vec3Array([(0, 0, 0), (1, 1, 1)]))
+
+    def test_fit_line3_array(self):
+        rng = np.random.default_rng(2)
+        fit = fit_line3_array(line_points(rng, 1000, 0))
+        self.assertAlmostEqual(point_line_distance(Vec3(1, 2, 3), fit.line), 0)
+        direction = norm3(fit.line.direction)
+        self.assertAlmostEqual(len3(cross3(direction, Vec3(1 / 3, 2 / 3, 2 / 3))), 0)
+        self.assertAlmostEqual(fit.residuals.max_distance, 0)
+
+        fit = fit_line3_array(line_points(rng, 10000, 0.1))
+        self.assertLess(angle3(fit.line.direction, Vec3(-1, -2, -2)) % math.pi, 0.001)
+        self.assertAlmostEqual(fit.residuals.rms_distance, 0.1 * math.sqrt(2), delta=0.005)
+
+    def test_covariance3(self):
+        rng = np.random.default_rng(3)
+        points = plane_points(rng, 10000, 0.1)
+        points = Vec3Array(points.data + 1e6)
+        streamed = covariance3(points[i:i + 999] for i in range(0, len(points), 999))
+        self.assertEqual(streamed.count, len(points))
+        np.testing.assert_allclose(streamed.mean, points.data.mean(axis=0))
+        np.testing.assert_allclose(streamed.covariance, np.cov(points.data.T, bias=True))
+
+        fit = fit_plane3_array(points)
+        streamed_fit = streamed.fit_plane3()
+        self.assertTrue(eq_plane3(streamed_fit.plane, fit.plane, 1e-4))
+        self.assertAlmostEqual(
+            streamed_fit.residuals.rms_distance, fit.residuals.rms_distance, delta=1e-6)
+        self.assertTrue(math.isnan(streamed_fit.residuals.max_distance))
+
+        line = covariance3([line_points(rng, 100, 0)]).fit_line3()
+        self.assertAlmostEqual(point_line_distance(Vec3(1, 2, 3), line.line), 0)
+
+        with self.assertRaises(ValueError):
+            Covariance3().fit_line3()
+
+    def test_ransac_plane3_array(self):
+        rng = np.random.default_rng(4)
+        points = Vec3Array(np.concatenate((
+            plane_points(rng, 700, 0.01).data, rng.uniform(-20, 20, (300, 3)),
+        )))
+        (fit, inliers) = ransac_plane3_array(points, 0.05, iterations=200, seed=1)
+        self.assertTrue(eq_plane3(fit.plane, Plane3(normal=Vec3(0.6, 0, 0.8), distance=5), 0.01))
+        self.assertTrue(np.all(inliers[:700]))
+        self.assertLess(np.sum(inliers[700:]), 10)
+        self.assertLess(fit.residuals.max_distance, 0.1)
+        self.assertEqual(fit.residuals.point_count, np.sum(inliers))
+        self.assertGreater(fit_plane3_array(points).residuals.rms_distance, 1)
+
+        with self.assertRaises(ValueError):
+            ransac_plane3_array(line_points(rng, 100, 0), 0.05, seed=1)
+        # Normals of nearly collinear samples are rounding noise, not candidates.
+        with self.assertRaises(ValueError):
+            ransac_plane3_array(line_points(rng, 100, 1e-13), 0.05, seed=1)
+
+    def test_ransac_line3_array(self):
+        rng = np.random.default_rng(5)
+        points = Vec3Array(np.concatenate((
+            line_points(rng, 500, 0.01).data, rng.uniform(-20, 20, (500, 3)),
+        )))
+        (fit, inliers) = ransac_line3_array(points, 0.05, iterations=300, seed=1)
+        self.assertAlmostEqual(point_line_distance(Vec3(1, 2, 3), fit.line), 0, delta=0.01)
+        self.assertTrue(np.all(inliers[:500]))
+        self.assertLess(fit.residuals.max_distance, 0.1)
+        # Directions between nearly coincident points are rounding noise, not candidates.
+        points = Vec3Array(np.array([5, 5, 5]) + rng.normal(0, 1e-13, (50, 3)))
+        with self.assertRaises(ValueError):
+            ransac_line3_array(points, 0.05, seed=1)
@@ -0,0 +1,112 @@
+import unittest
+import random
+import geometry.relations3 as r3
+from geometry.vec3 import Vec3, add3
+from geometry.line3 import Line3
+from geometry.segment3 import Segment3
+from geometry.aabb3 import AABB3
+from geometry.grid3 import LooseGrid3, GridPair3, item_distance3
+
+def random_vec(rng, scale=10):
+    return Vec3(rng.uniform(-scale, scale), rng.uniform(-scale, scale), rng.uniform(-scale, scale))
+
+def random_item(rng, lines=True):
+    kind = rng.random() * (1 if lines else 0.7)
+    start = random_vec(rng)
+    if kind < 0.3:
+        return start
+    if kind < 0.7:
+        return Segment3(start, add3(start, random_vec(rng, rng.choice([0.5, 3]))))
+    return Line3(start, random_vec(rng, 1))
+
+def brute_force(grid, handles, threshold):
+    result = []
+    for (i, a) in enumerate(handles):
+        for b in handles[i + 1:]:
+            distance = item_distance3(grid[a], grid[b])
+            if distance <= threshold:
+                result.append(GridPair3(a, b, distance))
+    return result
+
+class TestItemDistance3(unittest.TestCase):
+    def test_kinds(self):
+        point = Vec3(0, 3, 0)
+        segment = Segment3(Vec3(-1, 0, 0), Vec3(1, 0, 0))
+        line = Line3(Vec3(5, 0, 2), Vec3(0, 1, 0))
+        self.assertAlmostEqual(item_distance3(point, Vec3(0, 3, 4)), 4)
+        self.assertAlmostEqual(item_distance3(point, segment), 3)
+        self.assertAlmostEqual(item_distance3(segment, point), 3)
+        self.assertAlmostEqual(item_distance3(point, line), r3.point_line_distance(point, line))
+        # Closest point of segment line is outside segment, the end is the closest.
+        self.assertAlmostEqual(item_distance3(segment, line), 20 ** 0.5)
+        self.assertAlmostEqual(item_distance3(line, Segment3(Vec3(5, 7, 1), Vec3(5, 7, 3))), 0)
+        self.assertAlmostEqual(
+            item_distance3(segment, Segment3(Vec3(0, -1, 2), Vec3(0, 1, 2))), 2)
+        self.assertAlmostEqual(
+            item_distance3(segment, Segment3(Vec3(3, 0, 0), Vec3(4, 0, 0))), 2)
+        self.assertAlmostEqual(item_distance3(line, Line3(Vec3(0, 0, 0), Vec3(1, 0, 0))), 2)
+
+class TestLooseGrid3(unittest.TestCase):
+    def test_pairs(self):
+        rng = random.Random(1)
+        grid = LooseGrid3(cell_size=1)
+        handles = [grid.insert(random_item(rng, lines=False)) for _ in range(100)]
+        self.assertEqual(len(grid), 100)
+        for tick in range(4):
+            for handle in handles:
+                item = grid[handle]
+                step = random_vec(rng, 0.1)
+                if isinstance(item, Vec3):
+                    grid.update(handle, add3(item, step))
+                elif isinstance(item, Segment3):
+                    grid.update(handle, Segment3(add3(item.start, step), add3(item.end, step)))
+                else:
+                    grid.update(handle, Line3(add3(item.anchor, step), item.direction))
+            expected = brute_force(grid, handles, 50)
+            for threshold in (0.5, 2, 50):
+                candidates = list(grid.candidates(threshold))
+                self.assertEqual(len(candidates), len(set(candidates)))
+                self.assertEqual(
+                    grid.pairs(threshold),
+                    [pair for pair in expected if pair.distance <= threshold],
+                )
+            if tick == 2:
+                for handle in handles[::3]:
+                    grid.remove(handle)
+                handles = [handle for handle in handles if handle % 3]
+        self.assertEqual(len(grid), len(handles))
+
+    def test_unbounded(self):
+        rng = random.Random(2)
+        grid = LooseGrid3(cell_size=2)
+        handles = [grid.insert(random_item(rng)) for _ in range(100)]
+        self.assertEqual(grid.pairs(1), brute_force(grid, handles, 1))
+        far = grid.insert(Line3(Vec3(500, 500, 0), Vec3(1, 0, 0)))
+        near = grid.insert(Line3(Vec3(0, 500.5, 0), Vec3(1, 0, 0)))
+        self.assertIn((far, near), [(pair.a_handle, pair.b_handle) for pair in grid.pairs(1)])
+
+    def test_bounds(self):
+        grid = LooseGrid3(cell_size=1, bounds=AABB3(Vec3(-10, -10, -10), Vec3(10, 10, 10)))
+        a = grid.insert(Line3(Vec3(0, 0, 0), Vec3(1, 0, 0)))
+        b = grid.insert(Line3(Vec3(0, 0.5, 3), Vec3(0, 0, 1)))
+        c = grid.insert(Line3(Vec3(0, 20, 0), Vec3(1, 0, 0)))
+        self.assertEqual(grid.pairs(1), [GridPair3(a, b, 0.5)])
+        grid.update(c, Line3(Vec3(0, 0.7, 0), Vec3(1, 0, 0)))
+        self.assertEqual(
+            [(pair.a_handle, pair.b_handle) for pair in grid.pairs(1)], [(a, b), (a, c), (b, c)])
+
+    def test_memory(self):
+        grid = LooseGrid3(cell_size=1)
+        handles = [grid.insert(Vec3(i * 10, 0, 0)) for i in range(50)]
+        self.assertEqual(grid.cell_count(), 50)
+        grid.update(handles[0], Vec3(0.5, 0.5, 0.5))
+        self.assertEqual(grid.cell_count(), 50)
+        grid.update(handles[0], Vec3(10.5, 0.5, 0.5))
+        self.assertEqual(grid.cell_count(), 49)
+        for handle in handles:
+            grid.remove(handle)
+        self.assertEqual((len(grid), grid.cell_count()), (0, 0))
+        with self.assertRaises(KeyError):
+            grid.update(handles[0], Vec3(0, 0, 0))
+        with self.assertRaises(ValueError):
+            LooseGrid3(cell_size=0)
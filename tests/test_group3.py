@@ -0,0 +1,46 @@
+import unittest
+import random
+# pylint: disable=W0401,W0614
+from geometry.group3 import *
+from geometry.line3 import Line3
+from geometry.vec3 import Vec3, eq3
+from geometry.plane3 import Plane3
+
+class TestGroup3(unittest.TestCase):
+    def test_group3(self):
+        points = [
+            Vec3(0, 0, 0), Vec3(1, 1, 1), Vec3(0.009, -0.009, 0.001),
+            Vec3(1.005, 0.999, 1), Vec3(0.02, 0, 0), Vec3(0, 0, 0),
+        ]
+        self.assertEqual(group3(points, 0.01), [[0, 2, 5], [1, 3], [4]])
+        self.assertEqual(unique3(points, 0.01), [points[0], points[1], points[4]])
+
+    def test_group3_brute_force(self):
+        rng = random.Random(1)
+        points = [Vec3(rng.random(), rng.random(), rng.random()) for _ in range(500)]
+        tolerance = 0.05
+        for group in group3(points, tolerance):
+            for index in group:
+                self.assertTrue(eq3(points[group[0]], points[index], tolerance))
+        representatives = unique3(points, tolerance)
+        for i, a in enumerate(representatives):
+            for b in representatives[i + 1:]:
+                self.assertFalse(eq3(a, b, tolerance))
+
+    def test_group_line3(self):
+        lines = [
+            Line3(anchor=Vec3(0, 0, 0), direction=Vec3(1, 0, 0)),
+            Line3(anchor=Vec3(0, 0, 0), direction=Vec3(0, 1, 0)),
+            Line3(anchor=Vec3(0.001, 0, 0), direction=Vec3(1, 0.001, 0)),
+        ]
+        self.assertEqual(group_line3(lines, 0.01), [[0, 2], [1]])
+        self.assertEqual(unique_line3(lines, 0.01), lines[:2])
+
+    def test_group_plane3(self):
+        planes = [
+            Plane3(normal=Vec3(0, 0, 1), distance=1),
+            Plane3(normal=Vec3(0, 0, 1), distance=2),
+            Plane3(normal=Vec3(0, 0, 1), distance=1.005),
+        ]
+        self.assertEqual(group_plane3(planes, 0.01), [[0, 2], [1]])
+        self.assertEqual(unique_plane3(planes, 0.01), planes[:2])
@@ -0,0 +1,86 @@
+import unittest
+import random
+from geometry.vec3 import Vec3, add3
+from geometry.line3 import Line3
+from geometry.index3 import BVH3
+
+def random_vec(rng):
+    return Vec3(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(-10, 10))
+
+class TestBVH3(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(1)
+        self.rng = rng
+        self.points = [random_vec(rng) for _ in range(100)]
+        self.segments = [
+            (start, add3(start, Vec3(rng.uniform(-2, 2), rng.uniform(-2, 2), rng.uniform(-2, 2))))
+            for start in (random_vec(rng) for _ in range(100))
+        ]
+        self.index = BVH3()
+        self.handles = self.index.build(self.points, self.segments)
+
+    def brute_force(self, point):
+        return sorted(
+            (self.index.item_distance(handle, point), handle) for handle in self.handles
+        )
+
+    def test_item_distance(self):
+        index = BVH3()
+        (point, segment) = index.build([Vec3(1, 2, 3)], [(Vec3(0, 0, 0), Vec3(2, 0, 0))])
+        self.assertAlmostEqual(index.item_distance(point, Vec3(1, 2, 4)), 1)
+        self.assertAlmostEqual(index.item_distance(segment, Vec3(1, 3, 0)), 3)
+        self.assertAlmostEqual(index.item_distance(segment, Vec3(-3, 4, 0)), 5)
+        self.assertAlmostEqual(index.item_distance(segment, Vec3(5, 0, 4)), 5)
+
+    def test_nearest(self):
+        for _ in range(20):
+            point = random_vec(self.rng)
+            expected = self.brute_force(point)[:5]
+            hits = self.index.nearest(point, k=5)
+            self.assertEqual([hit.handle for hit in hits], [handle for (_, handle) in expected])
+            self.assertAlmostEqual(hits[0].distance, expected[0][0])
+
+    def test_within(self):
+        for _ in range(20):
+            point = random_vec(self.rng)
+            expected = [handle for (distance, handle) in self.brute_force(point) if distance <= 4]
+            self.assertEqual([hit.handle for hit in self.index.within(point, 4)], expected)
+
+    def test_raycast(self):
+        index = BVH3()
+        handles = index.build(
+            [Vec3(5, 0, 0), Vec3(3, 0.5, 0), Vec3(-2, 0, 0), Vec3(8, 3, 0)],
+            [(Vec3(10, -1, 0), Vec3(10, 1, 0)), (Vec3(4, 2, 1), Vec3(4, 2, -1))],
+        )
+        ray = Line3(anchor=Vec3(0, 0, 0), direction=Vec3(2, 0, 0))
+        hits = index.raycast(ray, radius=1)
+        self.assertEqual([hit.handle for hit in hits], [handles[1], handles[0], handles[4]])
+        self.assertAlmostEqual(hits[0].distance, 3)
+        self.assertAlmostEqual(hits[2].distance, 10)
+        self.assertEqual(
+            [hit.handle for hit in index.raycast(ray, radius=2.5)],
+            [handles[2], handles[1], handles[5], handles[0], handles[4]],
+        )
+        self.assertEqual(len(index.raycast(ray, radius=1, max_distance=6)), 2)
+        with self.assertRaises(ValueError):
+            index.raycast(Line3(anchor=Vec3(0, 0, 0), direction=Vec3(0, 0, 0)), radius=1)
+
+    def test_insert_remove(self):
+        index = BVH3()
+        handles = [index.insert_point(point) for point in self.points]
+        handles += [index.insert_segment(start, end) for (start, end) in self.segments]
+        self.assertEqual(len(index), 200)
+        for handle in handles[::2]:
+            index.remove(handle)
+        self.assertEqual(len(index), 100)
+        alive = handles[1::2]
+        for _ in range(10):
+            point = random_vec(self.rng)
+            expected = sorted((index.item_distance(handle, point), handle) for handle in alive)
+            self.assertEqual(
+                [hit.handle for hit in index.nearest(point, k=3)],
+                [handle for (_, handle) in expected[:3]],
+            )
+        for handle in alive:
+            index.remove(handle)
+        self.assertEqual(index.nearest(Vec3(0, 0, 0)), [])
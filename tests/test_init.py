@@ -0,0 +1,56 @@
+import unittest
+import importlib
+import os
+import pkgutil
+import subprocess
+import sys
+import geometry
+
+def _run(statements, backend='auto'):
+    script = f'import sys\n{statements}\nprint(*sorted(sys.modules))'
+    return subprocess.run(
+        [sys.executable, '-c', script], check=True, capture_output=True, text=True,
+        env=dict(os.environ, GEOMETRY_BACKEND=backend),
+    ).stdout.split()
+
+class TestInit(unittest.TestCase):
+    def test_exports(self):
+        # pylint: disable=protected-access
+        modules = {info.name for info in pkgutil.iter_modules(geometry.__path__)}
+        self.assertEqual(set(geometry._MODULES), modules - {'relations3numba'})
+        exports = set()
+        for module_name in sorted(geometry._MODULES):
+            module = importlib.import_module(f'geometry.{module_name}')
+            names = {name for name in module.__all__ if name not in modules}
+            self.assertEqual(
+                {name for (name, owner) in geometry._EXPORTS.items() if owner == module_name},
+                names, module_name,
+            )
+            for name in names:
+                self.assertIs(getattr(geometry, name), getattr(module, name))
+            exports |= names
+        self.assertEqual(set(geometry.__all__), exports)
+        self.assertEqual(set(dir(geometry)), exports | geometry._MODULES)
+        self.assertIs(geometry.convex3, importlib.import_module('geometry.convex3'))
+        namespace = {}
+        exec('from geometry import *', namespace) # pylint: disable=exec-used
+        self.assertEqual(set(namespace) - {'__builtins__'}, exports)
+        for name in ('dot_data', 'line_line_distance_data', 'float_data', 'Vec3Like', 'Args'):
+            self.assertNotIn(name, dir(geometry))
+        with self.assertRaises(AttributeError):
+            _ = geometry.no_such_name
+
+    def test_lazy(self):
+        # Compiled functions load numba (and NumPy) on first call, pure ones do not.
+        modules = _run(
+            'from geometry import Vec3, Line3, point_line_distance\n'
+            'point_line_distance(Vec3(1, 2, 3), Line3(Vec3(0, 0, 0), Vec3(1, 0, 0)))',
+            backend='pure',
+        )
+        self.assertNotIn('numpy', modules)
+        self.assertNotIn('geometry.vec3array', modules)
+        modules = _run('import geometry.relations3')
+        self.assertNotIn('numpy', modules)
+        self.assertNotIn('numba', modules)
+        modules = _run('from geometry import Vec3Array')
+        self.assertIn('numpy', modules)
@@ -1,6 +1,7 @@
 import unittest
 # pylint: disable=W0401,W0614
 from geometry.line3 import *
+from geometry.vec3 import Vec3
 
 class TestLine3(unittest.TestCase):
     def test_constants(self):
@@ -17,3 +18,21 @@ class TestLine3(unittest.TestCase):
             Line3(anchor=Vec3(1, 2, 3), direction=Vec3(2, 3, 4)),
             Line3(anchor=Vec3(2, 3, 1), direction=Vec3(2, 3, 4))
         ), False)
+
+    def test_eq_line3_tolerance(self):
+        self.assertEqual(eq_line3(
+            Line3(anchor=Vec3(1, 2, 3), direction=Vec3(2, 3, 4)),
+            Line3(anchor=Vec3(1, 2, 3.01), direction=Vec3(2, 3, 4)),
+            0.1,
+        ), True)
+        self.assertEqual(eq_line3(
+            Line3(anchor=Vec3(1, 2, 3), direction=Vec3(2, 3, 4)),
+            Line3(anchor=Vec3(1, 2, 3), direction=Vec3(2, 3, 4.2)),
+            0.1,
+        ), False)
+
+    def test_key_line3(self):
+        self.assertEqual(
+            key_line3(Line3(anchor=Vec3(1, 2, 3), direction=Vec3(0.5, 0, -0.5)), 1),
+            (1, 2, 3, 0, 0, -1),
+        )
@@ -0,0 +1,51 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+# pylint: disable=W0401,W0614
+from geometry.line3array import *
+from geometry.line3 import Line3
+from geometry.vec3 import Vec3
+from geometry.plane3array import Plane3Array, save_plane3_array
+
+LINES = [
+    Line3(anchor=Vec3(1, 2, 3), direction=Vec3(4, 5, 6)),
+    Line3(anchor=Vec3(0, 1, 0), direction=Vec3(1, 0, 0)),
+    Line3(anchor=Vec3(-1, 2, 1), direction=Vec3(0, 0, 2)),
+]
+
+class TestLine3Array(unittest.TestCase):
+    def test_storage(self):
+        lines = Line3Array(LINES)
+        self.assertEqual(lines.data.shape, (3, 6))
+        self.assertEqual(lines.data.nbytes, 3 * 48)
+        self.assertEqual(lines.to_list(), LINES)
+        self.assertEqual(lines[1:], Line3Array(LINES[1:]))
+        self.assertEqual(Line3Array.from_parts(lines.anchor, lines.direction), lines)
+
+    def test_view(self):
+        lines = Line3Array(LINES)
+        view = lines.view(1)
+        self.assertEqual(view.to_line3(), LINES[1])
+        view.anchor[:] = (7, 8, 9)
+        self.assertEqual(lines[1].anchor, Vec3(7, 8, 9))
+        self.assertTrue(np.shares_memory(lines.anchor.data, lines.data))
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'scene.lines')
+            save_line3_array(path, Line3Array(LINES))
+            loaded = load_line3_array(path)
+            self.assertIsInstance(loaded.data.base, np.memmap)
+            self.assertEqual(loaded, Line3Array(LINES))
+            self.assertEqual(load_line3_array(path, mmap_mode=None), Line3Array(LINES))
+
+            save_line3_array(path, Line3Array(LINES, np.float32))
+            loaded = load_line3_array(path)
+            self.assertEqual(loaded.data.dtype, np.float32)
+            self.assertEqual(loaded, Line3Array(LINES, np.float32))
+
+            planes_path = os.path.join(tmp, 'scene.planes')
+            save_plane3_array(planes_path, Plane3Array([(0, 0, 1, 2)]))
+            with self.assertRaises(ValueError):
+                load_line3_array(planes_path)
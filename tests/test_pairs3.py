@@ -0,0 +1,87 @@
+import unittest
+import numpy as np
+import geometry.relations3 as r3
+import geometry.pairs3 as p3
+from geometry.vec3 import Vec3, len3, sub3
+from geometry.vec3array import Vec3Array
+from geometry.line3 import Line3
+from geometry.line3array import Line3Array
+from geometry.plane3array import Plane3Array
+
+class TestPairs3(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.points = Vec3Array(rng.normal(size=(23, 3)))
+        self.lines = Line3Array(rng.normal(size=(17, 6)))
+        self.other_lines = Line3Array(rng.normal(size=(19, 6)))
+        self.planes = Plane3Array(rng.normal(size=(13, 4)))
+
+    def test_line_line_distance_matrix(self):
+        expected = [
+            [r3.line_line_distance(a, b) for b in self.other_lines] for a in self.lines
+        ]
+        for block_size in (1, 7, p3.BLOCK_SIZE):
+            result = p3.line_line_distance_matrix(self.lines, self.other_lines, block_size)
+            np.testing.assert_allclose(result, expected, atol=1e-9)
+
+    def test_line_line_distance_matrix_collinear(self):
+        line = Line3(Vec3(0, 0, 0), Vec3(1, 0, 0))
+        other = Line3Array([[0, 2, 0, 2, 0, 0], [0, 0, 1, 0, 1, 0]])
+        np.testing.assert_allclose(p3.line_line_distance_matrix(line, other), [[2, 1]])
+
+    def test_line_line_closest_points_matrix(self):
+        (status, a_points, b_points) = p3.line_line_closest_points_matrix(
+            self.lines, self.other_lines, 5)
+        self.assertEqual(status.shape, (17, 19))
+        for (i, a) in enumerate(self.lines):
+            for (j, b) in enumerate(self.other_lines):
+                expected = r3.line_line_intersection(a, b)
+                np.testing.assert_allclose(a_points[i, j], expected[0], atol=1e-9)
+                np.testing.assert_allclose(b_points[i, j], expected[1], atol=1e-9)
+
+    def test_point_line_distance_matrix(self):
+        expected = [[r3.point_line_distance(p, line) for line in self.lines] for p in self.points]
+        result = p3.point_line_distance_matrix(self.points, self.lines, 10)
+        np.testing.assert_allclose(result, expected, atol=1e-9)
+
+    def test_point_plane_distance_matrix(self):
+        expected = [
+            [r3.point_plane_distance(p, plane) for plane in self.planes] for p in self.points
+        ]
+        result = p3.point_plane_distance_matrix(self.points, self.planes, 10)
+        np.testing.assert_allclose(result, expected, atol=1e-9)
+
+    def test_nearest_pairs(self):
+        cases = (
+            (p3.line_line_nearest_pairs, p3.line_line_distance_matrix,
+             self.lines, self.other_lines),
+            (p3.point_line_nearest_pairs, p3.point_line_distance_matrix,
+             self.points, self.lines),
+            (p3.point_plane_nearest_pairs, p3.point_plane_distance_matrix,
+             self.points, self.planes),
+        )
+        for (nearest, matrix, a, b) in cases:
+            distances = matrix(a, b)
+            expected = np.sort(distances.ravel())
+            for (k, block_size) in ((1, 1), (5, 3), (40, 50), (1000, 64)):
+                (a_index, b_index, result) = nearest(a, b, k, block_size)
+                self.assertEqual(len(result), min(k, distances.size))
+                np.testing.assert_allclose(result, expected[:k])
+                np.testing.assert_allclose(distances[a_index, b_index], result)
+
+    def test_line_line_closest_pair(self):
+        (i, j, a_point, b_point) = p3.line_line_closest_pair(self.lines, self.other_lines, 4)
+        distances = p3.line_line_distance_matrix(self.lines, self.other_lines)
+        self.assertEqual((i, j), np.unravel_index(np.argmin(distances), distances.shape))
+        self.assertAlmostEqual(r3.point_line_distance(a_point, self.lines[i]), 0)
+        self.assertAlmostEqual(r3.point_line_distance(b_point, self.other_lines[j]), 0)
+        self.assertAlmostEqual(len3(sub3(a_point, b_point)), distances[i, j])
+
+    def test_line_line_closest_pair_collinear(self):
+        line = Line3(Vec3(1, 0, 0), Vec3(1, 0, 0))
+        other = Line3Array([[0, 5, 4, 0, 1, 0], [0, 0, 3, 2, 0, 0]])
+        self.assertEqual(
+            p3.line_line_closest_pair(line, other), (0, 1, Vec3(1, 0, 0), Vec3(1, 0, 3)))
+
+    def test_line_line_closest_pair_empty(self):
+        self.assertIsNone(p3.line_line_closest_pair(self.lines, Line3Array(np.empty((0, 6)))))
@@ -0,0 +1,66 @@
+import unittest
+import numpy as np
+import geometry.relations3array as r3a
+from geometry.vec3 import Vec3
+from geometry.plane3 import Plane3
+from geometry.line3array import Line3Array
+from geometry.plane3array import Plane3Array
+from geometry.parallel3 import ParallelExecutor3, gather
+
+class TestParallelExecutor3(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.lines = Line3Array(rng.uniform(-5, 5, (1000, 6)))
+        self.other_lines = Line3Array(rng.uniform(-5, 5, (1000, 6)))
+        self.planes = Plane3Array(rng.uniform(-5, 5, (1000, 4)))
+
+    def check(self, executor):
+        np.testing.assert_array_equal(
+            executor.run(r3a.line_line_distance_array, self.lines, self.other_lines),
+            r3a.line_line_distance_array(self.lines, self.other_lines),
+        )
+        (status, points) = executor.run(r3a.line_plane_intersection_array, self.lines, self.planes)
+        (expected_status, expected_points) = r3a.line_plane_intersection_array(
+            self.lines, self.planes)
+        np.testing.assert_array_equal(status, expected_status)
+        np.testing.assert_array_equal(points.data, expected_points.data)
+        plane = Plane3(normal=Vec3(0, 0, 1), distance=1)
+        chunks = list(executor.map(r3a.point_plane_distance_array, self.lines.anchor, plane))
+        self.assertEqual([len(chunk) for chunk in chunks], [300, 300, 300, 100])
+        np.testing.assert_array_equal(
+            gather(chunks),
+            r3a.point_plane_distance_array(self.lines.anchor, plane),
+        )
+
+    def test_processes(self):
+        with ParallelExecutor3(workers=2, chunk_size=300) as executor:
+            self.check(executor)
+
+    def test_threads(self):
+        with ParallelExecutor3(workers=2, chunk_size=300, use_threads=True) as executor:
+            self.check(executor)
+
+    def test_float32(self):
+        lines = self.lines.astype(np.float32)
+        with ParallelExecutor3(workers=2, chunk_size=300) as executor:
+            result = executor.run(r3a.line_line_distance_array, lines, lines[::-1])
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_array_equal(result, r3a.line_line_distance_array(lines, lines[::-1]))
+
+    def test_row_count(self):
+        with ParallelExecutor3(workers=1, use_threads=True) as executor:
+            with self.assertRaises(ValueError):
+                list(executor.map(r3a.line_line_distance_array, self.lines, self.lines[:10]))
+
+    def test_empty(self):
+        lines = self.lines.astype(np.float32)[:0]
+        for use_threads in (False, True):
+            with ParallelExecutor3(workers=2, use_threads=use_threads) as executor:
+                distances = executor.run(r3a.line_line_distance_array, lines, lines)
+                (status, points) = executor.run(
+                    r3a.line_plane_intersection_array, lines, self.planes[:0])
+            self.assertEqual((distances.shape, distances.dtype), ((0,), np.float32))
+            self.assertEqual(status.shape, (0,))
+            self.assertEqual(points.data.shape, (0, 3))
+        with self.assertRaises(ValueError):
+            gather([])
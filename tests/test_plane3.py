@@ -1,6 +1,7 @@
 import unittest
 # pylint: disable=W0401,W0614
 from geometry.plane3 import *
+from geometry.vec3 import Vec3
 
 class TestPlane3(unittest.TestCase):
     def test_constants(self):
@@ -17,3 +18,28 @@ class TestPlane3(unittest.TestCase):
             Plane3(normal=Vec3(1, 2, 3), distance=4),
             Plane3(normal=Vec3(2, 3, 1), distance=4)
         ), False)
+
+    def test_prepare_plane3(self):
+        plane = Plane3(normal=Vec3(0, 3, 4), distance=10)
+        prepared = prepare_plane3(plane)
+        self.assertEqual(prepared.unit_normal, Vec3(0, 0.6, 0.8))
+        self.assertEqual(prepared.origin, Vec3(0, 6, 8))
+        self.assertEqual(prepared.unit_normal, plane.unit_normal)
+        self.assertEqual(prepared.origin, plane.origin)
+        self.assertEqual(prepared, plane)
+        self.assertEqual(plane, prepared)
+
+    def test_eq_plane3_tolerance(self):
+        self.assertEqual(eq_plane3(
+            Plane3(normal=Vec3(1, 2, 3), distance=4),
+            Plane3(normal=Vec3(1, 2.05, 3), distance=4.05),
+            0.1,
+        ), True)
+        self.assertEqual(eq_plane3(
+            Plane3(normal=Vec3(1, 2, 3), distance=4),
+            Plane3(normal=Vec3(1, 2, 3), distance=4.2),
+            0.1,
+        ), False)
+
+    def test_key_plane3(self):
+        self.assertEqual(key_plane3(Plane3(normal=Vec3(0, 0, 1), distance=2.5), 1), (0, 0, 1, 2))
@@ -0,0 +1,48 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+# pylint: disable=W0401,W0614
+from geometry.plane3array import *
+from geometry.plane3 import Plane3
+from geometry.vec3 import Vec3
+from geometry.plane3 import prepare_plane3
+
+PLANES = [
+    Plane3(normal=Vec3(1, 2, 3), distance=4),
+    Plane3(normal=Vec3(0, 1, 0), distance=-1),
+]
+
+class TestPlane3Array(unittest.TestCase):
+    def test_storage(self):
+        planes = Plane3Array(PLANES)
+        self.assertEqual(planes.data.shape, (2, 4))
+        self.assertEqual(planes.data.nbytes, 2 * 32)
+        self.assertEqual(planes.to_list(), PLANES)
+        self.assertEqual(Plane3Array.from_parts(planes.normal, planes.distance), planes)
+        self.assertEqual(Plane3Array.from_parts(Vec3(0, 0, 1), [1, 2]).to_list(), [
+            Plane3(normal=Vec3(0, 0, 1), distance=1),
+            Plane3(normal=Vec3(0, 0, 1), distance=2),
+        ])
+
+    def test_prepared(self):
+        planes = Plane3Array([prepare_plane3(PLANES[0]), PLANES[1]])
+        self.assertEqual(planes.to_list(), PLANES)
+        planes = Plane3Array(tuple(prepare_plane3(plane) for plane in PLANES))
+        self.assertEqual(planes.to_list(), PLANES)
+
+    def test_view(self):
+        planes = Plane3Array(PLANES)
+        view = planes.view(0)
+        self.assertEqual(view.to_plane3(), PLANES[0])
+        self.assertEqual(view.distance, 4)
+        view.normal[:] = (0, 0, 1)
+        self.assertEqual(planes[0].normal, Vec3(0, 0, 1))
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'scene.planes')
+            save_plane3_array(path, Plane3Array(PLANES))
+            loaded = load_plane3_array(path)
+            self.assertIsInstance(loaded.data.base, np.memmap)
+            self.assertEqual(loaded.to_list(), PLANES)
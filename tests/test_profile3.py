@@ -0,0 +1,60 @@
+import unittest
+import json
+import geometry.relations3 as r3
+import geometry.index3 as i3
+from geometry import vec3
+from geometry.backend3 import BACKEND, PURE
+from geometry.vec3 import Vec3
+from geometry.line3 import Line3
+from geometry.plane3 import Plane3
+from geometry.profile3 import Profiler3
+
+class TestProfile3(unittest.TestCase):
+    def test_counters(self):
+        original = r3.line_line_intersection
+        plane = Plane3(normal=Vec3(0, 5, 0), distance=4)
+        with Profiler3() as profiler:
+            self.assertIsNot(r3.line_line_intersection, original)
+            self.assertIs(i3.line_line_intersection, r3.line_line_intersection)
+            r3.line_plane_intersection(Line3(Vec3(4, 2, 0), Vec3(0, 2, 3)), plane)
+            r3.line_plane_intersection(Line3(Vec3(1, 4, 0), Vec3(2, 0, 2)), plane)
+            r3.line_plane_intersection(Line3(Vec3(1, 3, 0), Vec3(2, 0, 2)), plane)
+            r3.line_plane_intersection(line=Line3(Vec3(1, 3, 0), Vec3(2, 0, 2)), plane=plane)
+            r3.plane_plane_intersection(plane, Plane3(normal=Vec3(2, 0, 0), distance=4))
+            r3.plane_plane_intersection(plane, Plane3(normal=Vec3(0, 2, 0), distance=4))
+            r3.line_line_distance(
+                Line3(Vec3(0, 0, 0), Vec3(1, 0, 0)), Line3(Vec3(0, 1, 0), Vec3(2, 0, 0)))
+        self.assertIs(r3.line_line_intersection, original)
+        self.assertIs(i3.line_line_intersection, original)
+        self.assertFalse(profiler.enabled)
+
+        snapshot = profiler.snapshot()
+        self.assertEqual(snapshot['geometry.relations3.line_plane_intersection']['calls'], 4)
+        self.assertEqual(
+            snapshot['geometry.relations3.line_plane_intersection']['outcomes'],
+            {'point': 1, 'line': 1, 'none': 2},
+        )
+        self.assertEqual(
+            snapshot['geometry.relations3.plane_plane_intersection']['outcomes'],
+            {'line': 1, 'none': 1},
+        )
+        # Nested call of pure `plane_plane_intersection` is counted too.
+        if BACKEND == PURE:
+            self.assertEqual(snapshot['geometry.relations3.line_line_intersection']['calls'], 1)
+        self.assertEqual(
+            snapshot['geometry.relations3.line_line_distance']['outcomes'], {'collinear': 1})
+        self.assertNotIn('geometry.relations3.line_line_projection', snapshot)
+        self.assertGreater(snapshot['geometry.relations3.line_plane_intersection']['total_time'], 0)
+        self.assertEqual(json.loads(profiler.to_json()), snapshot)
+
+        r3.line_plane_intersection(Line3(Vec3(4, 2, 0), Vec3(0, 2, 3)), plane)
+        self.assertEqual(profiler.snapshot(), snapshot)
+        profiler.reset()
+        self.assertEqual(profiler.snapshot(), {})
+
+    def test_modules(self):
+        with Profiler3([vec3]) as profiler:
+            with self.assertRaises(RuntimeError):
+                profiler.enable()
+            vec3.add3(Vec3(1, 2, 3), Vec3(1, 2, 3))
+        self.assertEqual(list(profiler.snapshot()), ['geometry.vec3.add3'])
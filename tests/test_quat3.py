@@ -0,0 +1,81 @@
+import unittest
+import math
+# pylint: disable=W0401,W0614
+from geometry.quat3 import *
+from geometry.vec3 import Vec3, len3, norm3, add3, dot3, cross3
+from geometry.line3 import Line3
+from geometry.transform3 import (
+    rotation3, translation3, compose3, transform_point3, transform_line3,
+)
+
+AXIS = Vec3(1, 2, 3)
+POINT = Vec3(3, -1, 2)
+
+class TestQuat3(unittest.TestCase):
+    def test_axis_angle(self):
+        for angle in (0, 0.3, 2, math.pi, 5):
+            q = axis_angle_quat3(AXIS, angle)
+            self.assertAlmostEqual(sum(x * x for x in q), 1)
+            self.assertEqual(quat_mat3(q), rotation3(AXIS, angle).matrix)
+            self.assertEqual(
+                rotate_point3(q, POINT), transform_point3(rotation3(AXIS, angle), POINT))
+        (axis, angle) = quat_axis_angle3(axis_angle_quat3(AXIS, 2))
+        self.assertEqual(axis, norm3(AXIS))
+        self.assertAlmostEqual(angle, 2)
+        self.assertEqual(quat_axis_angle3(IDENTITY_QUAT3), (Vec3(1, 0, 0), 0))
+
+    def test_between(self):
+        for (a, b) in (
+            (Vec3(1, 0, 0), Vec3(0, 1, 0)),
+            (Vec3(1, 2, 3), Vec3(-2, 0, 5)),
+            (Vec3(1, 2, 3), Vec3(2, 4, 6)),
+            (Vec3(1, 2, 3), Vec3(-1, -2, -3)),
+            (Vec3(0, 0, 2), Vec3(0, 0, -1)),
+        ):
+            q = between_quat3(a, b)
+            rotated = rotate_point3(q, a)
+            self.assertAlmostEqual(len3(rotated), len3(a))
+            self.assertAlmostEqual(len3(cross3(norm3(rotated), norm3(b))), 0)
+            self.assertGreater(dot3(rotated, b), 0)
+        self.assertEqual(between_quat3(Vec3(1, 2, 3), Vec3(2, 4, 6)), IDENTITY_QUAT3)
+        with self.assertRaises(ValueError):
+            between_quat3(Vec3(0, 0, 0), Vec3(1, 0, 0))
+
+    def test_compose_inverse(self):
+        a = axis_angle_quat3(AXIS, 0.7)
+        b = axis_angle_quat3(Vec3(-1, 0, 2), 1.9)
+        composed = compose_quat3(a, b)
+        self.assertEqual(
+            rotate_point3(composed, POINT), rotate_point3(a, rotate_point3(b, POINT)))
+        self.assertEqual(quat_mat3(composed), compose3(
+            rotation3(AXIS, 0.7), rotation3(Vec3(-1, 0, 2), 1.9)).matrix)
+        self.assertTrue(eq_quat3(compose_quat3(a, inverse_quat3(a)), IDENTITY_QUAT3, 1e-12))
+        self.assertEqual(rotate_point3(inverse_quat3(a), rotate_point3(a, POINT)), POINT)
+
+    def test_slerp(self):
+        a = axis_angle_quat3(AXIS, 0.2)
+        b = axis_angle_quat3(AXIS, 1.4)
+        self.assertEqual(slerp_quat3(a, b, 0), a)
+        self.assertEqual(slerp_quat3(a, b, 1), b)
+        self.assertEqual(slerp_quat3(a, b, 0.25), axis_angle_quat3(AXIS, 0.5))
+        # Negated quaternion is the same rotation, the shorter arc is taken.
+        negated = Quat3(*(-x for x in b))
+        self.assertEqual(
+            quat_mat3(slerp_quat3(a, negated, 0.5)), quat_mat3(axis_angle_quat3(AXIS, 0.8)))
+        self.assertEqual(slerp_quat3(a, a, 0.5), a)
+        close = axis_angle_quat3(AXIS, 0.2 + 1e-12)
+        self.assertTrue(eq_quat3(slerp_quat3(a, close, 0.5), a, 1e-12))
+
+    def test_transform(self):
+        q = axis_angle_quat3(AXIS, 0.7)
+        line = Line3(anchor=POINT, direction=Vec3(0, 1, -1))
+        self.assertEqual(rotate_line3(q, line), transform_line3(quat_transform3(q), line))
+        moved = compose3(translation3(Vec3(1, 2, 3)), quat_transform3(q))
+        self.assertEqual(
+            transform_point3(moved, POINT), add3(rotate_point3(q, POINT), Vec3(1, 2, 3)))
+
+    def test_eq(self):
+        self.assertEqual(Quat3(1, 0, 0, 0), IDENTITY_QUAT3)
+        self.assertNotEqual(Quat3(-1, 0, 0, 0), IDENTITY_QUAT3)
+        self.assertNotEqual(IDENTITY_QUAT3, None)
+        self.assertTrue(eq_quat3(Quat3(1, 0, 0, 1e-3), IDENTITY_QUAT3, 1e-2))
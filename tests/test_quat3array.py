@@ -0,0 +1,123 @@
+import unittest
+import numpy as np
+# pylint: disable=W0401,W0614
+from geometry.quat3array import *
+from geometry.line3array import Line3Array
+from geometry.vec3array import Vec3Array
+from geometry.vec3 import Vec3
+from geometry.quat3 import (
+    IDENTITY_QUAT3, axis_angle_quat3, between_quat3, compose_quat3, inverse_quat3, slerp_quat3,
+    quat_mat3, rotate_point3, rotate_line3,
+)
+
+def random_quats(rng, count):
+    return axis_angle_quat3_array(Vec3Array(rng.normal(size=(count, 3))), rng.uniform(-4, 4, count))
+
+class TestQuat3Array(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.quats = random_quats(rng, 40)
+        self.other_quats = random_quats(rng, 40)
+        self.points = Vec3Array(rng.uniform(-5, 5, (40, 3)))
+        self.lines = Line3Array(rng.uniform(-5, 5, (40, 6)))
+
+    def test_container(self):
+        quats = [IDENTITY_QUAT3, axis_angle_quat3(Vec3(1, 2, 3), 0.5)]
+        self.assertEqual(Quat3Array(quats).to_list(), quats)
+        self.assertEqual(Quat3Array(quats)[1], quats[1])
+        self.assertEqual(Quat3Array(quats)[1:], Quat3Array(quats[1:]))
+        self.assertEqual(Quat3Array(quats, np.float32).data.dtype, np.float32)
+        self.assertEqual(len(Quat3Array()), 0)
+        with self.assertRaises(ValueError):
+            Quat3Array([1, 2, 3])
+
+    def test_axis_angle(self):
+        rng = np.random.default_rng(2)
+        (axes, angles) = (rng.normal(size=(10, 3)), rng.uniform(-4, 4, 10))
+        self.assertEqual(
+            axis_angle_quat3_array(Vec3Array(axes), angles).to_list(),
+            [axis_angle_quat3(Vec3(*axis), angle) for (axis, angle) in zip(axes.tolist(), angles)],
+        )
+        self.assertEqual(len(axis_angle_quat3_array(Vec3(0, 0, 1), angles)), 10)
+
+    def test_between(self):
+        a = Vec3Array([[1, 0, 0], [1, 2, 3], [1, 2, 3], [0, 0, 2], [3, 1, 0]])
+        b = Vec3Array([[0, 1, 0], [-2, 0, 5], [-1, -2, -3], [0, 0, -1], [6, 2, 0]])
+        result = between_quat3_array(a, b)
+        for (q, expected) in zip(result, (between_quat3(x, y) for (x, y) in zip(a, b))):
+            self.assertTrue(np.allclose(quat_mat3(q), quat_mat3(expected)))
+        rotated = rotate_point3_array(result, a)
+        np.testing.assert_allclose(
+            rotated.data / np.linalg.norm(rotated.data, axis=1)[:, np.newaxis],
+            b.data / np.linalg.norm(b.data, axis=1)[:, np.newaxis],
+            atol=1e-12,
+        )
+        self.assertTrue(np.all(np.isnan(between_quat3_array(Vec3(0, 0, 0), b).data)))
+
+    def test_between_float32(self):
+        # Cross products of opposite float32 vectors are rounding noise, not axes.
+        rng = np.random.default_rng(1)
+        a = Vec3Array(rng.uniform(-10, 10, (1000, 3)), np.float32)
+        b = Vec3Array(a.data * np.float32(-2.5))
+        rotated = rotate_point3_array(between_quat3_array(a, b), a)
+        np.testing.assert_allclose(rotated.data, -a.data, atol=1e-3)
+        self.assertTrue(np.all(np.isnan(between_quat3_array(
+            Vec3Array([[1e-7, 0, 0]], np.float32), Vec3Array([[1, 0, 0]], np.float32)).data)))
+
+    def test_compose_inverse(self):
+        self.assertEqual(
+            compose_quat3_array(self.quats, self.other_quats).to_list(),
+            [compose_quat3(a, b) for (a, b) in zip(self.quats, self.other_quats)],
+        )
+        self.assertEqual(
+            inverse_quat3_array(self.quats).to_list(), [inverse_quat3(q) for q in self.quats])
+        identity = compose_quat3_array(self.quats, inverse_quat3_array(self.quats))
+        np.testing.assert_allclose(identity.data, [IDENTITY_QUAT3] * 40, atol=1e-12)
+
+    def test_slerp(self):
+        for t in (0, 0.3, 1):
+            result = slerp_quat3_array(self.quats, self.other_quats, t)
+            for (q, expected) in zip(result, (
+                slerp_quat3(a, b, t) for (a, b) in zip(self.quats, self.other_quats)
+            )):
+                np.testing.assert_allclose(q, expected, rtol=0, atol=1e-12)
+        ts = np.linspace(0, 1, 40)
+        result = slerp_quat3_array(self.quats[0], self.other_quats[0], ts)
+        self.assertEqual(len(result), 40)
+        self.assertEqual(slerp_quat3_array(self.quats, self.quats, 0.5), self.quats)
+
+    def test_rotate(self):
+        self.assertEqual(
+            rotate_point3_array(self.quats, self.points).to_list(),
+            [rotate_point3(q, p) for (q, p) in zip(self.quats, self.points)],
+        )
+        self.assertEqual(
+            rotate_point3_array(self.quats[3], self.points).to_list(),
+            [rotate_point3(self.quats[3], p) for p in self.points],
+        )
+        self.assertEqual(
+            rotate_point3_array(self.quats, self.points[3]).to_list(),
+            [rotate_point3(q, self.points[3]) for q in self.quats],
+        )
+        self.assertEqual(
+            rotate_line3_array(self.quats, self.lines).to_list(),
+            [rotate_line3(q, line) for (q, line) in zip(self.quats, self.lines)],
+        )
+        matrices = quat_mat3_array(self.quats)
+        self.assertEqual(matrices.shape, (40, 3, 3))
+        np.testing.assert_allclose(matrices[5], quat_mat3(self.quats[5]))
+
+    def test_float32(self):
+        quats = self.quats.astype(np.float32)
+        points = self.points.astype(np.float32)
+        for result in (
+            compose_quat3_array(quats, quats), inverse_quat3_array(quats),
+            norm_quat3_array(quats), slerp_quat3_array(quats, quats[::-1], np.float32(0.5)),
+            rotate_point3_array(quats, points),
+        ):
+            self.assertEqual(result.data.dtype, np.float32)
+        np.testing.assert_allclose(
+            rotate_point3_array(quats, points).data,
+            rotate_point3_array(self.quats, self.points).data,
+            atol=1e-5,
+        )
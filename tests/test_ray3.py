@@ -0,0 +1,20 @@
+import unittest
+# pylint: disable=W0401,W0614
+from geometry.ray3 import *
+from geometry.line3 import Line3
+from geometry.vec3 import Vec3
+
+class TestRay3(unittest.TestCase):
+    def test_eq_ray3(self):
+        ray = Ray3(origin=Vec3(1, 2, 3), direction=Vec3(0, 0, 1))
+        self.assertEqual(ray, Ray3(origin=Vec3(1, 2, 3), direction=Vec3(0, 0, 1)))
+        self.assertNotEqual(ray, Ray3(origin=Vec3(1, 2, 3), direction=Vec3(0, 0, -1)))
+        self.assertEqual(eq_ray3(
+            ray, Ray3(origin=Vec3(1, 2, 3), direction=Vec3(0, 0, 1.2)), 0.1,
+        ), False)
+
+    def test_ray_line3(self):
+        self.assertEqual(
+            ray_line3(Ray3(origin=Vec3(1, 2, 3), direction=Vec3(0, 0, 1))),
+            Line3(anchor=Vec3(1, 2, 3), direction=Vec3(0, 0, 1)),
+        )
@@ -2,7 +2,10 @@ import unittest
 import geometry.relations3 as r3
 from geometry.vec3 import Vec3
 from geometry.line3 import Line3
-from geometry.plane3 import Plane3
+from geometry.plane3 import Plane3, prepare_plane3
+from geometry.segment3 import Segment3
+from geometry.ray3 import Ray3, ray_line3
+from geometry.triangle3 import Triangle3, triangle_plane3
 
 class TestRelations3(unittest.TestCase):
     def test_point_line_projection(self):
@@ -175,3 +178,133 @@ class TestRelations3(unittest.TestCase):
             ),
             None,
         )
+
+    def test_prepared_plane(self):
+        planes = [
+            Plane3(normal=Vec3(0, 5, 0), distance=4),
+            Plane3(normal=Vec3(1, 2, 3), distance=-2),
+            Plane3(normal=Vec3(-3, 1, 1), distance=0.5),
+        ]
+        points = [Vec3(3, 4, 2), Vec3(1, 0, 4), Vec3(-2, 9, 1)]
+        lines = [
+            Line3(anchor=Vec3(4, 2, 0), direction=Vec3(0, 2, 3)),
+            Line3(anchor=Vec3(1, 4, 0), direction=Vec3(2, 0, 2)),
+            Line3(anchor=Vec3(1, 3, 2), direction=Vec3(0, 2, 0)),
+        ]
+        for plane in planes:
+            prepared = prepare_plane3(plane)
+            for point in points:
+                self.assertEqual(
+                    tuple(r3.point_plane_projection(point, prepared)),
+                    tuple(r3.point_plane_projection(point, plane)),
+                )
+                self.assertEqual(
+                    r3.point_plane_distance(point, prepared),
+                    r3.point_plane_distance(point, plane),
+                )
+            for line in lines:
+                self.assertEqual(
+                    r3.line_plane_intersection(line, prepared),
+                    r3.line_plane_intersection(line, plane),
+                )
+                self.assertEqual(
+                    r3.line_plane_projection(line, prepared),
+                    r3.line_plane_projection(line, plane),
+                )
+            for other in planes:
+                self.assertEqual(
+                    r3.plane_plane_intersection(prepared, prepare_plane3(other)),
+                    r3.plane_plane_intersection(plane, other),
+                )
+
+    def test_point_plane_signed_distance(self):
+        plane = Plane3(normal=Vec3(0, 5, 0), distance=4)
+        self.assertAlmostEqual(r3.point_plane_signed_distance(Vec3(3, 4, 2), plane), 0)
+        self.assertAlmostEqual(r3.point_plane_signed_distance(Vec3(1, 0, 4), plane), -4)
+        self.assertAlmostEqual(r3.point_plane_signed_distance(Vec3(2, 9, 1), plane), 5)
+        self.assertAlmostEqual(
+            r3.point_plane_signed_distance(Vec3(2, 9, 1), prepare_plane3(plane)), 5)
+
+    def test_point_segment_projection(self):
+        segment = Segment3(start=Vec3(0, 3, 0), end=Vec3(4, 3, 4))
+        self.assertEqual(r3.point_segment_projection(Vec3(4, 3, 0), segment), Vec3(2, 3, 2))
+        self.assertEqual(r3.point_segment_projection(Vec3(-2, 0, 0), segment), Vec3(0, 3, 0))
+        self.assertEqual(r3.point_segment_projection(Vec3(9, 3, 9), segment), Vec3(4, 3, 4))
+        self.assertEqual(
+            r3.point_segment_projection(Vec3(9, 3, 9), Segment3(Vec3(1, 1, 1), Vec3(1, 1, 1))),
+            Vec3(1, 1, 1),
+        )
+        self.assertAlmostEqual(r3.point_segment_distance(Vec3(4, 3, 0), segment), 2.82842712)
+        self.assertAlmostEqual(r3.point_segment_distance(Vec3(0, 0, 0), segment), 3)
+
+    def test_ray_plane_intersection(self):
+        plane = Plane3(normal=Vec3(0, 5, 0), distance=4)
+        self.assertEqual(
+            r3.ray_plane_intersection(Ray3(Vec3(4, 2, 0), Vec3(0, 2, 3)), plane), Vec3(4, 4, 3))
+        self.assertEqual(
+            r3.ray_plane_intersection(Ray3(Vec3(4, 2, 0), Vec3(0, -2, 3)), plane), None)
+        self.assertEqual(
+            r3.ray_plane_intersection(Ray3(Vec3(1, 4, 0), Vec3(2, 0, 2)), plane),
+            Ray3(Vec3(1, 4, 0), Vec3(2, 0, 2)),
+        )
+        self.assertEqual(
+            r3.ray_plane_intersection(Ray3(Vec3(1, 3, 0), Vec3(2, 0, 2)), plane), None)
+
+    def test_segment_plane_intersection(self):
+        plane = Plane3(normal=Vec3(0, 5, 0), distance=4)
+        self.assertEqual(
+            r3.segment_plane_intersection(Segment3(Vec3(4, 2, 0), Vec3(4, 6, 6)), plane),
+            Vec3(4, 4, 3),
+        )
+        self.assertEqual(
+            r3.segment_plane_intersection(Segment3(Vec3(4, 2, 0), Vec3(4, 4, 3)), plane),
+            Vec3(4, 4, 3),
+        )
+        self.assertEqual(
+            r3.segment_plane_intersection(Segment3(Vec3(4, 2, 0), Vec3(4, 3, 3)), plane), None)
+        self.assertEqual(
+            r3.segment_plane_intersection(Segment3(Vec3(1, 4, 0), Vec3(3, 4, 2)), plane),
+            Segment3(Vec3(1, 4, 0), Vec3(3, 4, 2)),
+        )
+
+    def test_ray_triangle_intersection(self):
+        triangle = Triangle3(a=Vec3(0, 0, 2), b=Vec3(4, 0, 2), c=Vec3(0, 4, 2))
+        for (ray, expected) in [
+            (Ray3(Vec3(1, 1, 0), Vec3(0, 0, 1)), Vec3(1, 1, 2)),
+            (Ray3(Vec3(1, 1, 5), Vec3(0, 0, -2)), Vec3(1, 1, 2)),
+            (Ray3(Vec3(1, 1, 5), Vec3(0, 0, 2)), None),
+            (Ray3(Vec3(3, 3, 0), Vec3(0, 0, 1)), None),
+            (Ray3(Vec3(-1, 1, 0), Vec3(0, 0, 1)), None),
+            (Ray3(Vec3(0, 0, 0), Vec3(0, 0, 1)), Vec3(0, 0, 2)),
+            (Ray3(Vec3(2, 2, 0), Vec3(0, 0, 1)), Vec3(2, 2, 2)),
+            (Ray3(Vec3(-1, 1, 2), Vec3(1, 0, 0)), None),
+            (Ray3(Vec3(0, 0, 0), Vec3(1, 1, 4)), Vec3(0.5, 0.5, 2)),
+        ]:
+            self.assertEqual(r3.ray_triangle_intersection(ray, triangle), expected)
+            if expected is not None:
+                self.assertEqual(
+                    r3.line_plane_intersection(ray_line3(ray), triangle_plane3(triangle)),
+                    expected,
+                )
+        self.assertEqual(
+            r3.ray_triangle_intersection(
+                Ray3(Vec3(1, 1, 0), Vec3(0, 0, 1)),
+                Triangle3(a=Vec3(0, 0, 2), b=Vec3(2, 2, 2), c=Vec3(4, 4, 2)),
+            ),
+            None,
+        )
+
+    def test_segment_triangle_intersection(self):
+        triangle = Triangle3(a=Vec3(0, 0, 2), b=Vec3(4, 0, 2), c=Vec3(0, 4, 2))
+        self.assertEqual(
+            r3.segment_triangle_intersection(Segment3(Vec3(1, 1, 0), Vec3(1, 1, 4)), triangle),
+            Vec3(1, 1, 2),
+        )
+        self.assertEqual(
+            r3.segment_triangle_intersection(Segment3(Vec3(1, 1, 0), Vec3(1, 1, 1)), triangle),
+            None,
+        )
+        self.assertEqual(
+            r3.segment_triangle_intersection(Segment3(Vec3(1, 1, 3), Vec3(1, 1, 4)), triangle),
+            None,
+        )
@@ -0,0 +1,453 @@
+import unittest
+import numpy as np
+import geometry.relations3 as r3
+import geometry.relations3array as r3a
+from geometry.vec3 import Vec3
+from geometry.vec3array import Vec3Array
+from geometry.line3 import Line3
+from geometry.line3array import Line3Array
+from geometry.plane3 import Plane3
+from geometry.plane3array import Plane3Array
+from geometry.ray3 import Ray3
+from geometry.triangle3 import Triangle3
+from geometry.triangle3array import Triangle3Array
+from geometry.segment3 import Segment3
+
+def random_vectors(rng, count):
+    return Vec3Array(rng.integers(-5, 6, size=(count, 3)))
+
+def random_lines(rng, count):
+    return Line3Array.from_parts(random_vectors(rng, count), random_vectors(rng, count))
+
+def random_planes(rng, count):
+    return Plane3Array.from_parts(random_vectors(rng, count), rng.integers(-5, 6, size=count))
+
+def _vec(v):
+    return Vec3(*v.tolist())
+
+def _plane(normal, distance):
+    return Plane3(_vec(normal), float(distance))
+
+def _sine(a, b):
+    return np.linalg.norm(np.cross(a, b)) / np.linalg.norm(a) / np.linalg.norm(b)
+
+def _flatten(result):
+    if isinstance(result, float):
+        return np.array([result])
+    return np.array(result if isinstance(result, Vec3) else [c for part in result for c in part])
+
+def _segment_projection_data(point, start, end):
+    direction = end - start
+    t = np.clip(np.dot(point - start, direction) / np.dot(direction, direction), 0, 1)
+    return start + direction * t
+
+class WellConditioned:
+    '''Random arguments that meet conditions of `relations3.ERROR_BUDGETS`, scale is 10.'''
+
+    def __init__(self, seed):
+        self.rng = np.random.default_rng(seed)
+
+    def point(self):
+        return self.rng.uniform(-10, 10, 3)
+
+    def scalar(self):
+        return self.rng.uniform(-10, 10, ())
+
+    def direction(self):
+        while True:
+            direction = self.point()
+            if np.linalg.norm(direction) >= 1:
+                return direction
+
+    def unit(self):
+        direction = self.direction()
+        return direction / np.linalg.norm(direction)
+
+    def point_line(self):
+        return [self.point(), self.point(), self.direction()]
+
+    def point_plane(self):
+        return [self.point(), self.unit(), self.scalar()]
+
+    def line_plane(self, limit=None):
+        while True:
+            (anchor, direction, normal, distance) = (
+                self.point(), self.direction(), self.unit(), self.scalar())
+            den = np.dot(direction, normal)
+            if abs(den) < 0.1 * np.linalg.norm(direction):
+                continue
+            t = (distance - np.dot(anchor, normal)) / den
+            if limit is None or 0.1 <= t <= limit:
+                return [anchor, direction, normal, distance]
+
+    def line_line(self):
+        while True:
+            (a_direction, b_direction) = (self.direction(), self.direction())
+            if _sine(a_direction, b_direction) >= 0.1:
+                return [self.point(), a_direction, self.point(), b_direction]
+
+    def plane_plane(self):
+        while True:
+            (a_normal, b_normal) = (self.unit(), self.unit())
+            if _sine(a_normal, b_normal) >= 0.1:
+                return [a_normal, self.scalar(), b_normal, self.scalar()]
+
+    def line_triangle(self, limit):
+        while True:
+            (a, b, c) = (self.point(), self.point(), self.point())
+            (u, v) = self.rng.uniform(0.1, 0.8, 2)
+            direction = self.direction()
+            if min(np.linalg.norm(b - a), np.linalg.norm(c - a)) < 1 or u + v > 0.9 \
+                    or _sine(b - a, c - a) < 0.1 \
+                    or _sine(direction, np.cross(b - a, c - a)) > 0.99:
+                continue
+            target = a + (b - a) * u + (c - a) * v
+            return [target - direction * self.rng.uniform(0.1, limit), direction, a, b, c]
+
+# Scalar function on numpy vectors and kernel that gives the same result for any float dtype.
+BUDGET_CASES = {
+    'point_line_projection': (
+        WellConditioned.point_line,
+        lambda p, a, d: r3.point_line_projection(_vec(p), Line3(_vec(a), _vec(d))),
+        r3a.point_line_projection_data,
+    ),
+    'point_line_distance': (
+        WellConditioned.point_line,
+        lambda p, a, d: r3.point_line_distance(_vec(p), Line3(_vec(a), _vec(d))),
+        r3a.point_line_distance_data,
+    ),
+    'point_plane_projection': (
+        WellConditioned.point_plane,
+        lambda p, n, d: r3.point_plane_projection(_vec(p), _plane(n, d)),
+        r3a.point_plane_projection_data,
+    ),
+    'point_plane_distance': (
+        WellConditioned.point_plane,
+        lambda p, n, d: r3.point_plane_distance(_vec(p), _plane(n, d)),
+        r3a.point_plane_distance_data,
+    ),
+    'point_plane_signed_distance': (
+        WellConditioned.point_plane,
+        lambda p, n, d: r3.point_plane_signed_distance(_vec(p), _plane(n, d)),
+        r3a.point_plane_signed_distance_data,
+    ),
+    'line_plane_intersection': (
+        WellConditioned.line_plane,
+        lambda a, d, n, dist: r3.line_plane_intersection(Line3(_vec(a), _vec(d)), _plane(n, dist)),
+        lambda *args: r3a.line_plane_intersection_data(*args)[1],
+    ),
+    'line_plane_projection': (
+        WellConditioned.line_plane,
+        lambda a, d, n, dist: r3.line_plane_projection(Line3(_vec(a), _vec(d)), _plane(n, dist)),
+        lambda a, d, n, dist: np.concatenate((
+            r3a.point_plane_projection_data(a, n, dist),
+            r3a.point_plane_projection_data(a + d, n, dist)
+            - r3a.point_plane_projection_data(a, n, dist),
+        )),
+    ),
+    'line_line_distance': (
+        WellConditioned.line_line,
+        lambda a, ad, b, bd: r3.line_line_distance(
+            Line3(_vec(a), _vec(ad)), Line3(_vec(b), _vec(bd))),
+        r3a.line_line_distance_data,
+    ),
+    'line_line_intersection': (
+        WellConditioned.line_line,
+        lambda a, ad, b, bd: r3.line_line_intersection(
+            Line3(_vec(a), _vec(ad)), Line3(_vec(b), _vec(bd))),
+        lambda *args: np.concatenate(r3a.line_line_intersection_data(*args)[1:]),
+    ),
+    'plane_plane_intersection': (
+        WellConditioned.plane_plane,
+        lambda an, ad, bn, bd: r3.plane_plane_intersection(_plane(an, ad), _plane(bn, bd)),
+        lambda *args: np.concatenate(r3a.plane_plane_intersection_data(*args)[1:]),
+    ),
+    'point_segment_projection': (
+        WellConditioned.point_line,
+        lambda p, s, e: r3.point_segment_projection(_vec(p), Segment3(_vec(s), _vec(e))),
+        _segment_projection_data,
+    ),
+    'point_segment_distance': (
+        WellConditioned.point_line,
+        lambda p, s, e: r3.point_segment_distance(_vec(p), Segment3(_vec(s), _vec(e))),
+        lambda p, s, e: np.linalg.norm(p - _segment_projection_data(p, s, e)),
+    ),
+    'ray_plane_intersection': (
+        lambda cases: cases.line_plane(np.inf),
+        lambda a, d, n, dist: r3.ray_plane_intersection(Ray3(_vec(a), _vec(d)), _plane(n, dist)),
+        lambda *args: r3a.line_plane_intersection_data(*args)[1],
+    ),
+    'segment_plane_intersection': (
+        lambda cases: cases.line_plane(0.9),
+        lambda a, d, n, dist: r3.segment_plane_intersection(
+            Segment3(_vec(a), _vec(a + d)), _plane(n, dist)),
+        lambda *args: r3a.line_plane_intersection_data(*args)[1],
+    ),
+    'ray_triangle_intersection': (
+        lambda cases: cases.line_triangle(10),
+        lambda o, d, a, b, c: r3.ray_triangle_intersection(
+            Ray3(_vec(o), _vec(d)), Triangle3(_vec(a), _vec(b), _vec(c))),
+        lambda o, d, a, b, c: o + d * r3a.line_triangle_parameter_data(o, d, a, b, c),
+    ),
+    'segment_triangle_intersection': (
+        lambda cases: cases.line_triangle(0.9),
+        lambda o, d, a, b, c: r3.segment_triangle_intersection(
+            Segment3(_vec(o), _vec(o + d)), Triangle3(_vec(a), _vec(b), _vec(c))),
+        lambda o, d, a, b, c: o + d * r3a.line_triangle_parameter_data(o, d, a, b, c),
+    ),
+}
+
+class TestErrorBudget(unittest.TestCase):
+    '''Checks `relations3.ERROR_BUDGETS` against kernels evaluated in long double.
+
+    Long double is 80-bit on x86, on platforms where it is float64 the check is weaker.
+    '''
+
+    def assert_budget(self, name, result, args, dtype):
+        exact = BUDGET_CASES[name][2](*[np.asarray(arg, dtype=np.longdouble) for arg in args])
+        scale = max(float(np.max(np.abs(arg))) for arg in args)
+        error = np.max(np.abs(np.ravel(result) - np.ravel(exact)))
+        self.assertLessEqual(error, r3.ERROR_BUDGETS[name] * np.spacing(dtype(1)) * scale, name)
+
+    def test_cases(self):
+        self.assertEqual(set(BUDGET_CASES), set(r3.ERROR_BUDGETS))
+
+    def test_float64(self):
+        cases = WellConditioned(3)
+        for (name, (make_args, scalar, _)) in BUDGET_CASES.items():
+            for _ in range(200):
+                args = make_args(cases)
+                self.assert_budget(name, _flatten(scalar(*args)), args, np.float64)
+
+    def test_float32(self):
+        cases = WellConditioned(4)
+        for (name, (make_args, _, kernel)) in BUDGET_CASES.items():
+            for _ in range(200):
+                args = [np.asarray(arg, dtype=np.float32) for arg in make_args(cases)]
+                result = kernel(*args)
+                self.assertEqual(result.dtype, np.float32, name)
+                self.assert_budget(name, result, args, np.float32)
+
+class TestRelations3Array(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.points = random_vectors(rng, 50)
+        self.lines = random_lines(rng, 50)
+        self.other_lines = random_lines(rng, 50)
+        self.planes = random_planes(rng, 50)
+        self.other_planes = random_planes(rng, 50)
+
+    def test_containers(self):
+        lines = [Line3(Vec3(1, 2, 3), Vec3(4, 5, 6)), Line3(Vec3(0, 1, 0), Vec3(1, 0, 0))]
+        self.assertEqual(Line3Array(lines).to_list(), lines)
+        self.assertEqual(Line3Array(lines)[1], lines[1])
+        self.assertEqual(Line3Array(lines).anchor, Vec3Array([Vec3(1, 2, 3), Vec3(0, 1, 0)]))
+        planes = [Plane3(Vec3(1, 2, 3), 4), Plane3(Vec3(0, 1, 0), -1)]
+        self.assertEqual(Plane3Array(planes).to_list(), planes)
+        self.assertEqual(Plane3Array(planes)[0], planes[0])
+        self.assertEqual(Plane3Array(planes).distance.tolist(), [4, -1])
+
+    def test_point_relations(self):
+        for func, scalar, items in [
+            (r3a.point_line_projection_array, r3.point_line_projection, self.lines),
+            (r3a.point_plane_projection_array, r3.point_plane_projection, self.planes),
+        ]:
+            self.assertEqual(
+                func(self.points, items).to_list(),
+                [scalar(p, x) for p, x in zip(self.points, items)],
+            )
+        for func, scalar, items in [
+            (r3a.point_line_distance_array, r3.point_line_distance, self.lines),
+            (r3a.point_plane_distance_array, r3.point_plane_distance, self.planes),
+            (r3a.point_plane_signed_distance_array, r3.point_plane_signed_distance, self.planes),
+        ]:
+            np.testing.assert_allclose(
+                func(self.points, items),
+                [scalar(p, x) for p, x in zip(self.points, items)],
+                atol=1e-9,
+            )
+
+    def test_line_plane_intersection_array(self):
+        plane = Plane3(normal=Vec3(0, 5, 0), distance=4)
+        lines = Line3Array([
+            Line3(anchor=Vec3(4, 2, 0), direction=Vec3(0, 2, 3)),
+            Line3(anchor=Vec3(1, 4, 0), direction=Vec3(2, 0, 2)),
+            Line3(anchor=Vec3(1, 3, 0), direction=Vec3(2, 0, 2)),
+        ])
+        (status, points) = r3a.line_plane_intersection_array(lines, plane)
+        self.assertEqual(status.tolist(), [
+            r3a.POINT_INTERSECTION, r3a.LINE_INTERSECTION, r3a.NO_INTERSECTION,
+        ])
+        self.assertEqual(points[0], Vec3(4, 4, 3))
+        self.assertTrue(np.all(np.isnan(points.data[1:])))
+
+        (status, points) = r3a.line_plane_intersection_array(self.lines, self.planes)
+        for i, (line, item) in enumerate(zip(self.lines, self.planes)):
+            expected = r3.line_plane_intersection(line, item)
+            if isinstance(expected, Line3):
+                self.assertEqual(status[i], r3a.LINE_INTERSECTION)
+            elif expected is None:
+                self.assertEqual(status[i], r3a.NO_INTERSECTION)
+            else:
+                self.assertEqual(status[i], r3a.POINT_INTERSECTION)
+                self.assertEqual(points[i], expected)
+
+    def test_line_plane_projection_array(self):
+        self.assertEqual(
+            r3a.line_plane_projection_array(self.lines, self.planes).to_list(),
+            [r3.line_plane_projection(line, item) for line, item in zip(self.lines, self.planes)],
+        )
+
+    def test_line_line_distance_array(self):
+        lines = Line3Array([self.lines[0], self.lines[1], self.lines[1]])
+        other_lines = Line3Array([self.other_lines[0], self.lines[1], self.lines[2]])
+        np.testing.assert_allclose(
+            r3a.line_line_distance_array(lines, other_lines),
+            [r3.line_line_distance(a, b) for a, b in zip(lines, other_lines)],
+        )
+        np.testing.assert_allclose(
+            r3a.line_line_distance_array(self.lines, self.other_lines),
+            [r3.line_line_distance(a, b) for a, b in zip(self.lines, self.other_lines)],
+            atol=1e-9,
+        )
+
+    def test_line_line_intersection_array(self):
+        (status, a_points, b_points) = r3a.line_line_intersection_array(
+            Line3Array([
+                Line3(anchor=Vec3(3, 2, 4), direction=Vec3(2, 1, 0)),
+                Line3(anchor=Vec3(3, 2, 4), direction=Vec3(2, 1, 0)),
+            ]),
+            Line3Array([
+                Line3(anchor=Vec3(2, 3, 2), direction=Vec3(1, 2, 0)),
+                Line3(anchor=Vec3(2, 3, 2), direction=Vec3(2, 1, 0)),
+            ]),
+        )
+        self.assertEqual(status.tolist(), [r3a.POINT_INTERSECTION, r3a.NO_INTERSECTION])
+        self.assertEqual(a_points[0], Vec3(1, 1, 4))
+        self.assertEqual(b_points[0], Vec3(1, 1, 2))
+
+        (status, a_points, b_points) = r3a.line_line_intersection_array(
+            self.lines, self.other_lines)
+        for i, (a, b) in enumerate(zip(self.lines, self.other_lines)):
+            expected = r3.line_line_intersection(a, b)
+            if expected is None:
+                self.assertEqual(status[i], r3a.NO_INTERSECTION)
+            else:
+                self.assertEqual(status[i], r3a.POINT_INTERSECTION)
+                self.assertEqual((a_points[i], b_points[i]), expected)
+
+    def test_plane_plane_intersection_array(self):
+        (status, lines) = r3a.plane_plane_intersection_array(
+            Plane3Array([
+                Plane3(normal=Vec3(2, 0, 0), distance=4),
+                Plane3(normal=Vec3(0, 0, 2), distance=4),
+            ]),
+            Plane3Array([
+                Plane3(normal=Vec3(0, 3, 0), distance=5),
+                Plane3(normal=Vec3(0, 0, 3), distance=5),
+            ]),
+        )
+        self.assertEqual(status.tolist(), [r3a.LINE_INTERSECTION, r3a.NO_INTERSECTION])
+        self.assertEqual(lines[0], Line3(anchor=Vec3(4, 5, 0), direction=Vec3(0, 0, 6)))
+
+        (status, lines) = r3a.plane_plane_intersection_array(self.planes, self.other_planes)
+        for i, (a, b) in enumerate(zip(self.planes, self.other_planes)):
+            expected = r3.plane_plane_intersection(a, b)
+            if expected is None:
+                self.assertEqual(status[i], r3a.NO_INTERSECTION)
+            else:
+                self.assertEqual(status[i], r3a.LINE_INTERSECTION)
+                self.assertEqual(lines[i], expected)
+
+    def test_ray_triangle_intersection_array(self):
+        rng = np.random.default_rng(2)
+        rays = random_lines(rng, 300)
+        triangles = Triangle3Array(rng.integers(-5, 6, size=(300, 9)))
+        (status, points) = r3a.ray_triangle_intersection_array(rays, triangles)
+        hits = 0
+        for i, (line, triangle) in enumerate(zip(rays, triangles)):
+            expected = r3.ray_triangle_intersection(Ray3(*line), triangle)
+            if expected is None:
+                self.assertEqual(status[i], r3a.NO_INTERSECTION)
+                self.assertTrue(np.all(np.isnan(points.data[i])))
+            else:
+                hits += 1
+                self.assertEqual(status[i], r3a.POINT_INTERSECTION)
+                self.assertEqual(points[i], expected)
+        self.assertGreater(hits, 0)
+
+        triangles = Triangle3Array([
+            Triangle3(a=Vec3(0, 0, 4), b=Vec3(4, 0, 4), c=Vec3(0, 4, 4)),
+            Triangle3(a=Vec3(0, 0, 2), b=Vec3(4, 0, 2), c=Vec3(0, 4, 2)),
+            Triangle3(a=Vec3(5, 5, 1), b=Vec3(9, 5, 1), c=Vec3(5, 9, 1)),
+        ])
+        ray = Ray3(Vec3(1, 1, 0), Vec3(0, 0, 1))
+        (status, points) = r3a.ray_triangle_intersection_array(ray, triangles)
+        self.assertEqual(status.tolist(), [
+            r3a.POINT_INTERSECTION, r3a.POINT_INTERSECTION, r3a.NO_INTERSECTION,
+        ])
+        distances = np.linalg.norm(points.data - ray.origin, axis=1)
+        self.assertEqual(points[int(np.nanargmin(distances))], Vec3(1, 1, 2))
+
+    def test_float64_near_degenerate(self):
+        # Float64 statuses use exact zero tests of scalar functions, so they agree with them.
+        rng = np.random.default_rng(4)
+        (normal, offset, other) = rng.uniform(-10, 10, (3, 100, 3))
+        noise = rng.uniform(-1e-12, 1e-12, (100, 3))
+        distance = rng.uniform(-10, 10, 100)
+        planes = Plane3Array(np.column_stack([normal, distance]))
+        anchor = normal / np.linalg.norm(normal, axis=1)[:, np.newaxis] * distance[:, np.newaxis]
+        lines = Line3Array(np.column_stack([anchor, np.cross(normal, other) + noise]))
+        (status, _) = r3a.line_plane_intersection_array(lines, planes)
+        expected = [r3.line_plane_intersection(line, plane) for (line, plane) in zip(lines, planes)]
+        self.assertEqual(status.tolist(), [
+            r3a.NO_INTERSECTION if result is None else
+            r3a.LINE_INTERSECTION if isinstance(result, Line3) else r3a.POINT_INTERSECTION
+            for result in expected
+        ])
+        lines = Line3Array(np.column_stack([offset, other]))
+        other_lines = Line3Array(np.column_stack([offset, 3 * other + noise]))
+        (status, _, _) = r3a.line_line_intersection_array(lines, other_lines)
+        self.assertEqual(status.tolist(), [
+            r3a.NO_INTERSECTION if r3.line_line_intersection(a, b) is None
+            else r3a.POINT_INTERSECTION
+            for (a, b) in zip(lines, other_lines)
+        ])
+
+    def test_float32_near_degenerate(self):
+        # Rows built to be parallel or collinear are so only up to float32 rounding.
+        rng = np.random.default_rng(3)
+        (normal, offset, other) = rng.uniform(-10, 10, (3, 1000, 3)).astype(np.float32)
+        distance = rng.uniform(-10, 10, 1000).astype(np.float32)
+        planes = Plane3Array(np.column_stack([normal, distance]))
+        in_plane = np.cross(normal, other)
+        anchor = normal / np.linalg.norm(normal, axis=1)[:, np.newaxis] * distance[:, np.newaxis]
+        anchor = anchor + np.cross(normal, offset)
+        (status, _) = r3a.line_plane_intersection_array(
+            Line3Array(np.column_stack([anchor, in_plane])), planes)
+        self.assertTrue(np.all(status == r3a.LINE_INTERSECTION))
+        (status, _) = r3a.line_plane_intersection_array(
+            Line3Array(np.column_stack([anchor + normal, in_plane])), planes)
+        self.assertTrue(np.all(status == r3a.NO_INTERSECTION))
+
+        lines = Line3Array(np.column_stack([offset, other]))
+        other_lines = Line3Array(np.column_stack([offset + 3 * other, -0.1 * other]))
+        (status, _, _) = r3a.line_line_intersection_array(lines, other_lines)
+        self.assertTrue(np.all(status == r3a.NO_INTERSECTION))
+        np.testing.assert_allclose(r3a.line_line_distance_array(lines, other_lines), 0, atol=1e-4)
+
+        triangles = Triangle3Array(np.column_stack([offset, offset + other, offset + in_plane]))
+        rays = Line3Array(np.column_stack([offset + normal, other - 2 * in_plane]))
+        (status, _) = r3a.ray_triangle_intersection_array(rays, triangles)
+        self.assertTrue(np.all(status == r3a.NO_INTERSECTION))
+
+    def test_broadcast(self):
+        plane = Plane3(normal=Vec3(0, 5, 0), distance=4)
+        self.assertEqual(
+            r3a.point_plane_projection_array(self.points, plane).to_list(),
+            [r3.point_plane_projection(p, plane) for p in self.points],
+        )
+        self.assertEqual(
+            r3a.point_line_distance_array(Vec3(1, 2, 3), self.lines).shape,
+            (len(self.lines),),
+        )
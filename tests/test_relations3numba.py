@@ -0,0 +1,100 @@
+import unittest
+import unittest.mock
+import importlib.util
+import random
+import geometry.relations3 as r3
+import geometry.index3 as i3
+from geometry.backend3 import BACKEND, COMPILED, select_backend, PURE, NUMBA
+from geometry.vec3 import Vec3, eq3
+from geometry.line3 import Line3
+from geometry.plane3 import Plane3, prepare_plane3
+from geometry.segment3 import Segment3
+from geometry.ray3 import Ray3
+from geometry.triangle3 import Triangle3
+
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
+
+def pure(name):
+    def call(*args):
+        with unittest.mock.patch.object(r3, '_backend', None):
+            return getattr(r3, name)(*args)
+    return call
+
+def same(a, b):
+    if isinstance(a, Vec3) and isinstance(b, Vec3):
+        return eq3(a, b)
+    if isinstance(a, tuple) and isinstance(b, tuple) and type(a) is type(b):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return abs(a - b) <= 1e-9 * max(abs(a), abs(b), 1)
+    return a == b
+
+class TestBackend3(unittest.TestCase):
+    def test_select_backend(self):
+        self.assertEqual(select_backend('pure'), PURE)
+        self.assertEqual(select_backend('numba'), NUMBA)
+        self.assertEqual(select_backend('auto'), NUMBA if HAS_NUMBA else PURE)
+        with self.assertRaises(ValueError):
+            select_backend('fortran')
+
+@unittest.skipUnless(HAS_NUMBA, 'numba is not installed')
+class TestRelations3Numba(unittest.TestCase):
+    '''Compiled functions give the same results as pure ones.'''
+
+    def setUp(self):
+        # pylint: disable=import-outside-toplevel
+        import geometry.relations3numba as r3n
+        self.r3n = r3n
+        rng = random.Random(1)
+
+        # Small integer coordinates hit degenerate branches (parallel, collinear, in plane).
+        def vec():
+            if rng.random() < 0.5:
+                return Vec3(rng.randint(-3, 3), rng.randint(-3, 3), rng.randint(-3, 3))
+            return Vec3(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(-10, 10))
+
+        def plane():
+            result = Plane3(vec(), rng.choice([rng.randint(-3, 3), rng.uniform(-10, 10)]))
+            return prepare_plane3(result) if rng.random() < 0.5 else result
+
+        self.kinds = {
+            'v': vec,
+            'l': lambda: Line3(vec(), vec()),
+            'p': plane,
+            's': lambda: Segment3(vec(), vec()),
+            'r': lambda: Ray3(vec(), vec()),
+            'g': lambda: Triangle3(vec(), vec(), vec()),
+        }
+
+    def test_parity(self):
+        signatures = {
+            'point_line_projection': 'vl', 'point_line_distance': 'vl',
+            'point_plane_projection': 'vp', 'point_plane_distance': 'vp',
+            'line_plane_intersection': 'lp', 'line_plane_projection': 'lp',
+            'line_line_distance': 'll', 'line_line_intersection': 'll',
+            'plane_plane_intersection': 'pp',
+            'ray_triangle_intersection': 'rg', 'segment_triangle_intersection': 'sg',
+        }
+        self.assertEqual(set(signatures), set(COMPILED))
+        for (name, signature) in signatures.items():
+            compiled = getattr(self.r3n, name)
+            outcomes = set()
+            for _ in range(2000):
+                args = [self.kinds[kind]() for kind in signature]
+                expected = pure(name)(*args)
+                outcomes.add(type(expected))
+                self.assertTrue(
+                    same(compiled(*args), expected), f'{name}{tuple(args)}: {expected}')
+            if name.endswith('intersection'):
+                self.assertGreater(len(outcomes), 1, name)
+
+    def test_active(self):
+        # Functions call compiled counterparts, so do functions imported by name.
+        line = Line3(Vec3(1, 2, 3), Vec3(4, 5, 6))
+        with unittest.mock.patch.object(self.r3n, 'line_line_intersection') as compiled:
+            with unittest.mock.patch.object(r3, '_backend', self.r3n):
+                i3.line_line_intersection(line, line)
+        compiled.assert_called_once_with(line, line)
+        if BACKEND == NUMBA:
+            r3.point_line_distance(Vec3(1, 2, 3), line)
+            self.assertIs(r3._backend, self.r3n) # pylint: disable=protected-access
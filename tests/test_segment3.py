@@ -0,0 +1,20 @@
+import unittest
+# pylint: disable=W0401,W0614
+from geometry.segment3 import *
+from geometry.line3 import Line3
+from geometry.vec3 import Vec3
+
+class TestSegment3(unittest.TestCase):
+    def test_eq_segment3(self):
+        segment = Segment3(start=Vec3(1, 2, 3), end=Vec3(4, 5, 6))
+        self.assertEqual(segment, Segment3(start=Vec3(1, 2, 3), end=Vec3(4, 5, 6)))
+        self.assertNotEqual(segment, Segment3(start=Vec3(4, 5, 6), end=Vec3(1, 2, 3)))
+        self.assertEqual(eq_segment3(
+            segment, Segment3(start=Vec3(1, 2, 3.01), end=Vec3(4, 5, 6)), 0.1,
+        ), True)
+
+    def test_segment_line3(self):
+        self.assertEqual(
+            segment_line3(Segment3(start=Vec3(1, 2, 3), end=Vec3(4, 5, 6))),
+            Line3(anchor=Vec3(1, 2, 3), direction=Vec3(3, 3, 3)),
+        )
@@ -0,0 +1,128 @@
+import unittest
+import asyncio
+import random
+import geometry.relations3 as r3
+from geometry.vec3 import Vec3
+from geometry.line3 import Line3
+from geometry.plane3 import Plane3, prepare_plane3
+from geometry.service3 import QueryService3, QueryStats3
+
+def random_vec(rng):
+    if rng.random() < 0.3:
+        return Vec3(rng.randint(-2, 2), rng.randint(-2, 2), rng.randint(-2, 2))
+    return Vec3(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(-10, 10))
+
+def random_plane(rng):
+    normal = random_vec(rng)
+    while normal == Vec3(0, 0, 0):
+        normal = random_vec(rng)
+    plane = Plane3(normal, rng.choice([rng.randint(-2, 2), rng.uniform(-10, 10)]))
+    return prepare_plane3(plane) if rng.random() < 0.5 else plane
+
+def same(a, b):
+    if isinstance(a, float):
+        return abs(a - b) <= 1e-9 * max(abs(a), 1)
+    return a == b
+
+class TestQueryService3(unittest.TestCase):
+    def test_results(self):
+        rng = random.Random(1)
+        queries = []
+        for _ in range(300):
+            kind = rng.choice(['point_plane_distance', 'line_plane_intersection',
+                               'plane_plane_intersection'])
+            if kind == 'point_plane_distance':
+                args = (random_vec(rng), random_plane(rng))
+            elif kind == 'line_plane_intersection':
+                args = (Line3(random_vec(rng), random_vec(rng)), random_plane(rng))
+            else:
+                args = (random_plane(rng), random_plane(rng))
+            queries.append((kind, args))
+
+        async def main():
+            async with QueryService3(max_delay=0.01, max_batch=64) as service:
+                results = await asyncio.gather(*(
+                    getattr(service, kind)(*args) for (kind, args) in queries
+                ))
+            return (results, service.stats())
+
+        (results, stats) = asyncio.run(main())
+        for ((kind, args), result) in zip(queries, results):
+            expected = getattr(r3, kind)(*args)
+            self.assertEqual(type(result), type(expected), f'{kind}{args}')
+            self.assertTrue(same(result, expected), f'{kind}{args}: {result} != {expected}')
+        self.assertEqual(stats.requests, 300)
+        self.assertLessEqual(stats.max_batch_size, 64)
+        self.assertLess(stats.batches, 20)
+
+    def test_delay(self):
+        plane = Plane3(Vec3(0, 0, 2), 1)
+
+        async def main():
+            service = QueryService3(max_delay=0.05, max_running=1)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            first = await service.point_plane_distance(Vec3(1, 2, 3), plane)
+            elapsed = loop.time() - start
+            results = await asyncio.gather(*(
+                service.point_plane_distance(Vec3(0, 0, z), plane) for z in range(10)
+            ))
+            return (first, elapsed, results, service.stats())
+
+        (first, elapsed, results, stats) = asyncio.run(main())
+        self.assertEqual(first, 2)
+        self.assertGreaterEqual(elapsed, 0.04)
+        self.assertEqual(results, [abs(z - 1) for z in range(10)])
+        self.assertEqual(stats, QueryStats3(requests=11, batches=2, max_batch_size=10))
+
+    def test_errors(self):
+        plane = Plane3(Vec3(0, 0, 1), 1)
+
+        async def main():
+            service = QueryService3(max_delay=0.01)
+            return await asyncio.gather(
+                service.point_plane_distance(Vec3(0, 0, 3), plane),
+                service.point_plane_distance(Vec3('a', 0, 0), plane),
+                service.line_plane_intersection(Line3(Vec3(0, 0, 0), Vec3(0, 0, 1)), plane),
+                service.line_plane_intersection(Line3(Vec3(0, 0, 0), Vec3(0, 'b', 1)), plane),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(main())
+        self.assertEqual(results[0], 2)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(results[2], Vec3(0, 0, 1))
+        self.assertIsInstance(results[3], ValueError)
+        with self.assertRaises(ValueError):
+            QueryService3(max_batch=0)
+
+    def test_split(self):
+        calls = []
+
+        def sizes(args):
+            calls.append(len(args))
+            if any(size < 0 for (size,) in args):
+                raise ValueError('negative size')
+            return [size * 2 for (size,) in args]
+
+        def short(args):
+            return [size for (size,) in args][1:]
+
+        async def main():
+            service = QueryService3(max_batch=64)
+            results = await asyncio.gather(*(
+                service.submit(sizes, -1 if i == 10 else i) for i in range(64)
+            ), return_exceptions=True)
+            # Missing results fail callers instead of leaving them waiting.
+            missing = await asyncio.wait_for(asyncio.gather(*(
+                service.submit(short, i) for i in range(8)
+            ), return_exceptions=True), 1)
+            return (results, missing)
+
+        (results, missing) = asyncio.run(main())
+        self.assertIsInstance(results[10], ValueError)
+        self.assertEqual(results[:10] + results[11:], [i * 2 for i in range(64) if i != 10])
+        self.assertLessEqual(len(calls), 1 + 2 * 6)
+        self.assertEqual(len(missing), 8)
+        for error in missing:
+            self.assertIsInstance(error, ValueError)
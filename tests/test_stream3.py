@@ -0,0 +1,56 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+# pylint: disable=W0401,W0614
+from geometry.stream3 import *
+from geometry.vec3 import Vec3
+from geometry.plane3 import Plane3
+from geometry.transform3 import translation3
+
+PLANE = Plane3(normal=Vec3(0, 0, 2), distance=1)
+
+class TestStream3(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+        self.points = np.random.default_rng(1).uniform(-5, 5, (1000, 3))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_binary(self):
+        self.points.tofile(self.path('in.bin'))
+        chunks = list(read_points_binary(self.path('in.bin'), chunk_size=300))
+        self.assertEqual([len(chunk) for chunk in chunks], [300, 300, 300, 100])
+        count = write_points_binary(self.path('out.bin'), chunks)
+        self.assertEqual(count, 1000)
+        np.testing.assert_array_equal(np.fromfile(self.path('out.bin')).reshape(-1, 3), self.points)
+
+    def test_csv(self):
+        with open(self.path('in.csv'), 'w', encoding='utf8') as file:
+            file.write('x,y,z,intensity\n')
+            for (x, y, z) in self.points.tolist():
+                file.write(f'{x!r},{y!r},{z!r},1\n')
+        chunks = read_points_csv(self.path('in.csv'), chunk_size=400, skip_rows=1)
+        self.assertEqual(write_points_csv(self.path('out.csv'), chunks), 1000)
+        result = np.concatenate([
+            chunk.data for chunk in read_points_csv(self.path('out.csv'), chunk_size=400)])
+        np.testing.assert_array_equal(result, self.points)
+
+    def test_pipeline(self):
+        self.points.tofile(self.path('in.bin'))
+        count = write_points_binary(self.path('out.bin'), pipeline(
+            read_points_binary(self.path('in.bin'), chunk_size=128),
+            transform_stage(translation3(Vec3(0, 0, 1))),
+            clip_stage(PLANE),
+            distance_filter_stage(PLANE, 2),
+            project_stage(PLANE),
+        ))
+        points = self.points + (0, 0, 1)
+        points = points[(points[:, 2] >= 1) & (points[:, 2] <= 3)]
+        points[:, 2] = 1
+        self.assertEqual(count, len(points))
+        np.testing.assert_allclose(np.fromfile(self.path('out.bin')).reshape(-1, 3), points)
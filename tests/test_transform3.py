@@ -0,0 +1,82 @@
+import unittest
+import math
+# pylint: disable=W0401,W0614
+from geometry.transform3 import *
+from geometry.line3 import Line3
+from geometry.plane3 import Plane3
+from geometry.vec3 import Vec3
+from geometry.vec3 import rotate3, sub3, len3, norm3
+from geometry.relations3 import point_plane_distance
+
+class TestTransform3(unittest.TestCase):
+    def test_translation3(self):
+        transform = translation3(Vec3(1, 2, 3))
+        self.assertEqual(transform_point3(transform, Vec3(1, 1, 1)), Vec3(2, 3, 4))
+        self.assertEqual(transform_vec3(transform, Vec3(1, 1, 1)), Vec3(1, 1, 1))
+
+    def test_rotation3(self):
+        v = Vec3(1, 2, 3)
+        self.assertEqual(
+            transform_point3(rotation3(Vec3(2, 0, 0), math.pi / 2), v),
+            rotate3(v, Vec3(2, 0, 0), math.pi / 2),
+        )
+        self.assertEqual(
+            transform_point3(rotation3(Vec3(0, 3, 0), math.pi / 2), v),
+            rotate3(v, Vec3(0, 3, 0), math.pi / 2),
+        )
+        self.assertEqual(transform_point3(rotation3(Vec3(0, 0, 4), math.pi / 2), v), Vec3(-2, 1, 3))
+        transform = rotation3(Vec3(1, 2, 3), 0.7)
+        self.assertAlmostEqual(len3(transform_vec3(transform, v)), len3(v))
+
+    def test_scaling3(self):
+        self.assertEqual(
+            transform_point3(scaling3(Vec3(1, 2, 3)), Vec3(1, 1, 1)),
+            Vec3(1, 2, 3),
+        )
+        with self.assertRaises(ValueError):
+            scaling3(Vec3(1, 0, 1))
+
+    def test_compose3(self):
+        transform = compose3(translation3(Vec3(1, 0, 0)), scaling3(Vec3(2, 2, 2)))
+        self.assertEqual(transform_point3(transform, Vec3(1, 1, 1)), Vec3(3, 2, 2))
+        transform = compose3(scaling3(Vec3(2, 2, 2)), translation3(Vec3(1, 0, 0)))
+        self.assertEqual(transform_point3(transform, Vec3(1, 1, 1)), Vec3(4, 2, 2))
+
+    def test_inverse3(self):
+        transform = compose3(
+            compose3(translation3(Vec3(1, -2, 3)), rotation3(Vec3(1, 1, 0), 0.3)),
+            scaling3(Vec3(1, 2, 4)),
+        )
+        v = Vec3(3, 1, -2)
+        self.assertEqual(transform_point3(inverse3(transform), transform_point3(transform, v)), v)
+        self.assertEqual(
+            make_transform3(transform.matrix, transform.offset).inverse_matrix,
+            transform.inverse_matrix,
+        )
+        with self.assertRaises(ValueError):
+            inverse_mat3((Vec3(1, 2, 3), Vec3(2, 4, 6), Vec3(0, 0, 1)))
+
+    def test_transform_line3(self):
+        transform = compose3(translation3(Vec3(1, 2, 3)), scaling3(Vec3(2, 1, 1)))
+        self.assertEqual(
+            transform_line3(transform, Line3(anchor=Vec3(1, 1, 1), direction=Vec3(1, 1, 0))),
+            Line3(anchor=Vec3(3, 3, 4), direction=Vec3(2, 1, 0)),
+        )
+
+    def test_transform_plane3(self):
+        self.assertEqual(
+            transform_plane3(translation3(Vec3(0, 0, 2)), Plane3(normal=Vec3(0, 0, 3), distance=1)),
+            Plane3(normal=Vec3(0, 0, 1), distance=3),
+        )
+        transform = compose3(
+            compose3(translation3(Vec3(1, -2, 3)), rotation3(Vec3(1, 1, 0), 0.3)),
+            scaling3(Vec3(1, 2, 4)),
+        )
+        plane = Plane3(normal=Vec3(1, 2, 2), distance=3)
+        plane_points = [Vec3(9, 0, 0), Vec3(1, 4, 0), Vec3(-1, 3, 2)]
+        transformed = transform_plane3(transform, plane)
+        for point in plane_points:
+            self.assertAlmostEqual(point_plane_distance(point, plane), 0)
+            self.assertAlmostEqual(
+                point_plane_distance(transform_point3(transform, point), transformed), 0)
+        self.assertAlmostEqual(len3(sub3(transformed.normal, norm3(transformed.normal))), 0)
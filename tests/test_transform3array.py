@@ -0,0 +1,58 @@
+import unittest
+import numpy as np
+# pylint: disable=W0401,W0614
+from geometry.transform3array import *
+from geometry.line3array import Line3Array
+from geometry.plane3array import Plane3Array
+from geometry.vec3array import Vec3Array
+from geometry.vec3 import Vec3
+from geometry.transform3 import (
+    compose3, translation3, rotation3, scaling3,
+    transform_point3, transform_vec3, transform_line3, transform_plane3,
+)
+
+TRANSFORM = compose3(
+    compose3(translation3(Vec3(1, -2, 3)), rotation3(Vec3(1, 1, 0), 0.3)),
+    scaling3(Vec3(1, 2, 4)),
+)
+
+class TestTransform3Array(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.points = Vec3Array(rng.uniform(-5, 5, (20, 3)))
+        self.lines = Line3Array(rng.uniform(-5, 5, (20, 6)))
+        self.planes = Plane3Array(rng.uniform(-5, 5, (20, 4)))
+
+    def test_transform_point3_array(self):
+        self.assertEqual(
+            transform_point3_array(TRANSFORM, self.points).to_list(),
+            [transform_point3(TRANSFORM, point) for point in self.points],
+        )
+        self.assertEqual(
+            transform_vec3_array(TRANSFORM, self.points).to_list(),
+            [transform_vec3(TRANSFORM, point) for point in self.points],
+        )
+
+    def test_float32(self):
+        for (func, items) in (
+            (transform_point3_array, self.points.astype(np.float32)),
+            (transform_vec3_array, self.points.astype(np.float32)),
+            (transform_line3_array, self.lines.astype(np.float32)),
+            (transform_plane3_array, self.planes.astype(np.float32)),
+        ):
+            result = func(TRANSFORM, items)
+            self.assertEqual(result.data.dtype, np.float32)
+            np.testing.assert_allclose(
+                result.data, func(TRANSFORM, items.astype(np.float64)).data, atol=1e-4)
+
+    def test_transform_line3_array(self):
+        self.assertEqual(
+            transform_line3_array(TRANSFORM, self.lines).to_list(),
+            [transform_line3(TRANSFORM, line) for line in self.lines],
+        )
+
+    def test_transform_plane3_array(self):
+        self.assertEqual(
+            transform_plane3_array(TRANSFORM, self.planes).to_list(),
+            [transform_plane3(TRANSFORM, plane) for plane in self.planes],
+        )
@@ -0,0 +1,23 @@
+import unittest
+# pylint: disable=W0401,W0614
+from geometry.triangle3 import *
+from geometry.plane3 import Plane3
+from geometry.vec3 import Vec3
+
+TRIANGLE = Triangle3(a=Vec3(0, 0, 2), b=Vec3(4, 0, 2), c=Vec3(0, 4, 2))
+
+class TestTriangle3(unittest.TestCase):
+    def test_eq_triangle3(self):
+        self.assertEqual(TRIANGLE, Triangle3(a=Vec3(0, 0, 2), b=Vec3(4, 0, 2), c=Vec3(0, 4, 2)))
+        self.assertNotEqual(TRIANGLE, Triangle3(a=Vec3(0, 0, 2), b=Vec3(0, 4, 2), c=Vec3(4, 0, 2)))
+        self.assertEqual(eq_triangle3(
+            TRIANGLE, Triangle3(a=Vec3(0, 0, 2.01), b=Vec3(4, 0, 2), c=Vec3(0, 4, 2)), 0.1,
+        ), True)
+
+    def test_triangle_plane3(self):
+        self.assertEqual(triangle_normal3(TRIANGLE), Vec3(0, 0, 16))
+        self.assertEqual(triangle_plane3(TRIANGLE), Plane3(normal=Vec3(0, 0, 16), distance=2))
+        self.assertEqual(
+            triangle_plane3(Triangle3(a=TRIANGLE.a, b=TRIANGLE.c, c=TRIANGLE.b)),
+            Plane3(normal=Vec3(0, 0, -16), distance=-2),
+        )
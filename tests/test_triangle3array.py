@@ -0,0 +1,33 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+# pylint: disable=W0401,W0614
+from geometry.triangle3array import *
+from geometry.triangle3 import Triangle3
+from geometry.vec3 import Vec3
+
+TRIANGLES = [
+    Triangle3(a=Vec3(0, 0, 2), b=Vec3(4, 0, 2), c=Vec3(0, 4, 2)),
+    Triangle3(a=Vec3(1, 2, 3), b=Vec3(4, 5, 6), c=Vec3(7, 8, 0)),
+]
+
+class TestTriangle3Array(unittest.TestCase):
+    def test_storage(self):
+        triangles = Triangle3Array(TRIANGLES)
+        self.assertEqual(triangles.data.shape, (2, 9))
+        self.assertEqual(triangles.data.nbytes, 2 * 72)
+        self.assertEqual(triangles.to_list(), TRIANGLES)
+        self.assertEqual(triangles[1], TRIANGLES[1])
+        self.assertEqual(triangles[1:], Triangle3Array(TRIANGLES[1:]))
+        self.assertEqual(
+            Triangle3Array.from_parts(triangles.a, triangles.b, triangles.c), triangles)
+        self.assertEqual(Triangle3Array().data.shape, (0, 9))
+        with self.assertRaises(ValueError):
+            Triangle3Array(np.zeros((2, 6)))
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'scene.triangles')
+            save_triangle3_array(path, Triangle3Array(TRIANGLES))
+            self.assertEqual(load_triangle3_array(path), Triangle3Array(TRIANGLES))
@@ -1,4 +1,5 @@
 import unittest
+import math
 # pylint: disable=W0401,W0614
 from geometry.vec3 import *
 
@@ -78,3 +79,12 @@ class TestVec3(unittest.TestCase):
         self.assertEqual(project3(Vec3(1, 2, 3), Vec3(0, 0, 4)), Vec3(0, 0, 3))
         self.assertEqual(project3(Vec3(1, 2, 3), Vec3(-2, -4, 0)), Vec3(1, 2, 0))
         self.assertEqual(project3(Vec3(1, 2, 3), Vec3(-2, -4, -6)), Vec3(1, 2, 3))
+
+    def test_eq3_tolerance(self):
+        self.assertEqual(eq3(Vec3(1, 2, 3), Vec3(1.05, 2, 2.95), 0.1), True)
+        self.assertEqual(eq3(Vec3(1, 2, 3), Vec3(1.05, 2, 2.85), 0.1), False)
+        self.assertEqual(eq3(Vec3(0, 0, 0), Vec3(1e-12, 0, 0), 1e-9), True)
+
+    def test_key3(self):
+        self.assertEqual(key3(Vec3(0.05, -0.05, 1.23), 0.1), (0, -1, 12))
+        self.assertEqual(key3(Vec3(1.01, 2.02, 3.03), 0.1), key3(Vec3(1.02, 2.03, 3.04), 0.1))
@@ -0,0 +1,166 @@
+import unittest
+import math
+import numpy as np
+# pylint: disable=W0401,W0614
+from geometry.vec3array import *
+from geometry.vec3 import Vec3
+from geometry.vec3 import (
+    eq3, dot3, len3, is_zero3, is_unit3, mul3, neg3, pos3, norm3, add3, sub3, cross3,
+    angle3, orthogonal3, collinear3, rotate3, project3, key3,
+)
+
+A = [Vec3(1, 2, 3), Vec3(0, 0, 0), Vec3(-1, 4, 2), Vec3(1, 2, 3)]
+B = [Vec3(2, 3, 4), Vec3(1, 0, 0), Vec3(3, 1, -2), Vec3(-2, -4, -6)]
+
+class TestVec3Array(unittest.TestCase):
+    def assert_vectors(self, actual, expected):
+        self.assertEqual(len(actual), len(expected))
+        for item, other in zip(actual, expected):
+            self.assertEqual(item, other)
+
+    def test_conversion(self):
+        arr = Vec3Array(A)
+        self.assertEqual(len(arr), 4)
+        self.assertEqual(arr.data.shape, (4, 3))
+        self.assertEqual(arr.data.dtype, np.float64)
+        self.assertEqual(arr[2], Vec3(-1, 4, 2))
+        self.assertEqual(arr.to_list(), A)
+        self.assertEqual(arr[1:3], Vec3Array(A[1:3]))
+        self.assertEqual(len(Vec3Array()), 0)
+        with self.assertRaises(ValueError):
+            Vec3Array([1, 2])
+
+    def test_float32(self):
+        arr = Vec3Array(A, np.float32)
+        self.assertEqual(arr.data.dtype, np.float32)
+        self.assertEqual(arr.data.nbytes, 4 * 12)
+        self.assertEqual(Vec3Array(arr.data).data.dtype, np.float32)
+        self.assertEqual(arr.astype(np.float64).data.dtype, np.float64)
+        self.assertEqual(Vec3Array(np.arange(6).reshape(2, 3)).data.dtype, np.float64)
+        with self.assertRaises(ValueError):
+            Vec3Array(A, np.int32)
+        for result in (
+            add3_array(arr, arr), sub3_array(arr, arr), cross3_array(arr, arr),
+            norm3_array(arr), neg3_array(arr), mul3_array(arr, 2.5),
+            rotate3_array(arr, arr, np.float32(0.5)),
+        ):
+            self.assertEqual(result.data.dtype, np.float32)
+        self.assertEqual(dot3_array(arr, arr).dtype, np.float32)
+        self.assertEqual(add3_array(arr, Vec3(1, 2, 3)).data.dtype, np.float64)
+
+    def test_float32_tolerances(self):
+        a = Vec3Array([[1, 2, 3]])
+        b = Vec3Array([[1, 2, 3 + 1e-6]])
+        self.assertFalse(eq3_array(a, b)[0])
+        self.assertTrue(eq3_array(a.astype(np.float32), b.astype(np.float32))[0])
+        self.assertTrue(eq3_array(
+            Vec3Array([[1e3, 0, 0]], np.float32), Vec3Array([[1e3 + 5e-3, 0, 0]], np.float32),
+        )[0])
+        direction = Vec3Array([[0.1, 0.2, 0.3]], np.float32)
+        self.assertTrue(collinear3_array(direction, mul3_array(direction, 3))[0])
+        self.assertFalse(collinear3_array(direction, Vec3Array([[0.1, 0.2, 0.31]], np.float32))[0])
+        self.assertTrue(is_zero3_array(Vec3Array([[0, 0, 0]], np.float32))[0])
+        self.assertTrue(is_zero3_array(Vec3Array([[1e-7, 0, -1e-7]], np.float32))[0])
+        self.assertFalse(is_zero3_array(Vec3Array([[1e-5, 0, 0]], np.float32))[0])
+
+    def test_float64_near_zero(self):
+        # Float64 zero tests are exact, as in scalar functions, so results agree on any input.
+        rng = np.random.default_rng(2)
+        a = [Vec3(1, 0, 0), Vec3(1e-17, 0, 0)] + [
+            Vec3(*row) for row in rng.uniform(-10, 10, (200, 3))]
+        (factors, noise) = (rng.uniform(-5, 5, 200), rng.uniform(-1e-12, 1e-12, (200, 3)))
+        b = [Vec3(1, 1e-12, 0), Vec3(0, 0, 0)] + [
+            add3(mul3(v, k), Vec3(*row)) for (v, k, row) in zip(a[2:], factors, noise)
+        ]
+        for (array_func, func) in (
+            (collinear3_array, collinear3), (orthogonal3_array, orthogonal3),
+        ):
+            self.assertEqual(
+                array_func(Vec3Array(a), Vec3Array(b)).tolist(),
+                [func(x, y) for (x, y) in zip(a, b)],
+            )
+        self.assertEqual(
+            is_zero3_array(Vec3Array(a + b)).tolist(), [is_zero3(v) for v in a + b])
+        self.assertFalse(is_zero3_array(Vec3Array([Vec3(1e-17, 0, 0)]))[0])
+        self.assertFalse(collinear3_array(Vec3(1, 0, 0), Vec3(1, 1e-12, 0))[0])
+
+    def test_float32_near_zero(self):
+        # Rounding of float32 products leaves cross and dot products of such rows nonzero.
+        rng = np.random.default_rng(1)
+        a = Vec3Array(rng.uniform(-10, 10, (1000, 3)), np.float32)
+        b = Vec3Array(rng.uniform(-10, 10, (1000, 3)), np.float32)
+        for k in (0.1, -7.3, 1e3):
+            self.assertTrue(np.all(collinear3_array(a, mul3_array(a, np.float32(k)))))
+        self.assertTrue(np.all(orthogonal3_array(a, cross3_array(a, b))))
+        self.assertFalse(np.any(collinear3_array(a, b)))
+        self.assertFalse(np.any(orthogonal3_array(a, b)))
+
+    def test_eq(self):
+        self.assertEqual(Vec3Array(A), Vec3Array(A))
+        self.assertNotEqual(Vec3Array(A), Vec3Array(B))
+        self.assertNotEqual(Vec3Array(A), Vec3Array(A[:2]))
+        self.assertNotEqual(Vec3Array(A), A)
+
+    def test_binary_functions(self):
+        for func, scalar in [
+            (eq3_array, eq3), (dot3_array, dot3),
+            (orthogonal3_array, orthogonal3), (collinear3_array, collinear3),
+        ]:
+            result = func(Vec3Array(A), Vec3Array(B))
+            self.assertEqual(result.tolist(), [scalar(a, b) for a, b in zip(A, B)])
+        for func, scalar in [
+            (add3_array, add3), (sub3_array, sub3), (cross3_array, cross3),
+            (project3_array, project3),
+        ]:
+            self.assert_vectors(
+                func(Vec3Array(A), Vec3Array(B)),
+                [scalar(a, b) for a, b in zip(A, B)],
+            )
+
+    def test_unary_functions(self):
+        for func, scalar in [
+            (len3_array, len3), (is_zero3_array, is_zero3), (is_unit3_array, is_unit3),
+        ]:
+            self.assertEqual(func(Vec3Array(A)).tolist(), [scalar(a) for a in A])
+        for func, scalar in [(neg3_array, neg3), (pos3_array, pos3), (norm3_array, norm3)]:
+            self.assert_vectors(func(Vec3Array(A)), [scalar(a) for a in A])
+
+    def test_angle3_array(self):
+        a = [Vec3(1, 2, 3), Vec3(1, 0, 0)]
+        b = [Vec3(2, 3, 4), Vec3(0, 1, 0)]
+        np.testing.assert_allclose(
+            angle3_array(Vec3Array(a), Vec3Array(b)),
+            [angle3(x, y) for x, y in zip(a, b)],
+        )
+
+    def test_mul3_array(self):
+        self.assert_vectors(mul3_array(Vec3Array(A), 2), [mul3(a, 2) for a in A])
+        self.assert_vectors(
+            mul3_array(Vec3Array(A), np.array([1, 2, 3, 4])),
+            [mul3(a, k) for a, k in zip(A, [1, 2, 3, 4])],
+        )
+
+    def test_broadcast(self):
+        one = Vec3(1, 1, 1)
+        self.assert_vectors(add3_array(Vec3Array(A), one), [add3(a, one) for a in A])
+        self.assert_vectors(sub3_array(one, Vec3Array(A)), [sub3(one, a) for a in A])
+        self.assertEqual(dot3_array(Vec3(1, 2, 3), Vec3(2, 3, 4)).tolist(), [20])
+
+    def test_rotate3_array(self):
+        axes = [Vec3(2, 0, 0), Vec3(0, 3, 0), Vec3(0, 0, 4), Vec3(1, 1, 1)]
+        self.assert_vectors(
+            rotate3_array(Vec3(1, 2, 3), Vec3Array(axes), math.pi / 2),
+            [rotate3(Vec3(1, 2, 3), axis, math.pi / 2) for axis in axes],
+        )
+        angles = [0.1, 0.5, 1, 2]
+        self.assert_vectors(
+            rotate3_array(Vec3Array(A), Vec3(1, 2, 0), np.array(angles)),
+            [rotate3(a, Vec3(1, 2, 0), angle) for a, angle in zip(A, angles)],
+        )
+
+    def test_key3_array(self):
+        points = [Vec3(0.05, -0.05, 1.23), Vec3(1.01, 2.02, 3.03)]
+        self.assertEqual(
+            key3_array(Vec3Array(points), 0.1).tolist(),
+            [list(key3(point, 0.1)) for point in points],
+        )